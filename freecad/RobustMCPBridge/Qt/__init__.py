@@ -3,12 +3,38 @@
 This module contains Qt-based user interface components:
 - status_widget: Status bar widget showing bridge connection state
 - preferences_page: Preferences dialog for configuring the bridge
+
+The components are imported on first attribute access, so importing this
+package (e.g. for ``Qt.status_widget`` alone) doesn't load every widget module.
 """
 
-from .preferences_page import MCPBridgePreferencesPage
-from .status_widget import MCPStatusWidget
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .preferences_page import MCPBridgePreferencesPage
+    from .status_widget import MCPStatusWidget
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "MCPBridgePreferencesPage": "preferences_page",
+    "MCPStatusWidget": "status_widget",
+}
 
 __all__ = [
     "MCPBridgePreferencesPage",
     "MCPStatusWidget",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a UI component from its submodule on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    value = getattr(module, name)
+    setattr(sys.modules[__name__], name, value)
+    return value
@@ -12,8 +12,33 @@ the actual preference storage. This module only handles the UI.
 
 from __future__ import annotations
 
+import functools
+
 from PySide import QtCore, QtWidgets  # type: ignore[import-not-found]
 
+# Environment variables used to configure the external MCP server
+_ENV_VARS: tuple[tuple[str, str], ...] = (
+    ("FREECAD_XMLRPC_PORT", "XML-RPC port (default: 9875)"),
+    ("FREECAD_SOCKET_PORT", "JSON-RPC socket port (default: 9876)"),
+    ("FREECAD_MODE", "Connection mode: xmlrpc, socket, or embedded"),
+    ("FREECAD_SOCKET_HOST", "Server hostname (default: localhost)"),
+)
+
+
+@functools.cache
+def _env_vars_html() -> str:
+    """Render _ENV_VARS as an HTML table for a single rich-text QLabel.
+
+    The table is built once and reused each time the page is created,
+    instead of creating a pair of labels per variable.
+    """
+    rows = "".join(
+        f'<tr><td align="right"><code>{var_name}</code></td>'
+        f"<td>&nbsp;{description}</td></tr>"
+        for var_name, description in _ENV_VARS
+    )
+    return f"<table>{rows}</table>"
+
 
 class MCPBridgePreferencesPage(QtWidgets.QWidget):
     """Preferences page for FreeCAD's Preferences dialog.
@@ -121,24 +146,10 @@ class MCPBridgePreferencesPage(QtWidgets.QWidget):
 
         server_layout.addSpacing(5)
 
-        # Environment variables as a form layout for better alignment
-        env_layout = QtWidgets.QFormLayout()
-        env_layout.setLabelAlignment(QtCore.Qt.AlignRight)
-
-        env_vars = [
-            ("FREECAD_XMLRPC_PORT", "XML-RPC port (default: 9875)"),
-            ("FREECAD_SOCKET_PORT", "JSON-RPC socket port (default: 9876)"),
-            ("FREECAD_MODE", "Connection mode: xmlrpc, socket, or embedded"),
-            ("FREECAD_SOCKET_HOST", "Server hostname (default: localhost)"),
-        ]
-
-        for var_name, description in env_vars:
-            var_label = QtWidgets.QLabel(f"<code>{var_name}</code>")
-            var_label.setTextFormat(QtCore.Qt.RichText)
-            desc_label = QtWidgets.QLabel(description)
-            env_layout.addRow(var_label, desc_label)
-
-        server_layout.addLayout(env_layout)
+        # Environment variables, rendered once as a single rich-text table
+        env_label = QtWidgets.QLabel(_env_vars_html())
+        env_label.setTextFormat(QtCore.Qt.RichText)
+        server_layout.addWidget(env_label)
 
         server_layout.addSpacing(5)
 
@@ -179,27 +190,33 @@ class MCPBridgePreferencesPage(QtWidgets.QWidget):
         from preferences import (
             get_socket_port,
             get_xmlrpc_port,
+            invalidate_cache,
             set_auto_start,
             set_socket_port,
             set_status_bar_enabled,
             set_xmlrpc_port,
         )
 
+        # Compare against the stored values, not possibly stale cached
+        # ones (parameters can also be edited outside this page)
+        invalidate_cache()
+
+        new_xmlrpc = self.xmlrpc_spin.value()
+        new_socket = self.socket_spin.value()
+
         # Track if ports changed for potential restart
-        old_xmlrpc = get_xmlrpc_port()
-        old_socket = get_socket_port()
+        ports_changed = (
+            get_xmlrpc_port() != new_xmlrpc or get_socket_port() != new_socket
+        )
 
         # Save all preferences
         set_auto_start(self.auto_start_cb.isChecked())
         set_status_bar_enabled(self.status_bar_cb.isChecked())
-        set_xmlrpc_port(self.xmlrpc_spin.value())
-        set_socket_port(self.socket_spin.value())
-
-        # Check if ports changed and notify about restart if needed
-        new_xmlrpc = self.xmlrpc_spin.value()
-        new_socket = self.socket_spin.value()
+        set_xmlrpc_port(new_xmlrpc)
+        set_socket_port(new_socket)
 
-        if old_xmlrpc != new_xmlrpc or old_socket != new_socket:
+        # Notify about restart if needed
+        if ports_changed:
             # Import FreeCAD here to avoid issues at module load time
             import FreeCAD
 
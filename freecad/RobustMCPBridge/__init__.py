@@ -13,6 +13,8 @@ must run on the main thread.
 
 from __future__ import annotations
 
+import traceback
+
 # Import FreeCAD first so we can log early
 import FreeCAD
 
@@ -49,9 +51,10 @@ def _auto_start_bridge() -> None:
             FreeCAD.Console.PrintError with full traceback, and suppressed.
 
     Side Effects:
-        - Imports and checks auto-start preference from preferences module
-        - Creates and starts a FreecadMCPPlugin instance if not already running
-        - Registers the plugin with the workbench commands module
+        - Calls bridge_utils.ensure_bridge_started(), which checks the
+          auto-start preference, creates and starts a FreecadMCPPlugin
+          instance if not already running, and registers it with the
+          workbench commands module
         - Prints status messages to FreeCAD.Console
 
     Example:
@@ -60,55 +63,11 @@ def _auto_start_bridge() -> None:
             QtCore.QTimer.singleShot(1000, _auto_start_bridge)
     """
     try:
-        from preferences import get_auto_start
-
-        if not get_auto_start():
-            return
-
-        # Check if bridge is already running
-        from commands import _mcp_plugin
-
-        if _mcp_plugin is not None and _mcp_plugin.is_running:
-            return
-
-        FreeCAD.Console.PrintMessage(
-            "Auto-starting MCP Bridge (configured in preferences)...\n"
-        )
-
-        # Import and start the bridge directly
-        from freecad_mcp_bridge.server import FreecadMCPPlugin
-        from preferences import get_socket_port, get_xmlrpc_port
-
-        xmlrpc_port = get_xmlrpc_port()
-        socket_port = get_socket_port()
-
-        plugin = FreecadMCPPlugin(
-            host="localhost",
-            port=socket_port,
-            xmlrpc_port=xmlrpc_port,
-            enable_xmlrpc=True,
-        )
-        plugin.start()
-
-        # Register plugin with commands module for restart detection
-        from freecad_mcp_bridge.bridge_utils import register_mcp_plugin
-
-        register_mcp_plugin(plugin, xmlrpc_port, socket_port)
-
-        FreeCAD.Console.PrintMessage("\n")
-        FreeCAD.Console.PrintMessage("=" * 50 + "\n")
-        FreeCAD.Console.PrintMessage("MCP Bridge started!\n")
-        FreeCAD.Console.PrintMessage(f"  - XML-RPC: localhost:{xmlrpc_port}\n")
-        FreeCAD.Console.PrintMessage(f"  - Socket:  localhost:{socket_port}\n")
-        FreeCAD.Console.PrintMessage("=" * 50 + "\n")
-        FreeCAD.Console.PrintMessage(
-            "\nYou can now connect your MCP client (Claude Code, etc.) to FreeCAD.\n"
-        )
+        from freecad_mcp_bridge.bridge_utils import ensure_bridge_started
 
+        ensure_bridge_started()
     except Exception as e:
         FreeCAD.Console.PrintError(f"Failed to auto-start MCP Bridge: {e}\n")
-        import traceback
-
         FreeCAD.Console.PrintError(f"Traceback: {traceback.format_exc()}\n")
 
 
@@ -131,56 +90,39 @@ def _auto_start_bridge() -> None:
 try:
     import os
 
-    from preferences import get_auto_start
+    from freecad_mcp_bridge.bridge_utils import auto_start_disabled_by_env
 
-    # In testing mode, skip auto-start so the test controls bridge lifecycle
-    # via startup_bridge.py (same guard as in init_gui.py).
-    if os.environ.get("FREECAD_MCP_TESTING"):
+    # FREECAD_MCP_AUTOSTART=0 turns auto-start off without even loading the
+    # preferences module. In testing mode, skip auto-start so the test
+    # controls bridge lifecycle via startup_bridge.py (same guards as in
+    # init_gui.py).
+    if auto_start_disabled_by_env():
+        _autoStartEnabled = False
+        FreeCAD.Console.PrintMessage(
+            "Robust MCP Bridge: Auto-start skipped (FREECAD_MCP_AUTOSTART set)\n"
+        )
+    elif os.environ.get("FREECAD_MCP_TESTING"):
         _autoStartEnabled = False
         FreeCAD.Console.PrintMessage(
             "Robust MCP Bridge: Auto-start skipped (FREECAD_MCP_TESTING set)\n"
         )
     else:
+        from preferences import get_auto_start
+
         _autoStartEnabled = get_auto_start()
     FreeCAD.Console.PrintMessage(
         f"Robust MCP Bridge: Auto-start preference = {_autoStartEnabled}\n"
     )
 
     if _autoStartEnabled:
-        # Try to import Qt and check for running QApplication
-        import contextlib
-
-        QtCore = None
-        QtWidgets = None
-        _has_qapp = False
-        _is_true_headless = False
-
-        try:
-            from PySide2 import QtCore, QtWidgets  # type: ignore[assignment, no-redef]
-        except ImportError:
-            with contextlib.suppress(ImportError):
-                from PySide6 import (  # type: ignore[assignment, no-redef]
-                    QtCore,
-                    QtWidgets,
-                )
-
-        # Detect GUI mode vs true headless mode
-        # - True headless (freecadcmd): QCoreApplication exists but NOT QApplication
-        # - GUI mode early startup: No app yet, or QApplication being initialized
-        # - GUI mode ready: FreeCAD.GuiUp is True
-        if QtWidgets is not None and QtCore is not None:
-            qapp = QtWidgets.QApplication.instance()
-            if qapp is not None:
-                _has_qapp = True
-            else:
-                # No QApplication - check if QCoreApplication exists
-                # If QCoreApplication exists but is NOT a QApplication, it's true headless
-                qcore_app = QtCore.QCoreApplication.instance()
-                if qcore_app is not None and not isinstance(
-                    qcore_app, QtWidgets.QApplication
-                ):
-                    _is_true_headless = True
-                # If no app at all, assume early GUI startup (will use GuiWaiter)
+        # Import Qt and check for a running QApplication vs a bare
+        # QCoreApplication (true headless)
+        from freecad_mcp_bridge.bridge_utils import detect_qt_mode
+
+        _qt = detect_qt_mode()
+        QtCore = _qt.qtcore
+        _has_qapp = _qt.has_qapp
+        _is_true_headless = _qt.is_true_headless
 
         FreeCAD.Console.PrintMessage(
             f"Robust MCP Bridge: GuiUp={FreeCAD.GuiUp}, "
@@ -236,6 +178,4 @@ try:
             _auto_start_bridge()
 except Exception as e:
     FreeCAD.Console.PrintWarning(f"Could not set up auto-start: {e}\n")
-    import traceback
-
     FreeCAD.Console.PrintWarning(f"Traceback: {traceback.format_exc()}\n")
@@ -9,13 +9,18 @@ checking the status of the MCP bridge server.
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 import FreeCAD
 from path_utils import get_addon_path, get_icon_path
 
 # FreeCADGui is imported lazily in methods that need it, as this module
-# may be imported during headless operation where FreeCADGui is not available
+# may be imported during headless operation where FreeCADGui is not available.
+# The same goes for the bridge server, preferences and Qt widget modules:
+# importing this module (done when the workbench registers its commands) only
+# loads FreeCAD and path_utils, and each command pulls in what it needs the
+# first time it is activated.
 
 # Re-export for any modules that might import from commands
 __all__ = ["get_addon_path", "get_icon_path"]
@@ -26,6 +31,16 @@ _mcp_plugin: Any = None
 # Track current running configuration for restart detection
 _running_config: dict[str, int] | None = None
 
+# Separator line used by the console banners below
+_SEP = "=" * 50 + "\n"
+
+# Command tooltips, interned once at import and shared by the cached
+# GetResources() dicts. The start tooltip's port line is appended per port pair.
+_TT_START = sys.intern("Start the MCP bridge server for AI assistant integration.\n")
+_TT_STOP = sys.intern("Stop the running MCP bridge server.")
+_TT_STATUS = sys.intern("Show the current status of the MCP bridge server.")
+_TT_PREFS = sys.intern("Configure MCP Bridge settings (ports, auto-start, etc.)")
+
 
 def is_bridge_running() -> bool:
     """Check if the MCP bridge is currently running.
@@ -41,6 +56,11 @@ def is_bridge_running() -> bool:
 class StartMCPBridgeCommand:
     """Command to start the MCP bridge server."""
 
+    # Resources are shared by all instances and only rebuilt when the
+    # configured ports shown in the tooltip change
+    _resources: dict[str, str] | None = None
+    _resources_ports: tuple[int, int] | None = None
+
     def GetResources(self) -> dict[str, str]:
         """Return the command resources (icon, menu text, tooltip)."""
         # Get configured ports for tooltip (fall back to defaults if import fails)
@@ -53,18 +73,22 @@ class StartMCPBridgeCommand:
             xmlrpc_port = 9875
             socket_port = 9876
 
-        return {
-            "Pixmap": get_icon_path("Resources/Icons/mcp_start.svg"),
-            "MenuText": "Start MCP Bridge",
-            "ToolTip": (
-                "Start the MCP bridge server for AI assistant integration.\n"
-                f"Listens on XML-RPC (port {xmlrpc_port}) and Socket (port {socket_port})."
-            ),
-        }
+        cls = type(self)
+        if cls._resources is None or cls._resources_ports != (xmlrpc_port, socket_port):
+            cls._resources = {
+                "Pixmap": get_icon_path("Resources/Icons/mcp_start.svg"),
+                "MenuText": "Start MCP Bridge",
+                "ToolTip": (
+                    f"{_TT_START}Listens on XML-RPC (port {xmlrpc_port}) "
+                    f"and Socket (port {socket_port})."
+                ),
+            }
+            cls._resources_ports = (xmlrpc_port, socket_port)
+        return cls._resources
 
     def IsActive(self) -> bool:
         """Return True if the command can be executed."""
-        return _mcp_plugin is None or not _mcp_plugin.is_running
+        return not is_bridge_running()
 
     def Activated(self) -> None:
         """Execute the command to start the MCP bridge."""
@@ -75,7 +99,7 @@ class StartMCPBridgeCommand:
             return
 
         try:
-            from freecad_mcp_bridge.server import FreecadMCPPlugin
+            from freecad_mcp_bridge import FreecadMCPPlugin
             from preferences import (
                 get_socket_port,
                 get_status_bar_enabled,
@@ -117,13 +141,12 @@ class StartMCPBridgeCommand:
                     xmlrpc_port, socket_port, _mcp_plugin.request_count
                 )
 
-            FreeCAD.Console.PrintMessage("\n")
-            FreeCAD.Console.PrintMessage("=" * 50 + "\n")
-            FreeCAD.Console.PrintMessage("MCP Bridge started!\n")
-            FreeCAD.Console.PrintMessage(f"  - XML-RPC: localhost:{xmlrpc_port}\n")
-            FreeCAD.Console.PrintMessage(f"  - Socket:  localhost:{socket_port}\n")
-            FreeCAD.Console.PrintMessage("=" * 50 + "\n")
             FreeCAD.Console.PrintMessage(
+                f"\n{_SEP}"
+                "MCP Bridge started!\n"
+                f"  - XML-RPC: localhost:{xmlrpc_port}\n"
+                f"  - Socket:  localhost:{socket_port}\n"
+                f"{_SEP}"
                 "\nYou can now connect your MCP client (Claude Code, etc.) to FreeCAD.\n"
             )
 
@@ -161,17 +184,22 @@ class StartMCPBridgeCommand:
 class StopMCPBridgeCommand:
     """Command to stop the MCP bridge server."""
 
+    _resources: dict[str, str] | None = None
+
     def GetResources(self) -> dict[str, str]:
         """Return the command resources (icon, menu text, tooltip)."""
-        return {
-            "Pixmap": get_icon_path("Resources/Icons/mcp_stop.svg"),
-            "MenuText": "Stop MCP Bridge",
-            "ToolTip": "Stop the running MCP bridge server.",
-        }
+        cls = type(self)
+        if cls._resources is None:
+            cls._resources = {
+                "Pixmap": get_icon_path("Resources/Icons/mcp_stop.svg"),
+                "MenuText": "Stop MCP Bridge",
+                "ToolTip": _TT_STOP,
+            }
+        return cls._resources
 
     def IsActive(self) -> bool:
         """Return True if the command can be executed."""
-        return _mcp_plugin is not None and _mcp_plugin.is_running
+        return is_bridge_running()
 
     def Activated(self) -> None:
         """Execute the command to stop the MCP bridge."""
@@ -196,10 +224,7 @@ class StopMCPBridgeCommand:
             except Exception:
                 pass
 
-            FreeCAD.Console.PrintMessage("\n")
-            FreeCAD.Console.PrintMessage("=" * 50 + "\n")
-            FreeCAD.Console.PrintMessage("MCP Bridge stopped.\n")
-            FreeCAD.Console.PrintMessage("=" * 50 + "\n")
+            FreeCAD.Console.PrintMessage(f"\n{_SEP}MCP Bridge stopped.\n{_SEP}")
 
         except Exception as e:
             FreeCAD.Console.PrintError(f"Failed to stop MCP Bridge: {e}\n")
@@ -208,13 +233,18 @@ class StopMCPBridgeCommand:
 class MCPBridgeStatusCommand:
     """Command to show MCP bridge status."""
 
+    _resources: dict[str, str] | None = None
+
     def GetResources(self) -> dict[str, str]:
         """Return the command resources (icon, menu text, tooltip)."""
-        return {
-            "Pixmap": get_icon_path("Resources/Icons/mcp_status.svg"),
-            "MenuText": "MCP Bridge Status",
-            "ToolTip": "Show the current status of the MCP bridge server.",
-        }
+        cls = type(self)
+        if cls._resources is None:
+            cls._resources = {
+                "Pixmap": get_icon_path("Resources/Icons/mcp_status.svg"),
+                "MenuText": "MCP Bridge Status",
+                "ToolTip": _TT_STATUS,
+            }
+        return cls._resources
 
     def IsActive(self) -> bool:
         """Return True if the command can be executed."""
@@ -222,25 +252,20 @@ class MCPBridgeStatusCommand:
 
     def Activated(self) -> None:
         """Execute the command to show MCP bridge status."""
-        FreeCAD.Console.PrintMessage("\n")
-        FreeCAD.Console.PrintMessage("=" * 50 + "\n")
-        FreeCAD.Console.PrintMessage("MCP Bridge Status\n")
-        FreeCAD.Console.PrintMessage("=" * 50 + "\n")
-
         if _mcp_plugin is None:
-            FreeCAD.Console.PrintMessage("Status: Not initialized\n")
+            status = "Status: Not initialized\n"
         elif not _mcp_plugin.is_running:
-            FreeCAD.Console.PrintMessage("Status: Stopped\n")
+            status = "Status: Stopped\n"
         else:
-            FreeCAD.Console.PrintMessage("Status: Running\n")
-            FreeCAD.Console.PrintMessage(f"  Instance ID: {_mcp_plugin.instance_id}\n")
-            FreeCAD.Console.PrintMessage(f"  XML-RPC Port: {_mcp_plugin.xmlrpc_port}\n")
-            FreeCAD.Console.PrintMessage(f"  Socket Port: {_mcp_plugin.socket_port}\n")
-            FreeCAD.Console.PrintMessage(
+            status = (
+                "Status: Running\n"
+                f"  Instance ID: {_mcp_plugin.instance_id}\n"
+                f"  XML-RPC Port: {_mcp_plugin.xmlrpc_port}\n"
+                f"  Socket Port: {_mcp_plugin.socket_port}\n"
                 f"  Requests processed: {_mcp_plugin.request_count}\n"
             )
 
-        FreeCAD.Console.PrintMessage("=" * 50 + "\n")
+        FreeCAD.Console.PrintMessage(f"\n{_SEP}MCP Bridge Status\n{_SEP}{status}{_SEP}")
 
 
 def restart_bridge_if_running() -> bool:
@@ -285,7 +310,7 @@ def restart_bridge_if_running() -> bool:
 
     # Start with new configuration
     try:
-        from freecad_mcp_bridge.server import FreecadMCPPlugin
+        from freecad_mcp_bridge import FreecadMCPPlugin
         from preferences import get_socket_port, get_status_bar_enabled, get_xmlrpc_port
         from Qt.status_widget import update_status_running
 
@@ -330,15 +355,20 @@ def restart_bridge_if_running() -> bool:
 class MCPBridgePreferencesCommand:
     """Command to open MCP bridge preferences dialog."""
 
+    _resources: dict[str, str] | None = None
+
     def GetResources(self) -> dict[str, str]:
         """Return the command resources (icon, menu text, tooltip)."""
-        return {
-            "Pixmap": get_icon_path(
-                "Resources/Icons/preferences-robust_mcp_bridge.svg"
-            ),
-            "MenuText": "MCP Bridge Preferences...",
-            "ToolTip": "Configure MCP Bridge settings (ports, auto-start, etc.)",
-        }
+        cls = type(self)
+        if cls._resources is None:
+            cls._resources = {
+                "Pixmap": get_icon_path(
+                    "Resources/Icons/preferences-robust_mcp_bridge.svg"
+                ),
+                "MenuText": "MCP Bridge Preferences...",
+                "ToolTip": _TT_PREFS,
+            }
+        return cls._resources
 
     def IsActive(self) -> bool:
         """Return True if the command can be executed."""
@@ -7,7 +7,27 @@ This module provides the MCP bridge server that runs inside FreeCAD.
 It is bundled with the workbench addon for self-contained installation.
 """
 
-from .server import FreecadMCPPlugin
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .server import FreecadMCPPlugin
 
 __version__ = "0.6.2"  # Updated by release workflow
 __all__ = ["FreecadMCPPlugin", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import ``FreecadMCPPlugin`` from the server module on first access.
+
+    The server module pulls in the socket, threading and XML-RPC machinery,
+    so it is deferred until a bridge is actually created. Importing
+    ``freecad_mcp_bridge.bridge_utils`` at FreeCAD startup doesn't pay for it.
+    """
+    if name == "FreecadMCPPlugin":
+        from .server import FreecadMCPPlugin
+
+        globals()["FreecadMCPPlugin"] = FreecadMCPPlugin
+        return FreecadMCPPlugin
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,6 +9,12 @@ startup_bridge.py, and Init.py to avoid code duplication.
 
 from __future__ import annotations
 
+import functools
+import importlib
+import importlib.util
+import os
+import time
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -22,13 +28,132 @@ DEFAULT_GUI_CHECK_INTERVAL_MS: int = 100  # How often to check if GUI is ready
 DEFAULT_GUI_DEFER_START_MS: int = 2000  # Delay before starting bridge after GUI ready
 DEFAULT_GUI_WAIT_MAX_RETRIES: int = 600  # Max retries (600 * 100ms = 60s timeout)
 
+# Separator line for the console banners
+_BANNER_SEP = "=" * 50
+
+# Environment variable that disables auto-start regardless of preferences
+AUTOSTART_ENV_VAR = "FREECAD_MCP_AUTOSTART"
+_AUTOSTART_OFF_VALUES = frozenset({"0", "false", "no"})
+
+
+def auto_start_disabled_by_env() -> bool:
+    """Check whether auto-start is switched off via the environment.
+
+    Setting FREECAD_MCP_AUTOSTART to 0, false or no disables auto-start
+    without loading the preferences module at all.
+
+    Returns:
+        True if the environment disables auto-start, False otherwise.
+    """
+    return os.environ.get(AUTOSTART_ENV_VAR, "").lower() in _AUTOSTART_OFF_VALUES
+
+
+@dataclass(frozen=True, slots=True)
+class QtMode:
+    """Qt availability and application state at FreeCAD startup.
+
+    Attributes:
+        qtcore: The PySide QtCore module, or None if PySide is unavailable.
+        qtwidgets: The PySide QtWidgets module, or None if PySide is unavailable.
+        has_qapp: True if a QApplication instance exists.
+        is_true_headless: True if a QCoreApplication exists that is NOT a
+            QApplication (freecadcmd).
+    """
+
+    qtcore: ModuleType | None
+    qtwidgets: ModuleType | None
+    has_qapp: bool
+    is_true_headless: bool
+
+
+# PySide packages in order of preference
+_QT_PACKAGES = ("PySide2", "PySide6")
+
+
+@functools.cache
+def _qt_package() -> str | None:
+    """Find which PySide package is installed, without importing it.
+
+    Probing with find_spec avoids raising and catching an ImportError for
+    PySide2 on every startup of a PySide6-only FreeCAD.
+
+    Returns:
+        "PySide2" if it is installed, otherwise "PySide6" if that is, or
+        None if neither is available.
+    """
+    for name in _QT_PACKAGES:
+        try:
+            if importlib.util.find_spec(name) is not None:
+                return name
+        except (ImportError, ValueError):
+            # ValueError: module already in sys.modules without a __spec__
+            continue
+    return None
+
+
+@functools.cache
+def import_qt() -> tuple[ModuleType | None, ModuleType | None]:
+    """Import QtCore and QtWidgets from the installed PySide package.
+
+    PySide2 is preferred over PySide6. The result is cached so Init.py,
+    InitGui.py, and startup_bridge.py share one lookup.
+
+    Returns:
+        A (QtCore, QtWidgets) tuple, or (None, None) if neither PySide
+        version is available.
+    """
+    package = _qt_package()
+    if package is None:
+        return None, None
+    try:
+        return (
+            importlib.import_module(f"{package}.QtCore"),
+            importlib.import_module(f"{package}.QtWidgets"),
+        )
+    except ImportError:
+        return None, None
+
+
+def detect_qt_mode() -> QtMode:
+    """Detect GUI mode vs true headless mode for starting the bridge.
+
+    - True headless (freecadcmd): QCoreApplication exists but NOT QApplication
+    - GUI mode early startup: No app yet, or QApplication being initialized
+    - GUI mode ready: FreeCAD.GuiUp is True (checked by the caller)
+
+    FreeCAD bundles PySide even in headless mode, so the application
+    instance is checked rather than just whether QtCore imports. The PySide
+    import is cached; the instance checks are cheap and are repeated on each
+    call because the application may be created after the first call.
+
+    Returns:
+        The detected QtMode.
+    """
+    QtCore, QtWidgets = import_qt()
+    has_qapp = False
+    is_true_headless = False
+    if QtWidgets is not None and QtCore is not None:
+        if QtWidgets.QApplication.instance() is not None:
+            has_qapp = True
+        else:
+            # If QCoreApplication exists but is NOT a QApplication, it's true
+            # headless. If no app at all, assume early GUI startup.
+            qcore_app = QtCore.QCoreApplication.instance()
+            if qcore_app is not None and not isinstance(
+                qcore_app, QtWidgets.QApplication
+            ):
+                is_true_headless = True
+    return QtMode(QtCore, QtWidgets, has_qapp, is_true_headless)
+
 
 class GuiWaiter:
     """Helper class to wait for FreeCAD GUI to be ready before starting the bridge.
 
     This class encapsulates the logic for waiting for FreeCAD.GuiUp to become True
-    before invoking a callback. It uses Qt timers to poll the GUI state and defers
-    the callback after the GUI is ready to allow FreeCAD to fully stabilize.
+    before invoking a callback. It checks the GUI state once as soon as the Qt
+    event loop runs, then polls it with a Qt timer (which also enforces the
+    timeout), and defers the callback after the GUI is ready to allow FreeCAD
+    to fully stabilize.
 
     CRITICAL: Starting the MCP bridge before FreeCAD.GuiUp is True causes the bridge
     to use a background thread for queue processing, which leads to crashes when
@@ -42,7 +167,8 @@ class GuiWaiter:
         waiter.start()
 
     The waiter will:
-    1. Poll FreeCAD.GuiUp every check_interval_ms milliseconds
+    1. Check FreeCAD.GuiUp on the first event loop pass, then every
+       check_interval_ms milliseconds
     2. Log progress every 5 seconds
     3. Once GuiUp is True, defer the callback by defer_ms milliseconds
     4. If timeout is reached, log an error without starting (to prevent crashes)
@@ -78,35 +204,38 @@ class GuiWaiter:
         self._check_timer: Any | None = None
         self._defer_timer: Any | None = None
         self._retry_count: int = 0
+        self._started_at: float = 0.0
         self._qtcore: ModuleType | None = None
 
     def start(self) -> None:
         """Start waiting for GUI to be ready.
 
-        This method sets up a repeating timer that checks FreeCAD.GuiUp.
-        The timer reference is stored to prevent garbage collection.
+        This method schedules a single check of FreeCAD.GuiUp for the first
+        pass of the event loop (by which point InitGui has usually finished)
+        and sets up a repeating timer that keeps checking until the GUI is up
+        or the timeout is reached. The timer reference is stored to prevent
+        garbage collection.
         The QtCore module is resolved once and stored for later use.
         """
         import FreeCAD
 
         # Resolve QtCore once and store for later use
-        try:
-            from PySide2 import QtCore  # type: ignore[import]
-        except ImportError:
-            try:
-                from PySide6 import QtCore  # type: ignore[import]
-            except ImportError:
-                FreeCAD.Console.PrintError(
-                    f"{self.log_prefix}: Neither PySide2 nor PySide6 is available. "
-                    "Cannot wait for GUI - Qt is required for timer-based waiting.\n"
-                )
-                return
+        QtCore, _ = import_qt()
+        if QtCore is None:
+            FreeCAD.Console.PrintError(
+                f"{self.log_prefix}: Neither PySide2 nor PySide6 is available. "
+                "Cannot wait for GUI - Qt is required for timer-based waiting.\n"
+            )
+            return
 
         self._qtcore = QtCore
+        self._started_at = time.monotonic()
+
         self._check_timer = QtCore.QTimer()
         self._check_timer.setSingleShot(False)  # Repeating timer
         self._check_timer.timeout.connect(self._check_gui)
         self._check_timer.start(self.check_interval_ms)
+        QtCore.QTimer.singleShot(0, self._check_now)
         FreeCAD.Console.PrintMessage(
             f"{self.log_prefix}: Waiting for GUI to be ready...\n"
         )
@@ -133,16 +262,26 @@ class GuiWaiter:
         elif self._retry_count >= self.max_retries:
             self._on_timeout()
 
-    def _on_gui_ready(self) -> None:
-        """Handle GUI becoming ready."""
+    def _check_now(self) -> None:
+        """Check GUI readiness once, without counting towards the timeout."""
         import FreeCAD
 
-        # Stop the check timer
+        if FreeCAD.GuiUp and self._check_timer is not None:
+            self._on_gui_ready()
+
+    def _stop_waiting(self) -> None:
+        """Stop the check timer."""
         if self._check_timer is not None:
             self._check_timer.stop()
             self._check_timer = None
 
-        elapsed = self._retry_count * (self.check_interval_ms / 1000.0)
+    def _on_gui_ready(self) -> None:
+        """Handle GUI becoming ready."""
+        import FreeCAD
+
+        self._stop_waiting()
+
+        elapsed = time.monotonic() - self._started_at
         FreeCAD.Console.PrintMessage(
             f"{self.log_prefix}: GUI ready after {elapsed:.1f}s, "
             "deferring bridge start...\n"
@@ -168,10 +307,7 @@ class GuiWaiter:
         """Handle timeout - GUI did not become ready in time."""
         import FreeCAD
 
-        # Stop the check timer
-        if self._check_timer is not None:
-            self._check_timer.stop()
-            self._check_timer = None
+        self._stop_waiting()
 
         timeout_seconds = self.max_retries * (self.check_interval_ms / 1000.0)
         FreeCAD.Console.PrintError(
@@ -258,9 +394,9 @@ def get_running_plugin() -> FreecadMCPPlugin | None:
 
             FreeCAD.Console.PrintMessage(
                 "\nMCP Bridge already running (from auto-start).\n"
+                f"  - XML-RPC: localhost:{xmlrpc_port}\n"
+                f"  - Socket: localhost:{socket_port}\n\n"
             )
-            FreeCAD.Console.PrintMessage(f"  - XML-RPC: localhost:{xmlrpc_port}\n")
-            FreeCAD.Console.PrintMessage(f"  - Socket: localhost:{socket_port}\n\n")
             return plugin
     except ImportError:
         # Workbench commands module not available
@@ -270,3 +406,70 @@ def get_running_plugin() -> FreecadMCPPlugin | None:
         FreeCAD.Console.PrintWarning(f"MCP plugin state check failed: {e}\n")
 
     return None
+
+
+def ensure_bridge_started() -> bool:
+    """Start the MCP bridge from the workbench preferences if needed.
+
+    This is the single auto-start path shared by Init.py, InitGui.py's
+    deferred startup callback, and the workbench's Initialize(). It is
+    idempotent: if a bridge is already registered and running, or auto-start
+    is disabled (by FREECAD_MCP_AUTOSTART or the preference), nothing is
+    imported or started.
+
+    Returns:
+        True if a new bridge was started and registered, False otherwise.
+
+    Raises:
+        Exception: Any exception from FreecadMCPPlugin initialization or
+            start() is propagated so callers can log it in their own context.
+    """
+    import FreeCAD
+
+    # Fast path: a bridge is already registered with the commands module
+    try:
+        from commands import is_bridge_running
+
+        if is_bridge_running():
+            return False
+    except ImportError:
+        pass
+
+    if auto_start_disabled_by_env():
+        return False
+
+    from preferences import get_auto_start
+
+    if not get_auto_start():
+        return False
+
+    FreeCAD.Console.PrintMessage(
+        "Auto-starting MCP Bridge (configured in preferences)...\n"
+    )
+
+    from freecad_mcp_bridge import FreecadMCPPlugin
+    from preferences import get_socket_port, get_xmlrpc_port
+
+    xmlrpc_port = get_xmlrpc_port()
+    socket_port = get_socket_port()
+
+    plugin = FreecadMCPPlugin(
+        host="localhost",
+        port=socket_port,
+        xmlrpc_port=xmlrpc_port,
+        enable_xmlrpc=True,
+    )
+    plugin.start()
+
+    # Register plugin with commands module for restart detection
+    register_mcp_plugin(plugin, xmlrpc_port, socket_port)
+
+    FreeCAD.Console.PrintMessage(
+        f"\n{_BANNER_SEP}\n"
+        "MCP Bridge started!\n"
+        f"  - XML-RPC: localhost:{xmlrpc_port}\n"
+        f"  - Socket:  localhost:{socket_port}\n"
+        f"{_BANNER_SEP}\n"
+        "\nYou can now connect your MCP client (Claude Code, etc.) to FreeCAD.\n"
+    )
+    return True
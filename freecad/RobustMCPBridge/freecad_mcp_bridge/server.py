@@ -21,10 +21,11 @@ import asyncio
 import atexit
 import contextlib
 import errno
-import io
+import functools
 import json
 import os
 import queue
+import socketserver
 import sys
 import threading
 import time
@@ -33,7 +34,10 @@ import uuid
 import weakref
 import xmlrpc.server
 from contextlib import redirect_stderr, redirect_stdout
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from types import CodeType
 
 # Global registry of active servers for cleanup on Python exit
 # Uses weak references to avoid preventing garbage collection
@@ -113,12 +117,62 @@ try:
 except ImportError:
     FREECAD_AVAILABLE = False
 
+# Globals every executed snippet starts from; copied per execution so
+# snippets cannot leak names into each other
+_BASE_EXEC_GLOBALS: dict[str, Any] = {"__builtins__": __builtins__}
+if FREECAD_AVAILABLE:
+    _BASE_EXEC_GLOBALS.update(
+        FreeCAD=FreeCAD, App=FreeCAD, FreeCADGui=FreeCADGui, Gui=FreeCADGui
+    )
+
 # Default configuration
 DEFAULT_SOCKET_PORT = 9876
 DEFAULT_XMLRPC_PORT = 9875
 QUEUE_POLL_INTERVAL_MS = 50
 STATUS_UPDATE_INTERVAL_MS = 5000  # Update status bar every 5 seconds
 HEADLESS_POLL_INTERVAL_S = 0.1  # Headless mode poll interval in seconds
+# Longest a queued request waits for the main thread to start it. One not
+# started by then is dropped and answered with a TimeoutError, never run.
+# The socket bridge's PLUGIN_QUEUE_WAIT_S must match.
+QUEUE_WAIT_TIMEOUT_S = 300
+# Largest socket message buffered per client. The 64 KiB asyncio default
+# is too small for large scripts and makes readline() fail on them.
+SOCKET_STREAM_LIMIT = 64 * 1024 * 1024
+# Seconds an idle keep-alive XML-RPC connection is held open by the server
+XMLRPC_KEEPALIVE_TIMEOUT_S = 30
+# Maximum number of compiled code objects kept by _compile_code()
+CODE_CACHE_SIZE = 256
+# Longest source _compile_code() caches
+CODE_CACHE_MAX_SOURCE = 8192
+
+# Compact JSON encoder for socket responses (no padding after separators;
+# built once rather than per json.dumps() call)
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+@functools.lru_cache(maxsize=CODE_CACHE_SIZE)
+def _compile_cached(code: str) -> CodeType:
+    """Compile code through the LRU cache."""
+    return compile(code, "<mcp>", "exec")
+
+
+def _compile_code(code: str) -> CodeType:
+    """Compile a snippet for exec(), reusing the result for repeated source.
+
+    MCP clients resend the same generated snippets over and over, so code
+    objects are kept in a small LRU keyed by the source string. Compile
+    errors are not cached, and neither is source longer than
+    ``CODE_CACHE_MAX_SOURCE``, which is usually a one-off script.
+
+    Args:
+        code: Python source to compile.
+
+    Returns:
+        The compiled code object.
+    """
+    if len(code) > CODE_CACHE_MAX_SOURCE:
+        return compile(code, "<mcp>", "exec")
+    return _compile_cached(code)
 
 
 def _get_qt_core() -> Any:
@@ -147,8 +201,39 @@ def _get_qt_core() -> Any:
     return None
 
 
+class _OutputSink:
+    """Write-only text stream collecting the output of executed code.
+
+    Appending to a list is all redirect_stdout() needs, without the
+    buffer management of io.StringIO.
+    """
+
+    __slots__ = ("_parts",)
+
+    def __init__(self) -> None:
+        """Initialize an empty sink."""
+        self._parts: list[str] = []
+
+    def write(self, text: str) -> int:
+        """Collect text and return its length, like a text stream."""
+        self._parts.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        """Do nothing, since nothing is buffered."""
+
+    def getvalue(self) -> str:
+        """Return everything written so far."""
+        return "".join(self._parts)
+
+
 class ExecutionRequest:
-    """Represents a code execution request."""
+    """Represents a code execution request.
+
+    A request is either started by the main thread or cancelled by the
+    thread waiting on it, never both; start() and cancel() decide which
+    under a lock.
+    """
 
     def __init__(
         self,
@@ -167,7 +252,34 @@ class ExecutionRequest:
         self.timeout_ms = timeout_ms
         self.request_id = request_id
         self.result: dict[str, Any] | None = None
+        self.started = threading.Event()
         self.completed = threading.Event()
+        self._cancelled = False
+        self._lock = threading.Lock()
+
+    def start(self) -> bool:
+        """Mark the request as started, unless it was cancelled.
+
+        Returns:
+            True if the request should be run.
+        """
+        with self._lock:
+            if self._cancelled:
+                return False
+            self.started.set()
+            return True
+
+    def cancel(self) -> bool:
+        """Cancel the request, unless it has already started.
+
+        Returns:
+            True if the request will not be run.
+        """
+        with self._lock:
+            if self.started.is_set():
+                return False
+            self._cancelled = True
+            return True
 
 
 class FreecadMCPPlugin:
@@ -655,7 +767,7 @@ class FreecadMCPPlugin:
         touched from the thread that owns them.
 
         In headless mode (``FreeCAD.GuiUp`` is False, or Qt is unavailable)
-        a daemon background thread polls the queue instead.  No QTimer is
+        a daemon background thread blocks on the queue instead.  No QTimer is
         created, so no timer cleanup is needed at shutdown.
 
         Note: The timer created here is destroyed during shutdown by
@@ -700,30 +812,55 @@ class FreecadMCPPlugin:
             )
 
     def _run_queue_processor_loop(self) -> None:
-        """Run queue processor in a loop for headless mode."""
+        """Run queue processor in a loop for headless mode.
+
+        Blocks on the queue rather than sleeping between polls, so a request
+        starts as soon as it is queued; anything queued meanwhile is drained
+        in the same pass. The timeout only bounds how long ``stop()`` waits
+        for this thread to notice ``_running`` going False.
+        """
         while self._running:
+            try:
+                request = self._request_queue.get(
+                    timeout=QUEUE_POLL_INTERVAL_MS / 1000.0
+                )
+            except queue.Empty:
+                continue
+            self._run_request(request)
             self._process_queue()
-            time.sleep(QUEUE_POLL_INTERVAL_MS / 1000.0)
 
     def _process_queue(self) -> None:
         """Process pending execution requests on the main thread.
 
         This method is called periodically by a Qt timer to ensure
-        GUI operations happen on the main thread.
+        GUI operations happen on the main thread. Every queued request is
+        drained per call, not just one.
         """
-        while not self._request_queue.empty():
+        while True:
             try:
                 request = self._request_queue.get_nowait()
-                result = self._execute_code_sync(request.code)
-                request.result = result
-                request.completed.set()
-                # Track request for status bar
-                self._record_request()
             except queue.Empty:
                 break
-            except Exception as e:
-                if FREECAD_AVAILABLE:
-                    FreeCAD.Console.PrintError(f"Queue processing error: {e}\n")
+            self._run_request(request)
+
+    def _run_request(self, request: ExecutionRequest) -> None:
+        """Execute one queued request and wake the thread waiting on it.
+
+        Args:
+            request: The request taken off the queue.
+        """
+        if not request.start():
+            # Its caller already gave up waiting for it
+            return
+        try:
+            result = self._execute_code_sync(request.code)
+            request.result = result
+            request.completed.set()
+            # Track request for status bar
+            self._record_request()
+        except Exception as e:
+            if FREECAD_AVAILABLE:
+                FreeCAD.Console.PrintError(f"Queue processing error: {e}\n")
 
     def _execute_via_queue(
         self,
@@ -732,6 +869,10 @@ class FreecadMCPPlugin:
     ) -> dict[str, Any]:
         """Execute code via the queue system for thread safety.
 
+        The timeout counts from when the main thread starts the request,
+        so time spent queued behind other requests does not use it up. A
+        request still queued after QUEUE_WAIT_TIMEOUT_S is dropped.
+
         Args:
             code: Python code to execute.
             timeout_ms: Execution timeout in milliseconds.
@@ -742,6 +883,16 @@ class FreecadMCPPlugin:
         request = ExecutionRequest(code, timeout_ms)
         self._request_queue.put(request)
 
+        if not request.started.wait(timeout=QUEUE_WAIT_TIMEOUT_S) and request.cancel():
+            return {
+                "success": False,
+                "error_type": "TimeoutError",
+                "error_message": (
+                    f"Execution was not started within {QUEUE_WAIT_TIMEOUT_S}s"
+                ),
+                "execution_time_ms": 0,
+            }
+
         # Wait for completion
         if request.completed.wait(timeout=timeout_ms / 1000):
             return request.result or {
@@ -767,23 +918,17 @@ class FreecadMCPPlugin:
             Execution result dictionary.
         """
         start = time.perf_counter()
-        stdout_capture = io.StringIO()
-        stderr_capture = io.StringIO()
+        stdout_capture = _OutputSink()
+        stderr_capture = _OutputSink()
 
-        exec_globals: dict[str, Any] = {
-            "__builtins__": __builtins__,
-        }
-
-        if FREECAD_AVAILABLE:
-            exec_globals["FreeCAD"] = FreeCAD
-            exec_globals["App"] = FreeCAD
-            exec_globals["FreeCADGui"] = FreeCADGui
-            exec_globals["Gui"] = FreeCADGui
+        exec_globals = _BASE_EXEC_GLOBALS.copy()
 
         try:
-            with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-                compiled = compile(code, "<mcp>", "exec")
-                exec(compiled, exec_globals)  # noqa: S102
+            with (
+                redirect_stdout(stdout_capture),  # type: ignore[type-var]
+                redirect_stderr(stderr_capture),  # type: ignore[type-var]
+            ):
+                exec(_compile_code(code), exec_globals)  # noqa: S102
 
             elapsed = (time.perf_counter() - start) * 1000
             return {
@@ -841,6 +986,7 @@ class FreecadMCPPlugin:
             self._handle_socket_client,
             self._host,
             self._port,
+            limit=SOCKET_STREAM_LIMIT,
         )
 
     async def _handle_socket_client(
@@ -850,42 +996,118 @@ class FreecadMCPPlugin:
     ) -> None:
         """Handle a connected socket client.
 
+        Each request is answered by its own task, so clients can send
+        several without waiting and a long execute does not hold up pings
+        or status queries behind it. Responses carry the request's id and
+        go out in whatever order the requests finish.
+
         Args:
             reader: Stream reader for incoming data.
             writer: Stream writer for outgoing data.
         """
+        tasks: set[asyncio.Task[None]] = set()
         try:
             while self._running:
                 data = await reader.readline()
                 if not data:
                     break
 
-                try:
-                    request = json.loads(data.decode("utf-8"))
-                    response = await self._process_jsonrpc_request(request)
-                except json.JSONDecodeError as e:
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": None,
-                        "error": {
-                            "code": -32700,
-                            "message": "Parse error",
-                            "data": str(e),
-                        },
-                    }
-
-                response_data = json.dumps(response).encode("utf-8") + b"\n"
-                writer.write(response_data)
-                await writer.drain()
+                task = asyncio.create_task(self._answer_socket_request(data, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
 
         except Exception as e:
             if FREECAD_AVAILABLE:
                 FreeCAD.Console.PrintError(f"MCP socket error: {e}\n")
         finally:
+            for task in tasks:
+                task.cancel()
             writer.close()
             with contextlib.suppress(Exception):
                 await writer.wait_closed()
 
+    async def _answer_socket_request(
+        self,
+        data: bytes,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Process one request line from a socket client and write the answer.
+
+        Args:
+            data: The request line as received.
+            writer: Stream writer of the client's connection.
+        """
+        try:
+            request = json.loads(data)
+            if isinstance(request, list):
+                response = await self._process_jsonrpc_batch(request)
+            else:
+                response = await self._process_jsonrpc_request(request)
+        except json.JSONDecodeError as e:
+            response = {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {
+                    "code": -32700,
+                    "message": "Parse error",
+                    "data": str(e),
+                },
+            }
+        except Exception as e:
+            # Not a request the processing can make sense of; drop the
+            # client as handling it in the connection loop used to
+            if FREECAD_AVAILABLE:
+                FreeCAD.Console.PrintError(f"MCP socket error: {e}\n")
+            writer.close()
+            return
+
+        # Body and newline go out together without concatenating them
+        # first (see SocketBridge._flush_messages). One writelines() call
+        # per response keeps concurrent answers from interleaving.
+        response_data = _encode_json(response).encode("utf-8")
+        try:
+            writer.writelines((response_data, b"\n"))
+            await writer.drain()
+        except Exception as e:
+            if FREECAD_AVAILABLE:
+                FreeCAD.Console.PrintError(f"MCP socket error: {e}\n")
+
+    async def _process_jsonrpc_batch(
+        self,
+        requests: list[Any],
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """Process a JSON-RPC 2.0 batch (an array of requests).
+
+        The requests are processed in order and answered with one array.
+
+        Args:
+            requests: The decoded batch.
+
+        Returns:
+            List of JSON-RPC responses, or a single error response if the
+            batch is empty.
+        """
+        if not requests:
+            return {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32600, "message": "Invalid Request"},
+            }
+
+        responses = []
+        for request in requests:
+            if isinstance(request, dict):
+                responses.append(await self._process_jsonrpc_request(request))
+            else:
+                responses.append(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": None,
+                        "error": {"code": -32600, "message": "Invalid Request"},
+                    }
+                )
+        return responses
+
     async def _process_jsonrpc_request(
         self,
         request: dict[str, Any],
@@ -902,33 +1124,50 @@ class FreecadMCPPlugin:
         method = request.get("method")
         params = request.get("params", {})
 
-        # Handle ping specially (no queue needed)
-        if method == "ping":
+        # Handle ping and get_instance_id specially (no queue needed); they
+        # answer the same as their XML-RPC counterparts
+        direct = {
+            "ping": self._xmlrpc_ping,
+            "get_instance_id": self._xmlrpc_get_instance_id,
+        }.get(method)
+        if direct is not None:
+            return {"jsonrpc": "2.0", "id": request_id, "result": direct()}
+
+        # Handle status specially (no queue needed): FreeCAD.Version() and
+        # FreeCAD.GuiUp only read static build and startup information
+        if method == "status":
+            if not FREECAD_AVAILABLE:
+                return {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "error": {
+                        "code": -32603,
+                        "message": "Internal error",
+                        "data": "FreeCAD is not available",
+                    },
+                }
+            version = FreeCAD.Version()
             return {
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "result": {
-                    "pong": True,
+                    "version": ".".join(str(x) for x in version[:3]),
+                    "version_tuple": version[:3],
+                    "build_date": version[3] if len(version) > 3 else "unknown",
+                    "python_version": sys.version,
+                    "gui_available": bool(FreeCAD.GuiUp),
                     "timestamp": time.time(),
                     "instance_id": self._instance_id,
                 },
             }
 
-        # Handle get_instance_id specially (no queue needed)
-        if method == "get_instance_id":
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": {"instance_id": self._instance_id},
-            }
-
         # Handle execute via queue
         if method == "execute":
             code = params.get("code", "")
             timeout_ms = params.get("timeout_ms", 30000)
 
             # Execute via queue for thread safety
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
                 None,
                 lambda: self._execute_via_queue(code, timeout_ms),
@@ -961,7 +1200,16 @@ class FreecadMCPPlugin:
         # Custom request handler that silently handles GET requests
         # instead of logging "Unsupported method ('GET')" errors
         class QuietXMLRPCRequestHandler(xmlrpc.server.SimpleXMLRPCRequestHandler):
-            """XML-RPC handler that responds gracefully to GET requests."""
+            """XML-RPC handler that responds gracefully to GET requests.
+
+            Speaks HTTP/1.1 so clients keep their connection open between
+            calls instead of reconnecting for each one. Connections idle for
+            ``XMLRPC_KEEPALIVE_TIMEOUT_S`` are closed; xmlrpc.client
+            reconnects transparently when that happens.
+            """
+
+            protocol_version = "HTTP/1.1"
+            timeout = XMLRPC_KEEPALIVE_TIMEOUT_S
 
             def do_GET(self) -> None:
                 """Handle GET requests with a friendly plain-text response.
@@ -1019,8 +1267,21 @@ class FreecadMCPPlugin:
                 """
                 pass
 
+        class ThreadingXMLRPCServer(
+            socketserver.ThreadingMixIn, xmlrpc.server.SimpleXMLRPCServer
+        ):
+            """XML-RPC server that handles each request on its own thread.
+
+            Concurrent requests then reach the execution queue together and
+            are run in the same queue drain, rather than each waiting for
+            the previous one to finish. Handlers only hand work to the
+            queue, so they are safe to run in parallel.
+            """
+
+            daemon_threads = True
+
         try:
-            self._xmlrpc_server = xmlrpc.server.SimpleXMLRPCServer(
+            self._xmlrpc_server = ThreadingXMLRPCServer(
                 (self._host, self._xmlrpc_port),
                 requestHandler=QuietXMLRPCRequestHandler,
                 allow_none=True,
@@ -1051,6 +1312,8 @@ class FreecadMCPPlugin:
         )  # type: ignore[arg-type]
         self._xmlrpc_server.register_function(self._xmlrpc_get_view, "get_view")  # type: ignore[arg-type]
         self._xmlrpc_server.register_introspection_functions()
+        # system.multicall lets clients send several calls in one request
+        self._xmlrpc_server.register_multicall_functions()
 
         while self._running:
             try:
@@ -1086,10 +1349,18 @@ class FreecadMCPPlugin:
         """
         return self._execute_via_queue(code, 30000)
 
-    # Valid view types for screenshot capture
-    _VALID_VIEW_TYPES = frozenset(
-        {"FitAll", "Isometric", "Front", "Back", "Top", "Bottom", "Left", "Right"}
-    )
+    # Valid view types for screenshot capture and the 3D view method that
+    # applies each one
+    _VIEW_METHODS: ClassVar[dict[str, str]] = {
+        "FitAll": "fitAll",
+        "Isometric": "viewIsometric",
+        "Front": "viewFront",
+        "Back": "viewRear",
+        "Top": "viewTop",
+        "Bottom": "viewBottom",
+        "Left": "viewLeft",
+        "Right": "viewRight",
+    }
 
     def _xmlrpc_get_view(
         self,
@@ -1115,11 +1386,12 @@ class FreecadMCPPlugin:
         except (ValueError, TypeError) as e:
             return {"success": False, "error": f"Invalid dimensions: {e}"}
 
-        if view_type not in self._VALID_VIEW_TYPES:
+        view_method = self._VIEW_METHODS.get(view_type)
+        if view_method is None:
             return {
                 "success": False,
                 "error": f"Invalid view_type: {view_type}. "
-                f"Must be one of: {', '.join(sorted(self._VALID_VIEW_TYPES))}",
+                f"Must be one of: {', '.join(sorted(self._VIEW_METHODS))}",
             }
 
         code = f"""
@@ -1146,23 +1418,7 @@ else:
                 _result_ = {{"success": False, "error": f"Cannot capture from {{view_class}}"}}
             else:
                 # Set view angle
-                view_type = {view_type!r}
-                if view_type == "FitAll":
-                    view.fitAll()
-                elif view_type == "Isometric":
-                    view.viewIsometric()
-                elif view_type == "Front":
-                    view.viewFront()
-                elif view_type == "Back":
-                    view.viewRear()
-                elif view_type == "Top":
-                    view.viewTop()
-                elif view_type == "Bottom":
-                    view.viewBottom()
-                elif view_type == "Left":
-                    view.viewLeft()
-                elif view_type == "Right":
-                    view.viewRight()
+                view.{view_method}()
 
                 # Capture screenshot
                 with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
@@ -22,17 +22,21 @@ Usage:
 
 from __future__ import annotations
 
-import contextlib
 import os
 import sys
 import traceback
-from pathlib import Path
 from typing import Any
 
-# Add the script's directory to sys.path so we can import the server module
-script_dir = str(Path(__file__).resolve().parent)
-if script_dir not in sys.path:
-    sys.path.insert(0, script_dir)
+# Add the addon directory to sys.path so we can import the bridge package.
+# Importing it as freecad_mcp_bridge (like Init.py and InitGui.py do) rather
+# than the script's own directory keeps one copy of each module, so their
+# caches and the registered plugin are shared with the workbench.
+# os.path.abspath() is pure string work; Path.resolve() would stat every
+# component to resolve symlinks, which the import system doesn't need.
+script_dir = os.path.dirname(os.path.abspath(__file__))  # noqa: PTH100, PTH120
+addon_dir = os.path.dirname(script_dir)  # noqa: PTH120
+if addon_dir not in sys.path:
+    sys.path.insert(0, addon_dir)
 
 # Check if we're running inside FreeCAD
 try:
@@ -50,6 +54,9 @@ except ImportError:
 # Global reference to GuiWaiter to prevent garbage collection
 _gui_waiter: Any | None = None
 
+# Separator line for the console banner
+_BANNER_SEP = "=" * 50
+
 
 def _start_bridge() -> None:
     """Start the MCP bridge if not already running.
@@ -87,7 +94,7 @@ def _start_bridge() -> None:
             _gui_waiter.start()
     """
     # Check if bridge is already running (from auto-start in Init.py)
-    from bridge_utils import get_running_plugin
+    from freecad_mcp_bridge.bridge_utils import get_running_plugin
 
     if get_running_plugin() is not None:
         FreeCAD.Console.PrintMessage(
@@ -96,7 +103,7 @@ def _start_bridge() -> None:
         return
 
     try:
-        from server import FreecadMCPPlugin
+        from freecad_mcp_bridge import FreecadMCPPlugin
 
         # Get configuration from environment variables (with defaults)
         try:
@@ -119,19 +126,19 @@ def _start_bridge() -> None:
 
         # Register plugin with commands module so Init.py auto-start can see it
         # This prevents both scripts from trying to start separate bridges
-        from bridge_utils import register_mcp_plugin
+        from freecad_mcp_bridge.bridge_utils import register_mcp_plugin
 
         register_mcp_plugin(plugin, xmlrpc_port, socket_port)
 
-        FreeCAD.Console.PrintMessage("\n")
-        FreeCAD.Console.PrintMessage("=" * 50 + "\n")
-        FreeCAD.Console.PrintMessage("MCP Bridge started (via startup script)!\n")
-        FreeCAD.Console.PrintMessage(f"  - XML-RPC: localhost:{xmlrpc_port}\n")
-        FreeCAD.Console.PrintMessage(f"  - Socket:  localhost:{socket_port}\n")
+        mode = "GUI" if FreeCAD.GuiUp else "Headless"
         FreeCAD.Console.PrintMessage(
-            f"  - Mode:    {'GUI' if FreeCAD.GuiUp else 'Headless'}\n"
+            f"\n{_BANNER_SEP}\n"
+            "MCP Bridge started (via startup script)!\n"
+            f"  - XML-RPC: localhost:{xmlrpc_port}\n"
+            f"  - Socket:  localhost:{socket_port}\n"
+            f"  - Mode:    {mode}\n"
+            f"{_BANNER_SEP}\n\n"
         )
-        FreeCAD.Console.PrintMessage("=" * 50 + "\n\n")
     except Exception as e:
         FreeCAD.Console.PrintError(f"Failed to start MCP Bridge: {e}\n")
         FreeCAD.Console.PrintError(traceback.format_exc())
@@ -154,35 +161,14 @@ def _start_bridge() -> None:
 # will see GuiUp=False and use a background thread. Later, code executed on that
 # thread will try to do Qt operations, causing crashes (SIGABRT in QCocoaWindow).
 try:
-    # Try to import Qt and check for running QApplication
-    QtCore = None
-    QtWidgets = None
-    _has_qapp = False
-    _is_true_headless = False
+    # Import Qt and check for a running QApplication vs a bare
+    # QCoreApplication (true headless)
+    from freecad_mcp_bridge.bridge_utils import detect_qt_mode
 
-    try:
-        from PySide2 import QtCore, QtWidgets  # type: ignore[assignment, no-redef]
-    except ImportError:
-        with contextlib.suppress(ImportError):
-            from PySide6 import QtCore, QtWidgets  # type: ignore[assignment, no-redef]
-
-    # Detect GUI mode vs true headless mode
-    # - True headless (freecadcmd): QCoreApplication exists but NOT QApplication
-    # - GUI mode early startup: No app yet, or QApplication being initialized
-    # - GUI mode ready: FreeCAD.GuiUp is True
-    if QtWidgets is not None and QtCore is not None:
-        qapp = QtWidgets.QApplication.instance()
-        if qapp is not None:
-            _has_qapp = True
-        else:
-            # No QApplication - check if QCoreApplication exists
-            # If QCoreApplication exists but is NOT a QApplication, it's true headless
-            qcore_app = QtCore.QCoreApplication.instance()
-            if qcore_app is not None and not isinstance(
-                qcore_app, QtWidgets.QApplication
-            ):
-                _is_true_headless = True
-            # If no app at all, assume early GUI startup (will use GuiWaiter)
+    _qt = detect_qt_mode()
+    QtCore = _qt.qtcore
+    _has_qapp = _qt.has_qapp
+    _is_true_headless = _qt.is_true_headless
 
     FreeCAD.Console.PrintMessage(
         f"Startup Bridge: GuiUp={FreeCAD.GuiUp}, "
@@ -210,7 +196,7 @@ try:
         FreeCAD.Console.PrintMessage(
             "Startup Bridge: GUI not ready, using GuiWaiter...\n"
         )
-        from bridge_utils import GuiWaiter
+        from freecad_mcp_bridge.bridge_utils import GuiWaiter
 
         _gui_waiter = GuiWaiter(
             callback=_start_bridge,
@@ -10,6 +10,10 @@ MCP bridge server. Commands are defined in the commands module.
 
 from __future__ import annotations
 
+import os
+import traceback
+from typing import Any
+
 import FreeCAD
 import FreeCADGui
 
@@ -24,18 +28,52 @@ try:
 except Exception as e:
     FreeCAD.Console.PrintWarning(f"Could not register icon path: {e}\n")
 
+
+class _LazyPreferencesPage:
+    """Stand-in for MCPBridgePreferencesPage registered with FreeCAD.
+
+    FreeCAD only instantiates a registered preferences page class when the
+    user opens it in the Preferences dialog. Instantiating this class imports
+    the Qt page module at that point and returns the real page widget, so
+    workbench loading doesn't pay for the widget imports.
+    """
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Any:
+        """Import and construct the real preferences page."""
+        from Qt.preferences_page import MCPBridgePreferencesPage
+
+        return MCPBridgePreferencesPage(*args, **kwargs)
+
+
 # Register preferences page with FreeCAD's Preferences dialog
 # This must be done at module level, before the workbench is registered
 try:
-    from Qt.preferences_page import MCPBridgePreferencesPage
-
-    FreeCADGui.addPreferencePage(MCPBridgePreferencesPage, "Robust MCP Bridge")
+    FreeCADGui.addPreferencePage(_LazyPreferencesPage, "Robust MCP Bridge")
 except Exception as e:
     FreeCAD.Console.PrintWarning(
         f"Could not register MCP Bridge preferences page: {e}\n"
     )
 
 
+def _sync_status_bar() -> None:
+    """Sync the status bar widget with the bridge state, if it is enabled.
+
+    The preference is checked before importing the status widget module, so
+    nothing Qt-widget related is loaded while the indicator is turned off.
+    """
+    try:
+        from preferences import get_status_bar_enabled
+
+        if not get_status_bar_enabled():
+            return
+
+        from Qt.status_widget import sync_status_with_bridge
+
+        sync_status_with_bridge()
+    except Exception as e:
+        FreeCAD.Console.PrintWarning(f"Could not sync status bar: {e}\n")
+
+
 class FreecadRobustMCPBridgeWorkbench(FreeCADGui.Workbench):
     """Robust MCP Bridge workbench for FreeCAD.
 
@@ -103,38 +141,21 @@ class FreecadRobustMCPBridgeWorkbench(FreeCADGui.Workbench):
         # This is a fallback if the module-level timer didn't fire
         # (which can happen if the module isn't loaded until workbench selection)
         try:
-            from preferences import get_auto_start
+            from freecad_mcp_bridge.bridge_utils import ensure_bridge_started
 
-            if get_auto_start():
-                # Check if already running (timer might have started it)
-                from commands import is_bridge_running
-
-                if not is_bridge_running():
-                    FreeCAD.Console.PrintMessage(
-                        "Auto-starting MCP Bridge (configured in preferences)...\n"
-                    )
-                    FreeCADGui.runCommand("Start_MCP_Bridge")
+            # No-op if the startup callback already started the bridge
+            ensure_bridge_started()
         except Exception as e:
             FreeCAD.Console.PrintWarning(f"Could not auto-start MCP Bridge: {e}\n")
 
         # Sync status bar widget with current bridge state
         # (bridge may have been started by Init.py before workbench was selected)
-        try:
-            from Qt.status_widget import sync_status_with_bridge
-
-            sync_status_with_bridge()
-        except Exception as e:
-            FreeCAD.Console.PrintWarning(f"Could not sync status bar: {e}\n")
+        _sync_status_bar()
 
     def Activated(self) -> None:
         """Called when the workbench is activated."""
         # Sync status bar widget with current bridge state
-        try:
-            from Qt.status_widget import sync_status_with_bridge
-
-            sync_status_with_bridge()
-        except Exception as e:
-            FreeCAD.Console.PrintWarning(f"Could not sync status bar: {e}\n")
+        _sync_status_bar()
 
     def Deactivated(self) -> None:
         """Called when the workbench is deactivated."""
@@ -148,48 +169,78 @@ class FreecadRobustMCPBridgeWorkbench(FreeCADGui.Workbench):
 # Register the workbench
 FreeCADGui.addWorkbench(FreecadRobustMCPBridgeWorkbench())
 
-# Schedule status bar sync after a short delay to allow GUI to finish initializing
+
+def _import_qtcore() -> Any:
+    """Import QtCore for scheduling the deferred startup callbacks.
+
+    Only QtCore is needed here; the addon's own modules (preferences,
+    commands, the status widget and the bridge server) are imported inside
+    the callbacks, and the server only once auto-start is actually going to
+    start a bridge.
+
+    Returns:
+        QtCore from the installed PySide package (PySide2, else PySide6).
+
+    Raises:
+        ImportError: If neither PySide2 nor PySide6 is available.
+    """
+    from freecad_mcp_bridge.bridge_utils import import_qt
+
+    QtCore, _ = import_qt()
+    if QtCore is None:
+        raise ImportError("Neither PySide2 nor PySide6 is available")
+    return QtCore
+
+
+# GUI readiness polling for the deferred startup work below
+_GUI_CHECK_INTERVAL_MS = 50
+_GUI_SETTLE_MS = 500  # Let FreeCAD finish initializing once GuiUp flips
+_GUI_WAIT_MAX_RETRIES = 1200  # 1200 * 50ms = 60s timeout
+
+# Schedule status bar sync (and auto-start) once the GUI is ready
 # This runs on the main thread (InitGui.py is executed on main thread)
 try:
-    try:
-        from PySide2 import QtCore
-    except ImportError:
-        from PySide6 import QtCore
+    QtCore = _import_qtcore()
 
     def _deferred_status_bar_sync() -> None:
-        """Sync status bar with bridge state after GUI is ready."""
+        """Sync status bar with bridge state after GUI is ready.
+
+        Nothing is shown until a bridge runs, so the cheap checks come first
+        and the status widget module is only imported when it has work to do.
+        """
         try:
             from commands import is_bridge_running
+
+            if not is_bridge_running():
+                return
+
             from preferences import get_status_bar_enabled
+
+            if not get_status_bar_enabled():
+                return
+
             from Qt.status_widget import sync_status_with_bridge
 
-            if get_status_bar_enabled() and is_bridge_running():
-                FreeCAD.Console.PrintMessage(
-                    "Robust MCP Bridge: Syncing status bar from InitGui...\n"
-                )
-                sync_status_with_bridge()
+            FreeCAD.Console.PrintMessage(
+                "Robust MCP Bridge: Syncing status bar from InitGui...\n"
+            )
+            sync_status_with_bridge()
         except Exception as e:
             FreeCAD.Console.PrintWarning(
                 f"Robust MCP Bridge: Deferred status bar sync failed: {e}\n"
             )
 
-    # Use QTimer.singleShot on the main thread - this should work
-    QtCore.QTimer.singleShot(2000, _deferred_status_bar_sync)
-    FreeCAD.Console.PrintMessage(
-        "Robust MCP Bridge: Status bar sync scheduled from InitGui (2s)\n"
-    )
-
     # Auto-start the MCP bridge if configured in preferences
     # This runs at FreeCAD GUI startup (InitGui.py module-level code)
     # Note: Init.py does NOT run at startup for workbench addons, so auto-start
     # must be triggered from here instead.
     #
-    # We use a deferred QTimer callback that rechecks FreeCAD.GuiUp.
-    # This waits for the GUI to be ready without relying solely on a fixed delay.
-    def _auto_start_bridge() -> None:
+    # The GuiWaiter below runs it once FreeCAD.GuiUp is True, and it rechecks
+    # FreeCAD.GuiUp itself before starting the bridge.
+    def _auto_start_bridge() -> bool:
         """Auto-start bridge after GUI is confirmed ready.
 
-        This is the callback invoked by QTimer.singleShot() after a delay.
+        This is invoked from the startup GuiWaiter callback once the GUI is up.
         It rechecks FreeCAD.GuiUp before starting to ensure the GUI is ready.
         At this point, it's safe to start the MCP bridge with Qt timer-based
         queue processing.
@@ -198,15 +249,16 @@ try:
             None.
 
         Returns:
-            None. Early returns if auto-start disabled or bridge already running.
+            True if the bridge was started (and the status bar synced), False
+            if auto-start is disabled, the bridge was already running, the
+            start was rescheduled, or it failed.
 
         Raises:
             Exception: Any exception during bridge startup is caught, logged
                 to FreeCAD.Console.PrintError with full traceback, and suppressed.
 
         Side Effects:
-            - Creates and starts a FreecadMCPPlugin instance
-            - Registers the plugin with the workbench commands module
+            - Starts and registers the bridge via ensure_bridge_started()
             - Syncs the status bar widget with bridge state
         """
         try:
@@ -217,44 +269,13 @@ try:
                     "Robust MCP Bridge: GUI not ready, rescheduling auto-start...\n"
                 )
                 QtCore.QTimer.singleShot(500, _auto_start_bridge)
-                return
-
-            from preferences import get_auto_start
-
-            if not get_auto_start():
-                return
-
-            # Check if bridge is already running
-            from commands import is_bridge_running
-
-            if is_bridge_running():
-                FreeCAD.Console.PrintMessage(
-                    "Robust MCP Bridge: Bridge already running, skipping auto-start\n"
-                )
-                return
-
-            FreeCAD.Console.PrintMessage(
-                "Robust MCP Bridge: Auto-starting from InitGui...\n"
-            )
-
-            # Import and start the bridge
-            from freecad_mcp_bridge.bridge_utils import register_mcp_plugin
-            from freecad_mcp_bridge.server import FreecadMCPPlugin
-            from preferences import get_socket_port, get_xmlrpc_port
-
-            xmlrpc_port = get_xmlrpc_port()
-            socket_port = get_socket_port()
+                return False
 
-            plugin = FreecadMCPPlugin(
-                host="localhost",
-                port=socket_port,
-                xmlrpc_port=xmlrpc_port,
-                enable_xmlrpc=True,
-            )
-            plugin.start()
+            from freecad_mcp_bridge.bridge_utils import ensure_bridge_started
 
-            # Register plugin with commands module
-            register_mcp_plugin(plugin, xmlrpc_port, socket_port)
+            # Returns False if auto-start was disabled or a bridge is running
+            if not ensure_bridge_started():
+                return False
 
             # Sync status bar now that bridge is running
             try:
@@ -265,39 +286,69 @@ try:
                 FreeCAD.Console.PrintWarning(
                     f"Could not sync status bar after auto-start: {status_err}\n"
                 )
+            return True
         except Exception as e:
             FreeCAD.Console.PrintError(f"Robust MCP Bridge: Auto-start failed: {e}\n")
-            import traceback
-
             FreeCAD.Console.PrintError(traceback.format_exc())
+            return False
+
+    def _deferred_init() -> None:
+        """Run the deferred startup work once FreeCAD.GuiUp is True.
 
-    # Check if auto-start is enabled before scheduling.
+        Auto-start runs first if it was enabled when this module loaded
+        (_auto_start_bridge re-checks the preference), then the status bar is
+        synced with whatever bridge state results. A successful auto-start
+        already syncs the status bar, so it isn't synced twice.
+        """
+        if _auto_start_pending and _auto_start_bridge():
+            return
+        _deferred_status_bar_sync()
+
+    from freecad_mcp_bridge.bridge_utils import GuiWaiter, auto_start_disabled_by_env
+
+    # Check if auto-start is enabled before scheduling. FREECAD_MCP_AUTOSTART=0
+    # disables it without reading preferences at all.
     # In testing mode (FREECAD_MCP_TESTING=1), skip auto-start so the test
     # controls bridge lifecycle via startup_bridge.py.  Without this guard,
     # the auto-start timer and startup_bridge.py race to start the bridge,
     # which can cause port conflicts or duplicate initialisation.
-    import os
-
-    from preferences import get_auto_start
-
-    if os.environ.get("FREECAD_MCP_TESTING"):
+    _auto_start_pending = False
+    if auto_start_disabled_by_env():
         FreeCAD.Console.PrintMessage(
-            "Robust MCP Bridge: Auto-start skipped (FREECAD_MCP_TESTING set)\n"
+            "Robust MCP Bridge: Auto-start skipped (FREECAD_MCP_AUTOSTART set)\n"
         )
-    elif get_auto_start():
-        # Schedule auto-start after a delay to ensure GUI is fully ready.
-        # InitGui.py module-level code runs early in FreeCAD startup, so we
-        # need to defer the bridge start to avoid race conditions.
-        # Note: We use a simple QTimer.singleShot() here because GuiWaiter
-        # has timing issues when used from module-level code during startup.
-        QtCore.QTimer.singleShot(3000, _auto_start_bridge)
+    elif os.environ.get("FREECAD_MCP_TESTING"):
         FreeCAD.Console.PrintMessage(
-            "Robust MCP Bridge: Auto-start scheduled from InitGui (3s)\n"
+            "Robust MCP Bridge: Auto-start skipped (FREECAD_MCP_TESTING set)\n"
         )
     else:
-        FreeCAD.Console.PrintMessage(
-            "Robust MCP Bridge: Auto-start disabled in preferences\n"
-        )
+        # Only read the preference when it can actually be used
+        from preferences import get_auto_start
+
+        if get_auto_start():
+            _auto_start_pending = True
+            FreeCAD.Console.PrintMessage(
+                "Robust MCP Bridge: Auto-start scheduled from InitGui "
+                "(waiting for GUI)\n"
+            )
+        else:
+            FreeCAD.Console.PrintMessage(
+                "Robust MCP Bridge: Auto-start disabled in preferences\n"
+            )
+
+    # Wait for FreeCAD.GuiUp instead of sleeping a fixed 2-3 seconds: the
+    # waiter checks once the event loop starts and then every 50 ms, and runs
+    # the startup work shortly after the GUI is ready, however long that
+    # takes. It is kept in a module-level global so the Qt timers aren't
+    # garbage collected.
+    _startup_waiter = GuiWaiter(
+        callback=_deferred_init,
+        log_prefix="Robust MCP Bridge",
+        check_interval_ms=_GUI_CHECK_INTERVAL_MS,
+        defer_ms=_GUI_SETTLE_MS,
+        max_retries=_GUI_WAIT_MAX_RETRIES,
+    )
+    _startup_waiter.start()
 except Exception as e:
     FreeCAD.Console.PrintWarning(
         f"Robust MCP Bridge: Could not schedule status bar sync: {e}\n"
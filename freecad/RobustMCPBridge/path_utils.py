@@ -23,8 +23,26 @@ import FreeCAD
 _ADDON_DIRNAME = "RobustMCPBridge"
 _ADDON_NAMESPACE = "freecad"
 
-# Cache for addon path to avoid repeated filesystem lookups
+# Separator and path suffixes for the lookups below. Plain concatenation is
+# cheaper than os.path.join when every component is a known string.
+_SEP = os.sep
+_MOD_TAIL = f"{_SEP}Mod"
+_ADDON_TAIL = f"{_SEP}{_ADDON_NAMESPACE}{_SEP}{_ADDON_DIRNAME}"
+
+# Directory containing this module. FreeCAD defines __file__ when it imports
+# addon modules, so this is normally the addon directory and the Mod
+# directory lookups in get_addon_path() are only a fallback.
+try:
+    _MODULE_DIR: str | None = os.path.dirname(os.path.abspath(__file__))  # noqa: PTH100, PTH120
+except NameError:
+    _MODULE_DIR = None
+
+# Caches for resolved paths to avoid repeated filesystem lookups. Only found
+# paths are stored; a miss is looked up again on the next call.
 _addon_path_cache: str | None = None
+_icons_dir_cache: str | None = None
+_workbench_icon_cache: str | None = None
+_icon_path_cache: dict[str, str] = {}
 
 
 def get_addon_path() -> str:
@@ -35,77 +53,93 @@ def get_addon_path() -> str:
     2. FreeCAD's Mod path + addon name
     3. Versioned FreeCAD directory (FreeCAD 1.x: v1-*)
 
+    Methods 2 and 3 share a single scan of the user data directory.
+
     Returns:
         The absolute path to the addon directory, or empty string if not found.
         Once found, the path is cached for subsequent calls.
     """
+    # Method 1: __file__ (resolved once at import)
+    if _MODULE_DIR is not None:
+        return _MODULE_DIR
+
     global _addon_path_cache
     if _addon_path_cache is not None:
         return _addon_path_cache
 
-    # Method 1: Try __file__
-    try:
-        _addon_path_cache = os.path.dirname(os.path.abspath(__file__))  # noqa: PTH100, PTH120
-        return _addon_path_cache
-    except NameError:
-        pass
-
-    # Method 2: Use FreeCAD's Mod path + namespace package structure
-    # New-style: Mod/freecad/RobustMCPBridge/
+    # Methods 2 and 3: Look under FreeCAD's user data directory in one pass.
+    # New-style: Mod/freecad/RobustMCPBridge/ (unversioned), falling back to
+    # v1-*/Mod/freecad/RobustMCPBridge/ (FreeCAD 1.x versioned directories).
+    # os.scandir yields the entry type from the directory listing itself, so
+    # non-directory siblings are skipped without an extra stat() each.
+    mod_dirs: list[str] = []
+    versioned_mod_dirs: list[str] = []
     try:
-        mod_path = os.path.join(  # noqa: PTH118
-            FreeCAD.getUserAppDataDir(), "Mod", _ADDON_NAMESPACE, _ADDON_DIRNAME
+        with os.scandir(FreeCAD.getUserAppDataDir()) as entries:
+            for entry in entries:
+                name = entry.name
+                if name == "Mod" and entry.is_dir():
+                    mod_dirs.append(entry.path)
+                elif name.startswith("v1-") and entry.is_dir():
+                    versioned_mod_dirs.append(entry.path + _MOD_TAIL)
+    except OSError as e:
+        FreeCAD.Console.PrintWarning(
+            f"Could not scan FreeCAD user data directory: {e}\n"
         )
-        if os.path.exists(mod_path):  # noqa: PTH110
-            _addon_path_cache = mod_path
-            return _addon_path_cache
-    except (OSError, PermissionError) as e:
-        FreeCAD.Console.PrintWarning(f"Could not access Mod directory: {e}\n")
 
-    # Method 3: Try versioned FreeCAD directory (FreeCAD 1.x)
-    # New-style: v1-*/Mod/freecad/RobustMCPBridge/
-    try:
-        base_path = FreeCAD.getUserAppDataDir()
-        for item in os.listdir(base_path):  # noqa: PTH208
-            if item.startswith("v1-"):
-                versioned_mod = os.path.join(  # noqa: PTH118
-                    base_path, item, "Mod", _ADDON_NAMESPACE, _ADDON_DIRNAME
-                )
-                if os.path.exists(versioned_mod):  # noqa: PTH110
-                    _addon_path_cache = versioned_mod
-                    return _addon_path_cache
-    except (OSError, PermissionError) as e:
-        FreeCAD.Console.PrintWarning(f"Could not scan versioned directories: {e}\n")
+    for mod_dir in mod_dirs + versioned_mod_dirs:
+        addon_dir = mod_dir + _ADDON_TAIL
+        if os.path.isdir(addon_dir):  # noqa: PTH112
+            _addon_path_cache = addon_dir
+            return _addon_path_cache
 
+    # A miss is not cached, so an addon directory created later is found
     return ""
 
 
 def get_icon_path(icon_name: str) -> str:
     """Get the full path to an icon file.
 
+    FreeCAD calls each command's GetResources() whenever it refreshes
+    toolbars and menus, so found paths are memoized per icon name.
+
     Args:
         icon_name: The icon filename or relative path (e.g., "Resources/Icons/mcp_start.svg")
 
     Returns:
         The absolute path to the icon file, or empty string if addon path not found.
     """
+    icon_path = _icon_path_cache.get(icon_name)
+    if icon_path is not None:
+        return icon_path
+
     addon_path = get_addon_path()
     if not addon_path:
         return ""
-    return os.path.join(addon_path, icon_name)  # noqa: PTH118
+    icon_path = _icon_path_cache[icon_name] = f"{addon_path}{_SEP}{icon_name}"
+    return icon_path
 
 
 def get_icons_dir() -> str:
     """Get the path to the addon's icons directory.
 
+    init_gui.py registers this directory with FreeCAD and the workbench icon
+    is resolved inside it, so once found the path is cached and the directory
+    is only checked once per session.
+
     Returns:
         The absolute path to the icons directory, or empty string if not found.
     """
+    global _icons_dir_cache
+    if _icons_dir_cache is not None:
+        return _icons_dir_cache
+
     addon_path = get_addon_path()
     if addon_path:
         # New-style: Resources/Icons/
         icons_dir = os.path.join(addon_path, "Resources", "Icons")  # noqa: PTH118
         if os.path.isdir(icons_dir):  # noqa: PTH112
+            _icons_dir_cache = icons_dir
             return icons_dir
     return ""
 
@@ -115,13 +149,17 @@ def get_workbench_icon() -> str:
 
     Returns:
         The absolute path to the workbench icon, or empty string if not found.
+        Once found, the path is cached for subsequent calls.
     """
-    addon_path = get_addon_path()
-    if addon_path:
+    global _workbench_icon_cache
+    if _workbench_icon_cache is not None:
+        return _workbench_icon_cache
+
+    icons_dir = get_icons_dir()
+    if icons_dir:
         # New-style: Resources/Icons/FreecadRobustMCPBridge.svg
-        icon_path = os.path.join(  # noqa: PTH118
-            addon_path, "Resources", "Icons", "FreecadRobustMCPBridge.svg"
-        )
+        icon_path = os.path.join(icons_dir, "FreecadRobustMCPBridge.svg")  # noqa: PTH118
         if os.path.exists(icon_path):  # noqa: PTH110
+            _workbench_icon_cache = icon_path
             return icon_path
     return ""
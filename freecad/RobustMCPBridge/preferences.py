@@ -13,7 +13,7 @@ Python features at load time.
 
 from __future__ import annotations
 
-from typing import TypedDict
+from typing import Any, TypedDict
 
 import FreeCAD
 
@@ -37,9 +37,58 @@ DEFAULT_XMLRPC_PORT = 9875
 DEFAULT_SOCKET_PORT = 9876
 
 
+# Cached parameter group handle (see get_param)
+_param_grp: FreeCAD.ParameterGrp | None = None
+
+
 def get_param() -> FreeCAD.ParameterGrp:
-    """Get the parameter group for our preferences."""
-    return FreeCAD.ParamGet(PARAM_PATH)
+    """Get the parameter group for our preferences.
+
+    FreeCAD.ParamGet() walks the parameter tree by path on every call, while
+    the returned handle stays valid for the lifetime of the process, so it
+    is looked up once and reused.
+    """
+    global _param_grp
+    if _param_grp is None:
+        _param_grp = FreeCAD.ParamGet(PARAM_PATH)
+    return _param_grp
+
+
+# Preference values already read from the parameter group, keyed by
+# parameter name. The setters below write through to it; invalidate_cache()
+# drops it so values changed outside this module are re-read.
+_cache: dict[str, Any] = {}
+
+
+def invalidate_cache() -> None:
+    """Forget cached preference values so the next reads hit FreeCAD."""
+    _cache.clear()
+
+
+def _get_bool(key: str, default: bool) -> bool:
+    """Read a boolean preference, caching the value."""
+    if key not in _cache:
+        _cache[key] = get_param().GetBool(key, default)
+    return _cache[key]
+
+
+def _get_int(key: str, default: int) -> int:
+    """Read an integer preference, caching the value."""
+    if key not in _cache:
+        _cache[key] = get_param().GetInt(key, default)
+    return _cache[key]
+
+
+def _set_bool(key: str, value: bool) -> None:
+    """Write a boolean preference and update the cache."""
+    get_param().SetBool(key, value)
+    _cache[key] = value
+
+
+def _set_int(key: str, value: int) -> None:
+    """Write an integer preference and update the cache."""
+    get_param().SetInt(key, value)
+    _cache[key] = value
 
 
 def get_auto_start() -> bool:
@@ -49,7 +98,7 @@ def get_auto_start() -> bool:
         True if bridge should auto-start, False otherwise.
         Default: False
     """
-    return get_param().GetBool("AutoStart", DEFAULT_AUTO_START)
+    return _get_bool("AutoStart", DEFAULT_AUTO_START)
 
 
 def set_auto_start(enabled: bool) -> None:
@@ -58,7 +107,7 @@ def set_auto_start(enabled: bool) -> None:
     Args:
         enabled: True to enable auto-start, False to disable.
     """
-    get_param().SetBool("AutoStart", enabled)
+    _set_bool("AutoStart", enabled)
 
 
 def get_status_bar_enabled() -> bool:
@@ -68,7 +117,7 @@ def get_status_bar_enabled() -> bool:
         True if status bar indicator should be shown, False otherwise.
         Default: True
     """
-    return get_param().GetBool("StatusBarEnabled", DEFAULT_STATUS_BAR_ENABLED)
+    return _get_bool("StatusBarEnabled", DEFAULT_STATUS_BAR_ENABLED)
 
 
 def set_status_bar_enabled(enabled: bool) -> None:
@@ -77,7 +126,7 @@ def set_status_bar_enabled(enabled: bool) -> None:
     Args:
         enabled: True to show status bar indicator, False to hide.
     """
-    get_param().SetBool("StatusBarEnabled", enabled)
+    _set_bool("StatusBarEnabled", enabled)
 
 
 def get_xmlrpc_port() -> int:
@@ -87,7 +136,7 @@ def get_xmlrpc_port() -> int:
         Port number for XML-RPC server.
         Default: 9875
     """
-    return get_param().GetInt("XMLRPCPort", DEFAULT_XMLRPC_PORT)
+    return _get_int("XMLRPCPort", DEFAULT_XMLRPC_PORT)
 
 
 def set_xmlrpc_port(port: int) -> None:
@@ -101,7 +150,7 @@ def set_xmlrpc_port(port: int) -> None:
     """
     if not 1024 <= port <= 65535:
         raise ValueError(f"Port must be between 1024 and 65535, got {port}")
-    get_param().SetInt("XMLRPCPort", port)
+    _set_int("XMLRPCPort", port)
 
 
 def get_socket_port() -> int:
@@ -111,7 +160,7 @@ def get_socket_port() -> int:
         Port number for JSON-RPC socket server.
         Default: 9876
     """
-    return get_param().GetInt("SocketPort", DEFAULT_SOCKET_PORT)
+    return _get_int("SocketPort", DEFAULT_SOCKET_PORT)
 
 
 def set_socket_port(port: int) -> None:
@@ -125,7 +174,7 @@ def set_socket_port(port: int) -> None:
     """
     if not 1024 <= port <= 65535:
         raise ValueError(f"Port must be between 1024 and 65535, got {port}")
-    get_param().SetInt("SocketPort", port)
+    _set_int("SocketPort", port)
 
 
 def get_all_preferences() -> PreferencesDict:
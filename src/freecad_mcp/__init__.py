@@ -18,7 +18,13 @@ Example:
         >>> main()
 """
 
+from __future__ import annotations
+
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from freecad_mcp.server import mcp
 
 __version__: str
 try:
@@ -36,6 +42,19 @@ except PackageNotFoundError:
 __author__ = "Sean P. Kane"
 __email__ = "spkane@gmail.com"
 
-from freecad_mcp.server import mcp
-
 __all__ = ["__version__", "mcp"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the server's ``mcp`` instance on first access.
+
+    Importing the server module pulls in the MCP SDK and every tool module,
+    so it is deferred until ``freecad_mcp.mcp`` is actually used. Callers
+    that only need ``__version__`` don't pay for it.
+    """
+    if name == "mcp":
+        from freecad_mcp.server import mcp
+
+        globals()["mcp"] = mcp
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
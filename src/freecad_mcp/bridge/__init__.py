@@ -10,6 +10,7 @@ Bridge Modes:
 """
 
 from freecad_mcp.bridge.base import (
+    BridgeBatch,
     ConnectionStatus,
     DocumentInfo,
     ExecutionResult,
@@ -28,6 +29,7 @@ from freecad_mcp.bridge.xmlrpc import XmlRpcBridge
 
 __all__ = [
     # Base classes and types
+    "BridgeBatch",
     "ConnectionStatus",
     "DocumentInfo",
     "ExecutionResult",
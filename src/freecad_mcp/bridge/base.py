@@ -10,13 +10,23 @@ Based on learnings from existing implementations:
 - contextform: Comprehensive CAD operations
 """
 
+import asyncio
+import contextvars
+import copy
+import functools
+import inspect
+import sys
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import Any
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field, replace
+from enum import StrEnum
+from types import CodeType, TracebackType
+from typing import Any, ClassVar
 
 
-class ViewAngle(str, Enum):
+class ViewAngle(StrEnum):
     """Standard view angles for screenshots."""
 
     ISOMETRIC = "Isometric"
@@ -29,7 +39,26 @@ class ViewAngle(str, Enum):
     FIT_ALL = "FitAll"
 
 
-class ObjectType(str, Enum):
+# View angles keyed by their string value, for validating names that come in
+# as plain strings without going through ViewAngle(value)
+VIEW_ANGLES_BY_VALUE: dict[str, ViewAngle] = {angle.value: angle for angle in ViewAngle}
+
+# The FreeCAD 3D view method that applies each view angle. Bridges put the
+# method name straight into their snippets rather than sending an if/elif
+# chain over every angle for FreeCAD to walk.
+VIEW_METHODS: dict[ViewAngle, str] = {
+    ViewAngle.ISOMETRIC: "viewIsometric",
+    ViewAngle.FRONT: "viewFront",
+    ViewAngle.BACK: "viewRear",
+    ViewAngle.TOP: "viewTop",
+    ViewAngle.BOTTOM: "viewBottom",
+    ViewAngle.LEFT: "viewLeft",
+    ViewAngle.RIGHT: "viewRight",
+    ViewAngle.FIT_ALL: "fitAll",
+}
+
+
+class ObjectType(StrEnum):
     """FreeCAD object type categories."""
 
     PART = "Part"
@@ -41,7 +70,7 @@ class ObjectType(str, Enum):
     SPREADSHEET = "Spreadsheet"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of Python code execution in FreeCAD.
 
@@ -63,8 +92,49 @@ class ExecutionResult:
     error_type: str | None = None
     error_traceback: str | None = None
 
+    @classmethod
+    def from_response(
+        cls, response: Any, execution_time_ms: float
+    ) -> "ExecutionResult":
+        """Build a result from an ``execute`` response sent by the FreeCAD bridge.
+
+        Args:
+            response: The response payload. A dict carries the full result;
+                anything else is treated as the bare ``_result_`` value.
+            execution_time_ms: Round-trip time in milliseconds.
+
+        Returns:
+            ExecutionResult for the response.
+        """
+        if isinstance(response, dict):
+            return cls(
+                success=response.get("success", False),
+                result=response.get("result"),
+                stdout=response.get("stdout", ""),
+                stderr=response.get("stderr", ""),
+                execution_time_ms=execution_time_ms,
+                error_type=response.get("error_type"),
+                error_traceback=response.get("error_traceback"),
+            )
+        return cls(
+            success=True,
+            result=response,
+            stdout="",
+            stderr="",
+            execution_time_ms=execution_time_ms,
+        )
+
+
+def _intern_names(names: Sequence[str]) -> list[str]:
+    """Return object names as a list of interned strings.
+
+    The same names ("Body", "Sketch001", ...) turn up in the object lists of
+    many documents and objects. Interning lets them share one string.
+    """
+    return list(map(sys.intern, names))
+
 
-@dataclass
+@dataclass(slots=True)
 class DocumentInfo:
     """Information about a FreeCAD document.
 
@@ -85,12 +155,13 @@ class DocumentInfo:
     active_object: str | None = None
 
     def __post_init__(self) -> None:
-        """Set label to name if not provided."""
+        """Set label to name if not provided and intern the object names."""
         if not self.label:
             self.label = self.name
+        self.objects = _intern_names(self.objects)
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectInfo:
     """Information about a FreeCAD object.
 
@@ -114,8 +185,61 @@ class ObjectInfo:
     parents: list[str] = field(default_factory=list)
     visibility: bool = True
 
+    def __post_init__(self) -> None:
+        """Intern the child and parent names."""
+        self.children = _intern_names(self.children)
+        self.parents = _intern_names(self.parents)
 
-@dataclass
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "ObjectInfo":
+        """Build an ObjectInfo from a compact object-list row.
+
+        Object listings are sent as rows rather than dicts so that key names
+        are not repeated for every object on the wire, and the instance is
+        built with positional arguments.
+
+        Args:
+            row: (name, label, type_id, children, parents, visibility).
+
+        Returns:
+            ObjectInfo with no properties or shape information.
+        """
+        name, label, type_id, children, parents, visibility = row
+        return cls(name, label, type_id, {}, None, children, parents, visibility)
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, Sequence[Any]]) -> list["ObjectInfo"]:
+        """Build ObjectInfos from a column-wise object listing.
+
+        Bulk listings send one list per field instead of one row per object,
+        see FreecadBridge.get_objects_bulk().
+
+        Args:
+            columns: Parallel "names", "labels", "type_ids", "children",
+                "parents" and "visibility" lists, plus "shapes" when shape
+                information was requested.
+
+        Returns:
+            One ObjectInfo per object, without properties.
+        """
+        names = columns["names"]
+        shapes = columns.get("shapes") or [None] * len(names)
+        return [
+            cls(name, label, type_id, {}, shape, children, parents, visibility)
+            for name, label, type_id, shape, children, parents, visibility in zip(
+                names,
+                columns["labels"],
+                columns["type_ids"],
+                shapes,
+                columns["children"],
+                columns["parents"],
+                columns["visibility"],
+                strict=True,
+            )
+        ]
+
+
+@dataclass(slots=True, frozen=True)
 class ShapeInfo:
     """Detailed shape geometry information.
 
@@ -146,7 +270,7 @@ class ShapeInfo:
     face_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ScreenshotResult:
     """Result of a screenshot capture.
 
@@ -169,7 +293,7 @@ class ScreenshotResult:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MacroInfo:
     """Information about a FreeCAD macro.
 
@@ -186,7 +310,7 @@ class MacroInfo:
     is_system: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkbenchInfo:
     """Information about a FreeCAD workbench.
 
@@ -203,7 +327,7 @@ class WorkbenchInfo:
     is_active: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionStatus:
     """Status of the FreeCAD connection.
 
@@ -224,6 +348,398 @@ class ConnectionStatus:
     error: str | None = None
 
 
+# Maximum number of compiled code objects kept by compile_code(), and the
+# longest source it keeps. Longer code is usually one-off user scripts, which
+# would only push the small generated snippets out of the cache.
+_CODE_CACHE_SIZE = 256
+_CODE_CACHE_MAX_SOURCE = 8192
+
+
+@functools.lru_cache(maxsize=_CODE_CACHE_SIZE)
+def _compile_cached(code: str) -> CodeType:
+    """Compile code through the LRU cache."""
+    return compile(code, "<mcp>", "exec")
+
+
+def compile_code(code: str) -> CodeType:
+    """Compile a snippet for exec(), reusing the result for repeated source.
+
+    Tools resend the same generated snippets (property queries, object
+    listings) over and over, so compiled code objects are kept in a small
+    LRU keyed by the source string itself. Code objects are immutable, so
+    sharing one between calls is safe.
+
+    Args:
+        code: Python source to compile.
+
+    Returns:
+        The compiled code object.
+
+    Raises:
+        SyntaxError: If the source does not compile. Failures are not cached.
+    """
+    if len(code) > _CODE_CACHE_MAX_SOURCE:
+        return compile(code, "<mcp>", "exec")
+    return _compile_cached(code)
+
+
+# Code for FreecadBridge.get_objects_bulk(). Reads its arguments from the
+# _doc_name, _include_shape and _names globals and answers column-wise, see
+# ObjectInfo.from_columns().
+_GET_OBJECTS_BULK_CODE = """
+doc = FreeCAD.ActiveDocument if _doc_name is None else FreeCAD.getDocument(_doc_name)
+if doc is None:
+    raise ValueError("No document found")
+
+names = []
+labels = []
+type_ids = []
+children = []
+parents = []
+visibility = []
+shapes = []
+if _names is None:
+    objects = doc.Objects
+else:
+    objects = [obj for obj in map(doc.getObject, _names) if obj is not None]
+
+# Which optional attributes objects have, looked up once per TypeId
+attrs_by_type = {}
+for obj in objects:
+    type_id = obj.TypeId
+    attrs = attrs_by_type.get(type_id)
+    if attrs is None:
+        attrs = attrs_by_type[type_id] = (
+            hasattr(obj, "OutList"),
+            hasattr(obj, "InList"),
+            hasattr(obj, "ViewObject"),
+            hasattr(obj, "Shape"),
+        )
+    has_out_list, has_in_list, has_view, has_shape = attrs
+    view = obj.ViewObject if has_view else None
+    names.append(obj.Name)
+    labels.append(obj.Label)
+    type_ids.append(type_id)
+    children.append([c.Name for c in obj.OutList] if has_out_list else [])
+    parents.append([p.Name for p in obj.InList] if has_in_list else [])
+    visibility.append(view.Visibility if view else True)
+    if _include_shape:
+        shape_info = None
+        if has_shape:
+            shape = obj.Shape
+            shape_info = {
+                "type": shape.ShapeType,
+                "volume": shape.Volume if hasattr(shape, "Volume") else None,
+                "area": shape.Area if hasattr(shape, "Area") else None,
+                "is_valid": shape.isValid(),
+            }
+        shapes.append(shape_info)
+
+_result_ = {
+    "names": names,
+    "labels": labels,
+    "type_ids": type_ids,
+    "children": children,
+    "parents": parents,
+    "visibility": visibility,
+    "shapes": shapes if _include_shape else None,
+}
+"""
+
+# Reads one object with its properties and shape summary, for every bridge's
+# get_object(). Arguments:
+# _doc_name (None for the active document) and _obj_name.
+GET_OBJECT_CODE = """
+doc = FreeCAD.ActiveDocument if _doc_name is None else FreeCAD.getDocument(_doc_name)
+if doc is None:
+    raise ValueError("No document found")
+
+obj = doc.getObject(_obj_name)
+if obj is None:
+    raise ValueError(f"Object not found: {_obj_name!r}")
+
+# Whether values of a type are sent as they are (builtins) or as str(),
+# decided once per type rather than once per property
+plain_by_type = {int: True, float: True, str: True, bool: True, type(None): True}
+props = {}
+for prop in obj.PropertiesList:
+    try:
+        val = getattr(obj, prop)
+        val_type = type(val)
+        plain = plain_by_type.get(val_type)
+        if plain is None:
+            plain = plain_by_type[val_type] = val_type.__module__ == "builtins"
+        props[prop] = val if plain else str(val)
+    except Exception:
+        props[prop] = "<unreadable>"
+
+shape_info = None
+if hasattr(obj, "Shape"):
+    shape = obj.Shape
+    shape_info = {
+        "shape_type": shape.ShapeType,
+        "volume": shape.Volume if hasattr(shape, "Volume") else None,
+        "area": shape.Area if hasattr(shape, "Area") else None,
+        "is_valid": shape.isValid(),
+        "is_closed": shape.isClosed() if hasattr(shape, "isClosed") else False,
+        "vertex_count": len(shape.Vertexes) if hasattr(shape, "Vertexes") else 0,
+        "edge_count": len(shape.Edges) if hasattr(shape, "Edges") else 0,
+        "face_count": len(shape.Faces) if hasattr(shape, "Faces") else 0,
+    }
+
+view = getattr(obj, "ViewObject", None)
+_result_ = {
+    "name": obj.Name,
+    "label": obj.Label,
+    "type_id": obj.TypeId,
+    "properties": props,
+    "shape_info": shape_info,
+    "children": [c.Name for c in obj.OutList] if hasattr(obj, "OutList") else [],
+    "parents": [p.Name for p in obj.InList] if hasattr(obj, "InList") else [],
+    "visibility": view.Visibility if view else True,
+}
+"""
+
+# Code for FreecadBridge._list_and_maybe_activate(). Activates the workbench
+# named by the _activate global, if any, then lists the workbenches, so a
+# list-then-activate needs one execution. Each workbench is a (name, label,
+# icon, is_active) row in WorkbenchInfo field order. Without a GUI nothing is
+# activated and workbenches is None.
+_WORKBENCHES_CODE = """
+activated = False
+workbenches = None
+if FreeCAD.GuiUp:
+    if _activate is not None:
+        try:
+            FreeCADGui.activateWorkbench(_activate)
+        except Exception as e:
+            raise ValueError(f"Failed to activate workbench: {e}")
+        activated = True
+
+    active_wb = FreeCADGui.activeWorkbench()
+    active_name = active_wb.__class__.__name__ if active_wb else None
+
+    workbenches = []
+    for name in FreeCADGui.listWorkbenches():
+        wb = FreeCADGui.getWorkbench(name)
+        workbenches.append((
+            name,
+            getattr(wb, "MenuText", name),
+            getattr(wb, "Icon", ""),
+            name == active_name,
+        ))
+
+_result_ = {"workbenches": workbenches, "activated": activated}
+"""
+
+# Code for the name of the active workbench, or None without a GUI
+_ACTIVE_WORKBENCH_CODE = """
+active_wb = FreeCADGui.activeWorkbench() if FreeCAD.GuiUp else None
+_result_ = active_wb.__class__.__name__ if active_wb else None
+"""
+
+# Code for FreecadBridge.get_workbenches_bulk(). Lists only the workbenches
+# named by the _names global, as _WORKBENCHES_CODE rows, skipping names that
+# are not installed. None without a GUI.
+_GET_WORKBENCHES_BULK_CODE = """
+_result_ = None
+if FreeCAD.GuiUp:
+    active_wb = FreeCADGui.activeWorkbench()
+    active_name = active_wb.__class__.__name__ if active_wb else None
+    installed = FreeCADGui.listWorkbenches()
+
+    _result_ = []
+    for name in _names:
+        wb = installed.get(name)
+        if wb is not None:
+            _result_.append((
+                name,
+                getattr(wb, "MenuText", name),
+                getattr(wb, "Icon", ""),
+                name == active_name,
+            ))
+"""
+
+# Read cache key under which the last seen active workbench name is kept
+_ACTIVE_WORKBENCH_KEY = ("active_workbench",)
+
+# Maximum number of cached reads kept per bridge
+_READ_CACHE_SIZE = 128
+
+# True while a cached or invalidating bridge method is running, so the calls
+# it makes internally (e.g. get_object() -> execute_python()) are not cached
+# or treated as changes themselves
+_in_bridge_call: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "_in_bridge_call", default=False
+)
+
+
+class _ReadCache:
+    """LRU cache of bridge read results, tagged with FreeCAD's change counter.
+
+    An entry is only used while FreeCAD reports the change count it was
+    read at. generation is bumped on every invalidation by this bridge. A
+    read records the generation it started in and is only stored if nothing
+    invalidated the cache while it was in flight.
+    """
+
+    def __init__(self) -> None:
+        self.generation = 0
+        self._entries: OrderedDict[tuple[Any, ...], tuple[int, Any]] = OrderedDict()
+
+    def lookup(self, key: tuple[Any, ...], changes: int) -> tuple[bool, Any]:
+        """Return (True, value) for an entry read at changes, else (False, None)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        read_at, value = entry
+        if read_at != changes:
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def store(
+        self, key: tuple[Any, ...], value: Any, changes: int, generation: int
+    ) -> None:
+        """Cache value unless the cache was invalidated since generation."""
+        if generation != self.generation:
+            return
+        self._entries[key] = (changes, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > _READ_CACHE_SIZE:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every entry."""
+        self.generation += 1
+        self._entries.clear()
+
+
+def cached_read(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorate a bridge read method so its results go through the read cache.
+
+    Results are reused while the bridge's change counter stays the same
+    (see FreecadBridge._change_count()); bridges without one never cache.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self: "FreecadBridge", *args: Any, **kwargs: Any) -> Any:
+        # Batched reads must reach FreeCAD through their own batch
+        if _in_bridge_call.get() or not self.read_cache_enabled or self._in_batch():
+            return await method(self, *args, **kwargs)
+
+        cache = self._get_read_cache()
+        generation = cache.generation
+        # Asked before reading, so a change made while the read is in
+        # flight leaves the entry tagged with an outdated count
+        changes = await self._change_count()
+        if changes is None:
+            return await method(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        # Lists (e.g. of object names) become tuples to be hashable
+        key = (
+            method.__name__,
+            *(
+                tuple(value) if isinstance(value, list) else value
+                for value in list(bound.arguments.values())[1:]
+            ),
+        )
+        hit, value = cache.lookup(key, changes)
+        if not hit:
+            token = _in_bridge_call.set(True)
+            try:
+                value = await method(self, *args, **kwargs)
+            finally:
+                _in_bridge_call.reset(token)
+            cache.store(key, value, changes, generation)
+        # ObjectInfo and its properties are mutable: every caller gets its
+        # own copy so none can change what the others are given
+        return copy.deepcopy(value)
+
+    return wrapper
+
+
+def invalidates_reads(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorate a bridge method that can change documents.
+
+    Calling it drops every cached read, and the reads it makes itself are
+    not cached.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: "FreecadBridge", *args: Any, **kwargs: Any) -> Any:
+        if _in_bridge_call.get():
+            return await method(self, *args, **kwargs)
+
+        cache = self._get_read_cache()
+        cache.invalidate()
+        token = _in_bridge_call.set(True)
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            _in_bridge_call.reset(token)
+            # Reads that started while this call was running may have seen
+            # the state from before it finished
+            cache.invalidate()
+
+    return wrapper
+
+
+def cached_version_info(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorate get_freecad_version() so its answer is kept per connection."""
+
+    @functools.wraps(method)
+    async def wrapper(self: "FreecadBridge") -> dict[str, Any]:
+        info = self._cached_instance_info()
+        if info is None:
+            info = await method(self)
+            self._remember_instance_info(info)
+            return info
+        return dict(info)
+
+    return wrapper
+
+
+def gui_from_version_info(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorate is_gui_available() to answer from get_freecad_version()."""
+
+    @functools.wraps(method)
+    async def wrapper(self: "FreecadBridge") -> bool:
+        if self.instance_info_ttl > 0:
+            info = await self.get_freecad_version()
+            if info.get("version") != "unknown":
+                return bool(info.get("gui_available"))
+        return await method(self)
+
+    return wrapper
+
+
+def resets_instance_info(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorate connect()/disconnect() so cached instance information is dropped.
+
+    They may leave the bridge talking to a different FreeCAD process.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: "FreecadBridge", *args: Any, **kwargs: Any) -> Any:
+        self._instance_info = None
+        self._wb_cache = None
+        self._activation_failures = None
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            self._instance_info = None
+            self._wb_cache = None
+            self._activation_failures = None
+            self.invalidate_read_cache()
+
+    return wrapper
+
+
 class FreecadBridge(ABC):
     """Abstract base class for FreeCAD bridges.
 
@@ -235,8 +751,145 @@ class FreecadBridge(ABC):
         GUI operations must be executed on the main thread. Implementations
         should use queue-based communication for thread safety (learned from
         neka-nat implementation).
+
+    Read Cache:
+        Reads decorated with @cached_read (get_object(), get_objects(),
+        get_objects_bulk()) are reused while FreeCAD's change counter (see
+        _change_count()) stays the same, which absorbs the repeated
+        identical reads of a burst of tool calls. The counter moves on any
+        document change or workbench switch, including those made in the
+        FreeCAD GUI. Calls that can change documents are decorated with
+        @invalidates_reads (execute_python(), create_object(), ...) and
+        also empty the cache. Only bridges that can read the counter
+        without a round-trip to FreeCAD (the embedded one) cache; for the
+        others, asking for it would cost as much as the read it saves. Set
+        read_cache_enabled to False to disable caching, or call
+        invalidate_read_cache(). Callers get copies of the cached results.
+        The name of the active workbench is kept the same way, and
+        activate_workbench() does nothing for the workbench it names.
+
+        get_freecad_version() describes the FreeCAD process itself, so its
+        answer is kept for instance_info_ttl seconds (@cached_version_info)
+        and only dropped by connect() and disconnect()
+        (@resets_instance_info). is_gui_available() answers from it
+        (@gui_from_version_info).
+        The lifetime bounds how long a FreeCAD restarted behind a still
+        connected XML-RPC bridge is misreported.
     """
 
+    # Whether get_object()/get_objects() results are cached at all
+    read_cache_enabled: bool = True
+
+    # Seconds the get_freecad_version() answer stays valid
+    instance_info_ttl: float = 60.0
+
+    # Workbenches reported when FreeCAD runs without a GUI
+    _headless_workbenches: ClassVar[tuple[str, ...]] = (
+        "StartWorkbench",
+        "PartWorkbench",
+        "PartDesignWorkbench",
+        "DraftWorkbench",
+        "SketcherWorkbench",
+        "MeshWorkbench",
+    )
+
+    # Created lazily so subclasses need not call super().__init__()
+    _read_cache: _ReadCache | None = None
+
+    # (expiry, get_freecad_version() answer) for the current connection
+    _instance_info: tuple[float, dict[str, Any]] | None = None
+
+    # Workbenches of the current connection, listed on first use
+    _wb_cache: list[WorkbenchInfo] | None = None
+
+    # The latest get_workbenches() query, shared by concurrent callers
+    _inflight_wb: "asyncio.Task[list[WorkbenchInfo]] | None" = None
+
+    # Error message by name for workbenches that failed to activate
+    _activation_failures: dict[str, str] | None = None
+
+    # Public coroutine methods by name, built per subclass so BridgeBatch
+    # can look them up without going through the instance
+    _dispatch: ClassVar[dict[str, Callable[..., Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the subclass's method table for BridgeBatch."""
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {
+            name: method
+            for name in dir(cls)
+            if not name.startswith("_")
+            and inspect.iscoroutinefunction(method := getattr(cls, name))
+        }
+
+    def _get_read_cache(self) -> _ReadCache:
+        """Return this bridge's read cache, creating it on first use."""
+        if self._read_cache is None:
+            self._read_cache = _ReadCache()
+        return self._read_cache
+
+    def invalidate_read_cache(self) -> None:
+        """Forget cached reads."""
+        self._get_read_cache().invalidate()
+
+    async def _change_count(self) -> int | None:
+        """Return FreeCAD's change counter, without going through its GUI queue.
+
+        The counter grows whenever a document, an object or the active
+        workbench changes. Bridges that can read it in-process override
+        this method.
+
+        Returns:
+            The current count, or None if it cannot be read, in which case
+            nothing is cached.
+        """
+        return None
+
+    def _cached_instance_info(self) -> dict[str, Any] | None:
+        """Return the live cached get_freecad_version() answer, if any."""
+        if self._instance_info is None:
+            return None
+        expires, info = self._instance_info
+        if expires < time.monotonic():
+            self._instance_info = None
+            return None
+        return info
+
+    def _remember_instance_info(self, info: dict[str, Any]) -> None:
+        """Cache a get_freecad_version() answer for instance_info_ttl seconds."""
+        # The fallback answer for a failed query must not stick
+        if self.instance_info_ttl > 0 and info.get("version") != "unknown":
+            self._instance_info = (
+                time.monotonic() + self.instance_info_ttl,
+                dict(info),
+            )
+
+    async def _probe_status(self) -> tuple[float, dict[str, Any]]:
+        """Ping FreeCAD and get its version information in one round-trip.
+
+        While the get_freecad_version() answer is cached only a ping is
+        sent. Otherwise the version query itself is timed as the ping.
+
+        Returns:
+            Round-trip time in milliseconds and the version information.
+
+        Raises:
+            ConnectionError: If FreeCAD did not answer.
+        """
+        info = self._cached_instance_info()
+        if info is not None:
+            return await self.ping(), dict(info)
+
+        start = time.perf_counter()
+        info = await self.get_freecad_version()
+        elapsed = (time.perf_counter() - start) * 1000
+
+        if info.get("version") == "unknown":
+            msg = "Ping failed"
+            raise ConnectionError(msg)
+
+        return elapsed, info
+
     @abstractmethod
     async def connect(self) -> None:
         """Establish connection to FreeCAD.
@@ -302,6 +955,93 @@ class FreecadBridge(ABC):
             ExecutionResult with success status, output, and any errors.
         """
 
+    async def execute_python_many(
+        self,
+        codes: list[str],
+        timeout_ms: int = 30000,
+    ) -> list[ExecutionResult]:
+        """Execute several Python snippets in order.
+
+        The default implementation runs them one at a time through
+        execute_python(). Bridges override it to send all of them to
+        FreeCAD in a single request.
+
+        Args:
+            codes: Python code snippets to execute.
+            timeout_ms: Maximum execution time per snippet in milliseconds.
+
+        Returns:
+            One ExecutionResult per snippet, in the same order as codes.
+        """
+        return [await self.execute_python(code, timeout_ms) for code in codes]
+
+    async def _execute_template(
+        self,
+        template: str,
+        params: dict[str, Any] | None = None,
+        timeout_ms: int = 30000,
+    ) -> ExecutionResult:
+        """Execute one of the bridge's own constant code snippets.
+
+        The arguments are written out as assignments in front of the
+        template. Bridges that run code in-process override this to pass
+        them as globals instead.
+
+        Args:
+            template: Template source reading its arguments as globals.
+            params: Argument values by global name.
+            timeout_ms: Maximum execution time in milliseconds.
+
+        Returns:
+            ExecutionResult with execution outcome.
+        """
+        assignments = "".join(
+            f"{name} = {value!r}\n" for name, value in (params or {}).items()
+        )
+        return await self.execute_python(assignments + template, timeout_ms)
+
+    def batch(self) -> "BridgeBatch":
+        """Queue bridge calls so they reach FreeCAD in as few requests as possible.
+
+        Returns:
+            A BridgeBatch to use as an async context manager.
+
+        Example:
+            Fetch two objects with a single round-trip::
+
+                async with bridge.batch() as batch:
+                    box = batch.get_object("Box")
+                    cylinder = batch.get_object("Cylinder")
+                print(box.result().label, cylinder.result().label)
+        """
+        return BridgeBatch(self)
+
+    def _queue_for_batch(
+        self, code: str, timeout_ms: int
+    ) -> "asyncio.Future[ExecutionResult] | None":
+        """Hand code to the batch being run by this task, if there is one.
+
+        Bridges call this at the start of execute_python() and await the
+        returned future instead of sending the code themselves.
+
+        Args:
+            code: Python code to execute.
+            timeout_ms: Maximum execution time in milliseconds.
+
+        Returns:
+            A future for the execution result, or None when no batch of
+            this bridge is running.
+        """
+        batcher = _current_batcher.get()
+        if batcher is None or batcher.bridge is not self:
+            return None
+        return batcher.submit(code, timeout_ms)
+
+    def _in_batch(self) -> bool:
+        """Return whether execute_python() calls of this task are batched."""
+        batcher = _current_batcher.get()
+        return batcher is not None and batcher.bridge is self
+
     # =========================================================================
     # Document Management
     # =========================================================================
@@ -393,6 +1133,42 @@ class FreecadBridge(ABC):
             List of ObjectInfo for each object.
         """
 
+    @cached_read
+    async def get_objects_bulk(
+        self,
+        doc_name: str | None = None,
+        include_shape: bool = False,
+        names: list[str] | None = None,
+    ) -> list[ObjectInfo]:
+        """Get a document's objects, optionally with their shape details.
+
+        Unlike get_objects() followed by get_object() per object, this is a
+        single execution however many objects there are. The answer comes
+        back column-wise, one list per field, so field names are not
+        repeated for every object.
+
+        Args:
+            doc_name: Document name (uses active if None).
+            include_shape: Whether to fill in each object's shape_info.
+            names: Names of the objects to get, or None for all of them.
+                Names with no object in the document are left out.
+
+        Returns:
+            List of ObjectInfo for each object, without properties.
+        """
+        result = await self._execute_template(
+            _GET_OBJECTS_BULK_CODE,
+            {
+                "_doc_name": doc_name,
+                "_include_shape": include_shape,
+                "_names": None if names is None else list(names),
+            },
+        )
+
+        if result.success and result.result:
+            return ObjectInfo.from_columns(result.result)
+        return []
+
     @abstractmethod
     async def get_object(
         self,
@@ -506,6 +1282,35 @@ class FreecadBridge(ABC):
             doc_name: Document name (uses active if None).
         """
 
+    async def get_screenshots(
+        self,
+        view_angles: Sequence[ViewAngle],
+        width: int = 800,
+        height: int = 600,
+        doc_name: str | None = None,
+    ) -> list[ScreenshotResult]:
+        """Capture the 3D view from several angles.
+
+        The captures are queued on a batch, so the code for all of them
+        reaches FreeCAD in one request. FreeCAD still renders them one
+        after another on its main thread.
+
+        Args:
+            view_angles: View angles to capture, in order.
+            width: Image width in pixels.
+            height: Image height in pixels.
+            doc_name: Document name (uses active if None).
+
+        Returns:
+            One ScreenshotResult per view angle, in the same order.
+        """
+        async with self.batch() as batch:
+            screenshots = [
+                batch.get_screenshot(view_angle, width, height, doc_name)
+                for view_angle in view_angles
+            ]
+        return [screenshot.result() for screenshot in screenshots]
+
     # =========================================================================
     # Macros
     # =========================================================================
@@ -556,24 +1361,204 @@ class FreecadBridge(ABC):
     # Workbenches
     # =========================================================================
 
-    @abstractmethod
+    async def _list_and_maybe_activate(self, activate: str | None) -> dict[str, Any]:
+        """Optionally activate a workbench, then list the workbenches.
+
+        Both happen in one execution of _WORKBENCHES_CODE.
+
+        Args:
+            activate: Workbench internal name to activate first, or None
+                to only list.
+
+        Returns:
+            Dictionary with workbenches (list of (name, label, icon,
+            is_active) rows, or None without a GUI) and activated (whether
+            a workbench was activated).
+
+        Raises:
+            ValueError: If the query or the activation failed.
+        """
+        result = await self._execute_template(
+            _WORKBENCHES_CODE, {"_activate": activate}
+        )
+
+        if not result.success:
+            error_msg = result.error_traceback or "Workbench query failed"
+            # Only the activation raises ValueError; timeouts and lost
+            # connections are worth retrying
+            if activate is not None and result.error_type == "ValueError":
+                if self._activation_failures is None:
+                    self._activation_failures = {}
+                self._activation_failures[activate] = error_msg
+            raise ValueError(error_msg)
+        return result.result
+
+    def _workbench_infos(self, rows: list[Sequence[Any]] | None) -> list[WorkbenchInfo]:
+        """Build WorkbenchInfo objects from listed workbenches.
+
+        Args:
+            rows: The (name, label, icon, is_active) rows of a
+                _list_and_maybe_activate() answer, or None without a GUI.
+
+        Returns:
+            List of WorkbenchInfo, the common workbenches if rows is None.
+        """
+        if rows is None:
+            return [
+                WorkbenchInfo(name=name, label=name.replace("Workbench", ""))
+                for name in self._headless_workbenches
+            ]
+        return [WorkbenchInfo(*row) for row in rows]
+
+    def _remember_active_workbench(
+        self, workbenches: list[WorkbenchInfo], changes: int | None
+    ) -> None:
+        """Keep the name of the active workbench in the read cache.
+
+        Args:
+            workbenches: The workbenches as just listed.
+            changes: FreeCAD's change count from before they were listed.
+        """
+        if not self.read_cache_enabled or changes is None:
+            return
+        active = next((wb.name for wb in workbenches if wb.is_active), None)
+        cache = self._get_read_cache()
+        cache.store(_ACTIVE_WORKBENCH_KEY, active, changes, cache.generation)
+
+    def _store_workbenches(
+        self, rows: list[Sequence[Any]] | None, changes: int | None
+    ) -> None:
+        """Cache listed workbenches and remember the active one.
+
+        Failed activations are forgotten when the set of workbench names
+        changes, since a missing workbench may have been installed since.
+
+        Args:
+            rows: The workbenches of a _list_and_maybe_activate() answer.
+            changes: FreeCAD's change count the answer reflects.
+        """
+        workbenches = self._workbench_infos(rows)
+        if self._wb_cache is None or {wb.name for wb in workbenches} != {
+            wb.name for wb in self._wb_cache
+        }:
+            self._activation_failures = None
+        self._wb_cache = workbenches
+        self._remember_active_workbench(workbenches, changes)
+
+    def _known_headless(self) -> bool:
+        """Return True if the cached instance info says there is no GUI."""
+        info = self._cached_instance_info()
+        return info is not None and not info.get("gui_available")
+
     async def get_workbenches(self) -> list[WorkbenchInfo]:
         """Get list of available workbenches.
 
+        Without a GUI a fixed list of common workbenches is returned, with
+        no query at all once the cached instance info says so. The
+        workbenches are listed once per connection; later calls only ask
+        FreeCAD which one is active. Concurrent callers share one query.
+
         Returns:
             List of WorkbenchInfo for each workbench.
         """
+        if self._known_headless():
+            return self._workbench_infos(None)
+
+        # Batched calls must reach FreeCAD through their own batch
+        if self._in_batch():
+            return await self._query_workbenches()
+
+        if self._inflight_wb is None or self._inflight_wb.done():
+            self._inflight_wb = asyncio.ensure_future(self._query_workbenches())
+        # Shielded so one caller being cancelled doesn't fail the others
+        workbenches = await asyncio.shield(self._inflight_wb)
+        return [replace(wb) for wb in workbenches]
+
+    async def _query_workbenches(self) -> list[WorkbenchInfo]:
+        """Ask FreeCAD for the workbenches, or only the active one if cached.
+
+        Returns:
+            List of WorkbenchInfo for each workbench, empty on failure.
+        """
+        changes = await self._change_count() if self.read_cache_enabled else None
+        if self._wb_cache is None:
+            try:
+                answer = await self._list_and_maybe_activate(None)
+            except ValueError:
+                return []
+            self._store_workbenches(answer["workbenches"], changes)
+            return self._wb_cache or []
+
+        result = await self._execute_template(_ACTIVE_WORKBENCH_CODE)
+        if not result.success:
+            return []
+        workbenches = [
+            replace(wb, is_active=wb.name == result.result) for wb in self._wb_cache
+        ]
+        self._remember_active_workbench(workbenches, changes)
+        return workbenches
+
+    async def get_workbenches_bulk(self, names: list[str]) -> list[WorkbenchInfo]:
+        """Get information on some workbenches only, in one execution.
+
+        Once get_workbenches() has listed every workbench the answer is
+        picked from that list instead.
+
+        Args:
+            names: Workbench internal names.
+
+        Returns:
+            List of WorkbenchInfo in the order of names, leaving out
+            workbenches that are not installed.
+        """
+        if self._wb_cache is not None or self._known_headless():
+            workbenches = await self.get_workbenches()
+        else:
+            result = await self._execute_template(
+                _GET_WORKBENCHES_BULK_CODE, {"_names": list(names)}
+            )
+            if not result.success:
+                return []
+            if result.result is not None:
+                return self._workbench_infos(result.result)
+            workbenches = self._workbench_infos(None)
+
+        by_name = {wb.name: wb for wb in workbenches}
+        return [by_name[name] for name in names if name in by_name]
 
-    @abstractmethod
     async def activate_workbench(self, workbench_name: str) -> None:
         """Activate a workbench.
 
+        Does nothing without a GUI, and sends nothing to FreeCAD if the
+        cached instance info already says there is none or the workbench
+        was active when last seen (see Read Cache). A workbench that
+        failed to activate fails again without a round-trip until the
+        list of workbenches changes or the bridge reconnects.
+
         Args:
             workbench_name: Workbench internal name.
 
         Raises:
             ValueError: If workbench not found.
         """
+        if self._known_headless():
+            return
+
+        changes = await self._change_count() if self.read_cache_enabled else None
+        if changes is not None:
+            hit, active = self._get_read_cache().lookup(_ACTIVE_WORKBENCH_KEY, changes)
+            if hit and active == workbench_name:
+                return
+
+        failure = (self._activation_failures or {}).get(workbench_name)
+        if failure is not None:
+            raise ValueError(failure)
+
+        answer = await self._list_and_maybe_activate(workbench_name)
+        # Activating moves the counter itself, so the answer is tagged with
+        # the count from after it
+        changes = await self._change_count() if self.read_cache_enabled else None
+        self._store_workbenches(answer["workbenches"], changes)
 
     # =========================================================================
     # Version and Environment
@@ -609,3 +1594,136 @@ class FreecadBridge(ABC):
         Returns:
             List of console output lines, most recent last.
         """
+
+
+class _ExecutionBatcher:
+    """Collects execute_python() calls made while a BridgeBatch runs.
+
+    Calls made in the same event-loop iteration are sent together through
+    the bridge's execute_python_many().
+    """
+
+    def __init__(self, bridge: FreecadBridge) -> None:
+        self.bridge = bridge
+        self._pending: list[tuple[str, int, asyncio.Future[ExecutionResult]]] = []
+        self._sends: set[asyncio.Task[None]] = set()
+
+    def submit(self, code: str, timeout_ms: int) -> "asyncio.Future[ExecutionResult]":
+        """Queue code for the next send and return a future for its result."""
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            # Runs after every call already scheduled for this iteration has
+            # had the chance to queue its code.
+            loop.call_soon(self._flush)
+        future: asyncio.Future[ExecutionResult] = loop.create_future()
+        self._pending.append((code, timeout_ms, future))
+        return future
+
+    def _flush(self) -> None:
+        """Send everything queued so far as one execute_python_many() call."""
+        pending, self._pending = self._pending, []
+        # An empty context so the bridge sends the code instead of queueing it
+        # again.
+        task = asyncio.get_running_loop().create_task(
+            self._send(pending), context=contextvars.Context()
+        )
+        self._sends.add(task)
+        task.add_done_callback(self._sends.discard)
+
+    async def _send(
+        self, pending: list[tuple[str, int, asyncio.Future[ExecutionResult]]]
+    ) -> None:
+        """Execute queued code and resolve the matching futures."""
+        codes = [code for code, _, _ in pending]
+        timeout_ms = max(timeout for _, timeout, _ in pending)
+        try:
+            results = await self.bridge.execute_python_many(codes, timeout_ms)
+        except Exception as e:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), result in zip(pending, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+
+# The batcher of the BridgeBatch whose calls the current task is running
+_current_batcher: contextvars.ContextVar[_ExecutionBatcher | None] = (
+    contextvars.ContextVar("_current_batcher", default=None)
+)
+
+
+class BridgeBatch:
+    """Bridge calls queued to be sent to FreeCAD together.
+
+    Created by FreecadBridge.batch(). Calling a bridge method on the batch
+    queues it and returns a future for its result. When the ``async with``
+    block exits, the queued calls run concurrently and the Python code they
+    execute is sent through execute_python_many(), so N calls cost one
+    round-trip (or one per step for methods that need several).
+
+    If the block raises, the queued calls are cancelled instead.
+    """
+
+    def __init__(self, bridge: FreecadBridge) -> None:
+        """Initialize an empty batch.
+
+        Args:
+            bridge: Bridge the queued calls are made on.
+        """
+        self._bridge = bridge
+        self._calls: list[
+            tuple[
+                Callable[..., Any], tuple[Any, ...], dict[str, Any], asyncio.Future[Any]
+            ]
+        ] = []
+
+    def __getattr__(self, name: str) -> Callable[..., "asyncio.Future[Any]"]:
+        """Return a function that queues a call to the bridge method ``name``."""
+        method = self._bridge._dispatch.get(name)
+        if method is None:
+            msg = f"{name!r} is not a bridge method that can be batched"
+            raise AttributeError(msg)
+        bridge = self._bridge
+
+        def queue_call(*args: Any, **kwargs: Any) -> "asyncio.Future[Any]":
+            future = asyncio.get_running_loop().create_future()
+            self._calls.append((method, (bridge, *args), kwargs, future))
+            return future
+
+        return queue_call
+
+    async def __aenter__(self) -> "BridgeBatch":
+        """Start queueing calls."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Run the queued calls, or cancel them if the block raised."""
+        calls, self._calls = self._calls, []
+        if exc_type is not None:
+            for *_, future in calls:
+                future.cancel()
+            return
+
+        token = _current_batcher.set(_ExecutionBatcher(self._bridge))
+        try:
+            results = await asyncio.gather(
+                *(method(*args, **kwargs) for method, args, kwargs, _ in calls),
+                return_exceptions=True,
+            )
+        finally:
+            _current_batcher.reset(token)
+
+        for (*_, future), result in zip(calls, results, strict=True):
+            if isinstance(result, asyncio.CancelledError):
+                future.cancel()
+            elif isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
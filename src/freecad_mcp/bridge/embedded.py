@@ -10,16 +10,19 @@ Based on learnings from competitive analysis:
 """
 
 import asyncio
-import io
+import functools
 import os
 import sys
 import time
+import traceback
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from typing import Any
 
 from freecad_mcp.bridge.base import (
+    GET_OBJECT_CODE,
+    VIEW_METHODS,
     ConnectionStatus,
     DocumentInfo,
     ExecutionResult,
@@ -28,9 +31,292 @@ from freecad_mcp.bridge.base import (
     ObjectInfo,
     ScreenshotResult,
     ViewAngle,
-    WorkbenchInfo,
+    cached_read,
+    cached_version_info,
+    compile_code,
+    gui_from_version_info,
+    invalidates_reads,
+    resets_instance_info,
 )
 
+# Code templates for EmbeddedBridge._execute_template(). Arguments arrive as
+# globals named after the method parameters with a leading underscore, so the
+# source never changes and each template is compiled only once.
+_CREATE_DOCUMENT_CODE = """
+doc = FreeCAD.newDocument(_name)
+doc.Label = _label
+_result_ = {
+    "name": doc.Name,
+    "label": doc.Label,
+    "path": doc.FileName or None,
+    "objects": [],
+    "is_modified": False,
+}
+"""
+
+_OPEN_DOCUMENT_CODE = """
+doc = FreeCAD.openDocument(_path)
+_result_ = {
+    "name": doc.Name,
+    "label": doc.Label,
+    "path": doc.FileName or None,
+    "objects": [obj.Name for obj in doc.Objects],
+    "is_modified": doc.Modified if hasattr(doc, "Modified") else False,
+}
+"""
+
+_SAVE_DOCUMENT_CODE = """
+doc = FreeCAD.ActiveDocument if _doc_name is None else FreeCAD.getDocument(_doc_name)
+if doc is None:
+    raise ValueError("No active document" if _doc_name is None else f"Document not found: {_doc_name!r}")
+
+save_path = _path or doc.FileName
+if not save_path:
+    raise ValueError("No path specified for new document")
+
+doc.saveAs(save_path)
+_result_ = save_path
+"""
+
+_CLOSE_DOCUMENT_CODE = """
+doc_name = _doc_name
+if doc_name is None:
+    doc = FreeCAD.ActiveDocument
+    if doc:
+        doc_name = doc.Name
+    else:
+        raise ValueError("No active document")
+
+FreeCAD.closeDocument(doc_name)
+_result_ = True
+"""
+
+_GET_DOCUMENTS_CODE = """
+if _active_only:
+    doc = FreeCAD.ActiveDocument
+    docs = [doc] if doc else []
+else:
+    docs = FreeCAD.listDocuments().values()
+
+_result_ = [
+    {
+        "name": doc.Name,
+        "path": doc.FileName or None,
+        "objects": [obj.Name for obj in doc.Objects],
+        "is_modified": doc.Modified if hasattr(doc, "Modified") else False,
+        "label": doc.Label,
+    }
+    for doc in docs
+]
+"""
+
+_GET_OBJECTS_CODE = """
+doc = FreeCAD.ActiveDocument if _doc_name is None else FreeCAD.getDocument(_doc_name)
+if doc is None:
+    raise ValueError("No document found")
+
+# One (name, label, type_id, children, parents, visibility) row per object,
+# see ObjectInfo.from_row()
+# Which optional attributes objects have, looked up once per TypeId
+attrs_by_type = {}
+objects = []
+for obj in doc.Objects:
+    type_id = obj.TypeId
+    attrs = attrs_by_type.get(type_id)
+    if attrs is None:
+        attrs = attrs_by_type[type_id] = (
+            hasattr(obj, "OutList"),
+            hasattr(obj, "InList"),
+            hasattr(obj, "ViewObject"),
+        )
+    has_out_list, has_in_list, has_view = attrs
+    view = obj.ViewObject if has_view else None
+    objects.append((
+        obj.Name,
+        obj.Label,
+        type_id,
+        [c.Name for c in obj.OutList] if has_out_list else [],
+        [p.Name for p in obj.InList] if has_in_list else [],
+        view.Visibility if view else True,
+    ))
+
+_result_ = objects
+"""
+
+_CREATE_OBJECT_CODE = """
+doc = FreeCAD.ActiveDocument if _doc_name is None else FreeCAD.getDocument(_doc_name)
+if doc is None:
+    raise ValueError("No document found")
+
+obj = doc.addObject(_type_id, _name or "")
+
+# Set properties
+for prop_name, prop_val in _properties.items():
+    if hasattr(obj, prop_name):
+        setattr(obj, prop_name, prop_val)
+
+doc.recompute()
+
+_result_ = {
+    "name": obj.Name,
+    "label": obj.Label,
+    "type_id": obj.TypeId,
+    "visibility": True,
+    "children": [c.Name for c in obj.OutList] if hasattr(obj, "OutList") else [],
+    "parents": [p.Name for p in obj.InList] if hasattr(obj, "InList") else [],
+}
+"""
+
+_EDIT_OBJECT_CODE = """
+doc = FreeCAD.ActiveDocument if _doc_name is None else FreeCAD.getDocument(_doc_name)
+if doc is None:
+    raise ValueError("No document found")
+
+obj = doc.getObject(_obj_name)
+if obj is None:
+    raise ValueError(f"Object not found: {_obj_name!r}")
+
+# Set properties
+for prop_name, prop_val in _properties.items():
+    if hasattr(obj, prop_name):
+        setattr(obj, prop_name, prop_val)
+
+doc.recompute()
+
+_result_ = {
+    "name": obj.Name,
+    "label": obj.Label,
+    "type_id": obj.TypeId,
+    "visibility": obj.ViewObject.Visibility if hasattr(obj, "ViewObject") and obj.ViewObject else True,
+    "children": [c.Name for c in obj.OutList] if hasattr(obj, "OutList") else [],
+    "parents": [p.Name for p in obj.InList] if hasattr(obj, "InList") else [],
+}
+"""
+
+_DELETE_OBJECT_CODE = """
+doc = FreeCAD.ActiveDocument if _doc_name is None else FreeCAD.getDocument(_doc_name)
+if doc is None:
+    raise ValueError("No document found")
+
+obj = doc.getObject(_obj_name)
+if obj is None:
+    raise ValueError(f"Object not found: {_obj_name!r}")
+
+doc.removeObject(_obj_name)
+_result_ = True
+"""
+
+_GET_SCREENSHOT_CODE = """
+import base64
+import tempfile
+import os
+
+doc = FreeCAD.ActiveDocument if _doc_name is None else FreeCAD.getDocument(_doc_name)
+if doc is None:
+    raise ValueError("No document found")
+
+view = FreeCADGui.ActiveDocument.ActiveView
+if view is None:
+    raise ValueError("No active view")
+
+# Set view angle
+getattr(view, _view_method)()
+
+# Save to temp file and read
+with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+    temp_path = f.name
+
+view.saveImage(temp_path, _width, _height, "Current")
+
+with open(temp_path, "rb") as f:
+    image_data = base64.b64encode(f.read()).decode("utf-8")
+
+os.unlink(temp_path)
+
+_result_ = {
+    "success": True,
+    "data": image_data,
+    "format": "png",
+    "width": _width,
+    "height": _height,
+}
+"""
+
+_SET_VIEW_CODE = """
+doc = FreeCAD.ActiveDocument if _doc_name is None else FreeCAD.getDocument(_doc_name)
+if doc is None:
+    raise ValueError("No document found")
+
+view = FreeCADGui.ActiveDocument.ActiveView
+if view is None:
+    raise ValueError("No active view")
+
+getattr(view, _view_method)()
+
+_result_ = True
+"""
+
+
+# Bytes read from the start of a macro file when looking for its description
+_MACRO_HEAD_BYTES = 2048
+
+
+class _ChangeCounter:
+    """FreeCAD document observer counting document and object changes.
+
+    Registered with FreeCAD.addDocumentObserver(); FreeCAD calls the slot
+    methods it finds on the observer, and each one bumps count.
+    """
+
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        """Start counting from zero."""
+        self.count = 0
+
+    def _changed(self, *_args: Any) -> None:
+        """Count one change."""
+        self.count += 1
+
+    slotCreatedDocument = _changed
+    slotDeletedDocument = _changed
+    slotRelabelDocument = _changed
+    slotActivateDocument = _changed
+    slotChangedDocument = _changed
+    slotRecomputedDocument = _changed
+    slotUndoDocument = _changed
+    slotRedoDocument = _changed
+    slotFinishSaveDocument = _changed
+    slotCreatedObject = _changed
+    slotDeletedObject = _changed
+    slotChangedObject = _changed
+
+
+class _OutputSink:
+    """Write-only text stream collecting output for an ExecutionResult.
+
+    Appending to a list is all redirect_stdout() needs, without the
+    buffer management of io.StringIO.
+    """
+
+    __slots__ = ("_parts",)
+
+    def __init__(self) -> None:
+        """Initialize an empty sink."""
+        self._parts: list[str] = []
+
+    def write(self, text: str) -> int:
+        """Collect text and return its length, like a text stream."""
+        self._parts.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        """Do nothing, since nothing is buffered."""
+
+    def getvalue(self) -> str:
+        """Return everything written so far."""
+        return "".join(self._parts)
+
 
 class EmbeddedBridge(FreecadBridge):
     """Bridge that runs FreeCAD embedded in the Robust MCP Server process.
@@ -42,6 +328,17 @@ class EmbeddedBridge(FreecadBridge):
         freecad_path: Optional path to FreeCAD's lib directory.
     """
 
+    # FreeCAD is imported into this process once, so its version and GUI
+    # state cannot change while the bridge is connected: keep them until
+    # disconnect() rather than for a limited time
+    instance_info_ttl = float("inf")
+
+    # Headless listings from the embedded bridge also include Spreadsheet
+    _headless_workbenches = (
+        *FreecadBridge._headless_workbenches,
+        "SpreadsheetWorkbench",
+    )
+
     def __init__(self, freecad_path: str | None = None) -> None:
         """Initialize the embedded bridge.
 
@@ -51,9 +348,16 @@ class EmbeddedBridge(FreecadBridge):
         """
         self._freecad_path = freecad_path
         self._fc_module: Any = None
+        # Globals every execution starts from, built on first use
+        self._base_globals: dict[str, Any] | None = None
         self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="freecad")
+        # Bound once; everything runs on this single worker thread
+        self._submit = self._executor.submit
         self._connected = False
+        # Counts FreeCAD changes for the read cache, registered on first use
+        self._changes: _ChangeCounter | None = None
 
+    @resets_instance_info
     async def connect(self) -> None:
         """Import and initialize FreeCAD.
 
@@ -63,11 +367,9 @@ class EmbeddedBridge(FreecadBridge):
         if self._freecad_path:
             sys.path.insert(0, self._freecad_path)
 
-        loop = asyncio.get_event_loop()
         try:
-            self._fc_module = await loop.run_in_executor(
-                self._executor,
-                self._import_freecad,
+            self._fc_module = await asyncio.wrap_future(
+                self._submit(self._import_freecad)
             )
             self._connected = True
         except ImportError as e:
@@ -80,15 +382,37 @@ class EmbeddedBridge(FreecadBridge):
 
         return FreeCAD
 
+    @resets_instance_info
     async def disconnect(self) -> None:
         """Clean up resources."""
         self._connected = False
+        if self._changes is not None:
+            self._submit(self._fc_module.removeDocumentObserver, self._changes)
+            self._changes = None
         self._executor.shutdown(wait=True)
 
     async def is_connected(self) -> bool:
         """Check if FreeCAD is imported and available."""
         return self._connected and self._fc_module is not None
 
+    async def _change_count(self) -> int | None:
+        """Return the number of FreeCAD changes seen by this bridge's observer.
+
+        The observer is registered on first use. The registration is queued
+        on the FreeCAD thread ahead of any read that follows, so no change
+        made after it is missed.
+
+        Returns:
+            The current count, or None when not connected.
+        """
+        if not self._connected:
+            return None
+        if self._changes is None:
+            self._changes = _ChangeCounter()
+            self._submit(self._fc_module.addDocumentObserver, self._changes)
+        return self._changes.count
+
+    @invalidates_reads
     async def execute_python(
         self,
         code: str,
@@ -114,14 +438,15 @@ class EmbeddedBridge(FreecadBridge):
                 error_traceback=None,
             )
 
-        loop = asyncio.get_event_loop()
+        batched = self._queue_for_batch(code, timeout_ms)
+        if batched is not None:
+            return await batched
 
+        # Submitted straight to the executor: no context copy and, with the
+        # arguments passed through, no closure per call
         try:
             result = await asyncio.wait_for(
-                loop.run_in_executor(
-                    self._executor,
-                    lambda: self._execute_code(code),
-                ),
+                asyncio.wrap_future(self._submit(self._execute_code, code)),
                 timeout=timeout_ms / 1000,
             )
         except TimeoutError:
@@ -137,72 +462,198 @@ class EmbeddedBridge(FreecadBridge):
 
         return result
 
-    def _execute_code(self, code: str) -> ExecutionResult:
-        """Execute code synchronously (runs in thread pool)."""
-        start = time.perf_counter()
-        stdout_capture = io.StringIO()
-        stderr_capture = io.StringIO()
-
-        # Build execution context
-        exec_globals: dict[str, Any] = {
-            "FreeCAD": self._fc_module,
-            "App": self._fc_module,
-            "__builtins__": __builtins__,
-        }
+    @invalidates_reads
+    async def execute_python_many(
+        self,
+        codes: list[str],
+        timeout_ms: int = 30000,
+    ) -> list[ExecutionResult]:
+        """Execute several Python snippets in one trip to the FreeCAD thread.
+
+        Args:
+            codes: Python code snippets to execute.
+            timeout_ms: Maximum execution time per snippet in milliseconds.
+
+        Returns:
+            One ExecutionResult per snippet, in the same order as codes.
+        """
+        if not codes or not self._connected:
+            return [await self.execute_python(code, timeout_ms) for code in codes]
 
-        # Try to add GUI module if available
         try:
-            import FreeCADGui
+            return await asyncio.wait_for(
+                asyncio.wrap_future(
+                    self._submit(lambda: [self._execute_code(code) for code in codes])
+                ),
+                timeout=timeout_ms * len(codes) / 1000,
+            )
+        except TimeoutError:
+            return [
+                ExecutionResult(
+                    success=False,
+                    result=None,
+                    stdout="",
+                    stderr=f"Execution timed out after {timeout_ms * len(codes)}ms",
+                    execution_time_ms=float(timeout_ms * len(codes)),
+                    error_type="TimeoutError",
+                    error_traceback=None,
+                )
+                for _ in codes
+            ]
+
+    async def _execute_template(
+        self,
+        template: str,
+        params: dict[str, Any] | None = None,
+        timeout_ms: int = 30000,
+        *,
+        capture: bool = True,
+        format_tb: bool = True,
+    ) -> ExecutionResult:
+        """Execute one of the bridge's own constant code snippets.
+
+        The arguments are passed in as globals rather than formatted into
+        the source, so each template is compiled once however it is called.
+        Inside a batch the arguments are written out as assignments in
+        front of the template instead, since batched code travels as plain
+        source.
+
+        Args:
+            template: Template source reading its arguments as globals.
+            params: Argument values by global name.
+            timeout_ms: Maximum execution time in milliseconds.
+            capture: Whether to collect stdout/stderr. Only snippets that
+                touch no document or object pass False: reading or changing
+                a document runs property getters, hooks and scripted object
+                code, whose output is then reported with the result.
+            format_tb: Whether a failure needs its traceback. Callers that
+                only look at success pass False.
+
+        Returns:
+            ExecutionResult with execution outcome.
+        """
+        if not self._connected or self._in_batch():
+            assignments = "".join(
+                f"{name} = {value!r}\n" for name, value in (params or {}).items()
+            )
+            return await self.execute_python(assignments + template, timeout_ms)
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(
+                    self._submit(
+                        self._execute_code, template, params, capture, format_tb
+                    )
+                ),
+                timeout=timeout_ms / 1000,
+            )
+        except TimeoutError:
+            return ExecutionResult(
+                success=False,
+                result=None,
+                stdout="",
+                stderr=f"Execution timed out after {timeout_ms}ms",
+                execution_time_ms=float(timeout_ms),
+                error_type="TimeoutError",
+                error_traceback=None,
+            )
+
+    def _new_exec_globals(self) -> dict[str, Any]:
+        """Return a fresh copy of the globals code executes with.
+
+        The FreeCADGui import is tried once per FreeCAD module; on headless
+        installs its ImportError is not raised again for every execution.
+
+        Returns:
+            New globals dictionary for a single execution.
+        """
+        base = self._base_globals
+        if base is None or base["FreeCAD"] is not self._fc_module:
+            base = {
+                "FreeCAD": self._fc_module,
+                "App": self._fc_module,
+                "__builtins__": __builtins__,
+            }
+
+            # Try to add GUI module if available
+            try:
+                import FreeCADGui
+
+                base["FreeCADGui"] = FreeCADGui
+                base["Gui"] = FreeCADGui
+            except ImportError:
+                pass
 
-            exec_globals["FreeCADGui"] = FreeCADGui
-            exec_globals["Gui"] = FreeCADGui
-        except ImportError:
-            pass
+            self._base_globals = base
+        return base.copy()
+
+    def _execute_code(
+        self,
+        code: str,
+        params: dict[str, Any] | None = None,
+        capture: bool = True,
+        format_tb: bool = True,
+    ) -> ExecutionResult:
+        """Execute code synchronously (runs in thread pool).
+
+        Args:
+            code: Python code to execute.
+            params: Extra globals for the code, e.g. a template's arguments.
+            capture: Whether to collect stdout/stderr. When False, output
+                goes to this process's stderr and is reported as empty;
+                stdout carries the MCP stdio transport.
+            format_tb: Whether to format the traceback of a failure. When
+                False, error_traceback is left as None.
+
+        Returns:
+            ExecutionResult with execution outcome.
+        """
+        start = time.perf_counter()
+        stdout_capture = _OutputSink() if capture else None
+        stderr_capture = _OutputSink() if capture else None
+
+        exec_globals = self._new_exec_globals()
+        if params:
+            exec_globals.update(params)
 
         try:
-            with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-                compiled = compile(code, "<mcp>", "exec")
-                exec(compiled, exec_globals)  # noqa: S102
+            if stdout_capture is None or stderr_capture is None:
+                with redirect_stdout(sys.stderr):
+                    exec(compile_code(code), exec_globals)  # noqa: S102
+            else:
+                with (
+                    redirect_stdout(stdout_capture),  # type: ignore[type-var]
+                    redirect_stderr(stderr_capture),  # type: ignore[type-var]
+                ):
+                    exec(compile_code(code), exec_globals)  # noqa: S102
 
             elapsed = (time.perf_counter() - start) * 1000
 
             return ExecutionResult(
                 success=True,
                 result=exec_globals.get("_result_"),
-                stdout=stdout_capture.getvalue(),
-                stderr=stderr_capture.getvalue(),
+                stdout=stdout_capture.getvalue() if stdout_capture else "",
+                stderr=stderr_capture.getvalue() if stderr_capture else "",
                 execution_time_ms=elapsed,
             )
 
         except Exception as e:
-            import traceback
-
             elapsed = (time.perf_counter() - start) * 1000
 
             return ExecutionResult(
                 success=False,
                 result=None,
-                stdout=stdout_capture.getvalue(),
-                stderr=stderr_capture.getvalue(),
+                stdout=stdout_capture.getvalue() if stdout_capture else "",
+                stderr=stderr_capture.getvalue() if stderr_capture else "",
                 execution_time_ms=elapsed,
                 error_type=type(e).__name__,
-                error_traceback=traceback.format_exc(),
+                error_traceback=traceback.format_exc() if format_tb else None,
             )
 
     async def get_documents(self) -> list[DocumentInfo]:
         """Get list of open documents."""
-        result = await self.execute_python(
-            """
-_result_ = []
-for doc in FreeCAD.listDocuments().values():
-    _result_.append({
-        "name": doc.Name,
-        "path": doc.FileName or None,
-        "objects": [obj.Name for obj in doc.Objects],
-        "is_modified": doc.Modified if hasattr(doc, "Modified") else False,
-        "label": doc.Label,
-    })
-"""
+        result = await self._execute_template(
+            _GET_DOCUMENTS_CODE, {"_active_only": False}
         )
 
         if result.success and result.result:
@@ -211,71 +662,24 @@ for doc in FreeCAD.listDocuments().values():
 
     async def get_active_document(self) -> DocumentInfo | None:
         """Get the active document."""
-        result = await self.execute_python(
-            """
-doc = FreeCAD.ActiveDocument
-if doc:
-    _result_ = {
-        "name": doc.Name,
-        "path": doc.FileName or None,
-        "objects": [obj.Name for obj in doc.Objects],
-        "is_modified": doc.Modified if hasattr(doc, "Modified") else False,
-        "label": doc.Label,
-    }
-else:
-    _result_ = None
-"""
+        result = await self._execute_template(
+            _GET_DOCUMENTS_CODE, {"_active_only": True}
         )
 
         if result.success and result.result:
-            return DocumentInfo(**result.result)
+            return DocumentInfo(**result.result[0])
         return None
 
+    @cached_read
     async def get_object(
         self,
         obj_name: str,
         doc_name: str | None = None,
     ) -> ObjectInfo:
         """Get detailed object information."""
-        result = await self.execute_python(
-            f"""
-doc = FreeCAD.ActiveDocument if {doc_name!r} is None else FreeCAD.getDocument({doc_name!r})
-if doc is None:
-    raise ValueError("No document found")
-
-obj = doc.getObject({obj_name!r})
-if obj is None:
-    raise ValueError(f"Object not found: {obj_name!r}")
-
-props = {{}}
-for prop in obj.PropertiesList:
-    try:
-        val = getattr(obj, prop)
-        if hasattr(val, '__class__') and val.__class__.__module__ != 'builtins':
-            val = str(val)
-        props[prop] = val
-    except Exception:
-        props[prop] = "<unreadable>"
-
-shape_info = None
-if hasattr(obj, "Shape"):
-    shape = obj.Shape
-    shape_info = {{
-        "type": shape.ShapeType,
-        "volume": shape.Volume if hasattr(shape, "Volume") else None,
-        "area": shape.Area if hasattr(shape, "Area") else None,
-        "is_valid": shape.isValid(),
-    }}
-
-_result_ = {{
-    "name": obj.Name,
-    "label": obj.Label,
-    "type_id": obj.TypeId,
-    "properties": props,
-    "shape_info": shape_info,
-    "children": [c.Name for c in obj.OutList] if hasattr(obj, "OutList") else [],
-}}
-"""
+        result = await self._execute_template(
+            GET_OBJECT_CODE,
+            {"_doc_name": doc_name, "_obj_name": obj_name},
         )
 
         if result.success and result.result:
@@ -295,19 +699,23 @@ _result_ = {{
         """
         return []
 
+    @cached_version_info
     async def get_freecad_version(self) -> dict[str, Any]:
         """Get FreeCAD version information."""
-        result = await self.execute_python(
+        result = await self._execute_template(
             """
 import sys
+version = FreeCAD.Version()
 _result_ = {
-    "version": ".".join(str(x) for x in FreeCAD.Version()[:3]),
-    "version_tuple": FreeCAD.Version()[:3],
-    "build_date": FreeCAD.Version()[3] if len(FreeCAD.Version()) > 3 else "unknown",
+    "version": ".".join(str(x) for x in version[:3]),
+    "version_tuple": version[:3],
+    "build_date": version[3] if len(version) > 3 else "unknown",
     "python_version": sys.version,
     "gui_available": hasattr(FreeCAD, "GuiUp") and FreeCAD.GuiUp,
 }
-"""
+""",
+            capture=False,
+            format_tb=False,
         )
 
         if result.success and result.result:
@@ -321,10 +729,13 @@ _result_ = {
             "gui_available": False,
         }
 
+    @gui_from_version_info
     async def is_gui_available(self) -> bool:
         """Check if GUI is available."""
-        result = await self.execute_python(
-            "_result_ = hasattr(FreeCAD, 'GuiUp') and FreeCAD.GuiUp"
+        result = await self._execute_template(
+            "_result_ = hasattr(FreeCAD, 'GuiUp') and FreeCAD.GuiUp",
+            capture=False,
+            format_tb=False,
         )
         return bool(result.success and result.result)
 
@@ -342,7 +753,9 @@ _result_ = {
             raise ConnectionError(msg)
 
         start = time.perf_counter()
-        result = await self.execute_python("_result_ = True")
+        result = await self._execute_template(
+            "_result_ = True", capture=False, format_tb=False
+        )
         elapsed = (time.perf_counter() - start) * 1000
 
         if not result.success:
@@ -365,15 +778,13 @@ _result_ = {
             )
 
         try:
-            ping_ms = await self.ping()
-            version_info = await self.get_freecad_version()
-            gui_available = await self.is_gui_available()
+            ping_ms, version_info = await self._probe_status()
 
             return ConnectionStatus(
                 connected=True,
                 mode="embedded",
                 freecad_version=version_info.get("version", "unknown"),
-                gui_available=gui_available,
+                gui_available=bool(version_info.get("gui_available")),
                 last_ping_ms=ping_ms,
             )
         except Exception as e:
@@ -387,6 +798,7 @@ _result_ = {
     # Document Management
     # =========================================================================
 
+    @invalidates_reads
     async def create_document(
         self, name: str, label: str | None = None
     ) -> DocumentInfo:
@@ -400,18 +812,8 @@ _result_ = {
             DocumentInfo for the created document.
         """
         label = label or name
-        result = await self.execute_python(
-            f"""
-doc = FreeCAD.newDocument({name!r})
-doc.Label = {label!r}
-_result_ = {{
-    "name": doc.Name,
-    "label": doc.Label,
-    "path": doc.FileName or None,
-    "objects": [],
-    "is_modified": False,
-}}
-"""
+        result = await self._execute_template(
+            _CREATE_DOCUMENT_CODE, {"_name": name, "_label": label}
         )
 
         if result.success and result.result:
@@ -420,6 +822,7 @@ _result_ = {{
         error_msg = result.error_traceback or "Failed to create document"
         raise ValueError(error_msg)
 
+    @invalidates_reads
     async def open_document(self, path: str) -> DocumentInfo:
         """Open an existing document.
 
@@ -433,22 +836,11 @@ _result_ = {{
             FileNotFoundError: If file doesn't exist.
             ValueError: If file is not a valid FreeCAD document.
         """
-        if not Path(path).exists():
+        if not await asyncio.to_thread(Path(path).exists):
             msg = f"File not found: {path}"
             raise FileNotFoundError(msg)
 
-        result = await self.execute_python(
-            f"""
-doc = FreeCAD.openDocument({path!r})
-_result_ = {{
-    "name": doc.Name,
-    "label": doc.Label,
-    "path": doc.FileName or None,
-    "objects": [obj.Name for obj in doc.Objects],
-    "is_modified": doc.Modified if hasattr(doc, "Modified") else False,
-}}
-"""
-        )
+        result = await self._execute_template(_OPEN_DOCUMENT_CODE, {"_path": path})
 
         if result.success and result.result:
             return DocumentInfo(**result.result)
@@ -473,20 +865,9 @@ _result_ = {{
         Raises:
             ValueError: If document not found or no path specified for new doc.
         """
-        code = f"""
-doc = FreeCAD.ActiveDocument if {doc_name!r} is None else FreeCAD.getDocument({doc_name!r})
-if doc is None:
-    raise ValueError("No active document" if {doc_name!r} is None else f"Document not found: {doc_name!r}")
-
-save_path = {path!r} or doc.FileName
-if not save_path:
-    raise ValueError("No path specified for new document")
-
-doc.saveAs(save_path)
-_result_ = save_path
-"""
-
-        result = await self.execute_python(code)
+        result = await self._execute_template(
+            _SAVE_DOCUMENT_CODE, {"_doc_name": doc_name, "_path": path}
+        )
 
         if result.success and result.result:
             return result.result
@@ -494,25 +875,16 @@ _result_ = save_path
         error_msg = result.error_traceback or "Failed to save document"
         raise ValueError(error_msg)
 
+    @invalidates_reads
     async def close_document(self, doc_name: str | None = None) -> None:
         """Close a document.
 
         Args:
             doc_name: Document name (uses active if None).
         """
-        code = f"""
-doc_name = {doc_name!r}
-if doc_name is None:
-    doc = FreeCAD.ActiveDocument
-    if doc:
-        doc_name = doc.Name
-    else:
-        raise ValueError("No active document")
-
-FreeCAD.closeDocument(doc_name)
-_result_ = True
-"""
-        result = await self.execute_python(code)
+        result = await self._execute_template(
+            _CLOSE_DOCUMENT_CODE, {"_doc_name": doc_name}
+        )
 
         if not result.success:
             error_msg = result.error_traceback or "Failed to close document"
@@ -522,6 +894,7 @@ _result_ = True
     # Object Management
     # =========================================================================
 
+    @cached_read
     async def get_objects(self, doc_name: str | None = None) -> list[ObjectInfo]:
         """Get all objects in a document.
 
@@ -531,31 +904,16 @@ _result_ = True
         Returns:
             List of ObjectInfo for each object.
         """
-        code = f"""
-doc = FreeCAD.ActiveDocument if {doc_name!r} is None else FreeCAD.getDocument({doc_name!r})
-if doc is None:
-    raise ValueError("No document found")
-
-objects = []
-for obj in doc.Objects:
-    obj_info = {{
-        "name": obj.Name,
-        "label": obj.Label,
-        "type_id": obj.TypeId,
-        "visibility": obj.ViewObject.Visibility if hasattr(obj, "ViewObject") and obj.ViewObject else True,
-        "children": [c.Name for c in obj.OutList] if hasattr(obj, "OutList") else [],
-        "parents": [p.Name for p in obj.InList] if hasattr(obj, "InList") else [],
-    }}
-    objects.append(obj_info)
-
-_result_ = objects
-"""
-        result = await self.execute_python(code)
+        result = await self._execute_template(
+            _GET_OBJECTS_CODE,
+            {"_doc_name": doc_name},
+        )
 
         if result.success and result.result:
-            return [ObjectInfo(**obj) for obj in result.result]
+            return [ObjectInfo.from_row(row) for row in result.result]
         return []
 
+    @invalidates_reads
     async def create_object(
         self,
         type_id: str,
@@ -575,30 +933,15 @@ _result_ = objects
             ObjectInfo for the created object.
         """
         properties = properties or {}
-        code = f"""
-doc = FreeCAD.ActiveDocument if {doc_name!r} is None else FreeCAD.getDocument({doc_name!r})
-if doc is None:
-    raise ValueError("No document found")
-
-obj = doc.addObject({type_id!r}, {name!r} or "")
-
-# Set properties
-for prop_name, prop_val in {properties!r}.items():
-    if hasattr(obj, prop_name):
-        setattr(obj, prop_name, prop_val)
-
-doc.recompute()
-
-_result_ = {{
-    "name": obj.Name,
-    "label": obj.Label,
-    "type_id": obj.TypeId,
-    "visibility": True,
-    "children": [c.Name for c in obj.OutList] if hasattr(obj, "OutList") else [],
-    "parents": [p.Name for p in obj.InList] if hasattr(obj, "InList") else [],
-}}
-"""
-        result = await self.execute_python(code)
+        result = await self._execute_template(
+            _CREATE_OBJECT_CODE,
+            {
+                "_doc_name": doc_name,
+                "_type_id": type_id,
+                "_name": name,
+                "_properties": properties,
+            },
+        )
 
         if result.success and result.result:
             return ObjectInfo(**result.result)
@@ -606,6 +949,7 @@ _result_ = {{
         error_msg = result.error_traceback or "Failed to create object"
         raise ValueError(error_msg)
 
+    @invalidates_reads
     async def edit_object(
         self,
         obj_name: str,
@@ -625,32 +969,14 @@ _result_ = {{
         Raises:
             ValueError: If object not found.
         """
-        code = f"""
-doc = FreeCAD.ActiveDocument if {doc_name!r} is None else FreeCAD.getDocument({doc_name!r})
-if doc is None:
-    raise ValueError("No document found")
-
-obj = doc.getObject({obj_name!r})
-if obj is None:
-    raise ValueError(f"Object not found: {obj_name!r}")
-
-# Set properties
-for prop_name, prop_val in {properties!r}.items():
-    if hasattr(obj, prop_name):
-        setattr(obj, prop_name, prop_val)
-
-doc.recompute()
-
-_result_ = {{
-    "name": obj.Name,
-    "label": obj.Label,
-    "type_id": obj.TypeId,
-    "visibility": obj.ViewObject.Visibility if hasattr(obj, "ViewObject") and obj.ViewObject else True,
-    "children": [c.Name for c in obj.OutList] if hasattr(obj, "OutList") else [],
-    "parents": [p.Name for p in obj.InList] if hasattr(obj, "InList") else [],
-}}
-"""
-        result = await self.execute_python(code)
+        result = await self._execute_template(
+            _EDIT_OBJECT_CODE,
+            {
+                "_doc_name": doc_name,
+                "_obj_name": obj_name,
+                "_properties": properties,
+            },
+        )
 
         if result.success and result.result:
             return ObjectInfo(**result.result)
@@ -658,6 +984,7 @@ _result_ = {{
         error_msg = result.error_traceback or "Failed to edit object"
         raise ValueError(error_msg)
 
+    @invalidates_reads
     async def delete_object(
         self,
         obj_name: str,
@@ -672,19 +999,9 @@ _result_ = {{
         Raises:
             ValueError: If object not found.
         """
-        code = f"""
-doc = FreeCAD.ActiveDocument if {doc_name!r} is None else FreeCAD.getDocument({doc_name!r})
-if doc is None:
-    raise ValueError("No document found")
-
-obj = doc.getObject({obj_name!r})
-if obj is None:
-    raise ValueError(f"Object not found: {obj_name!r}")
-
-doc.removeObject({obj_name!r})
-_result_ = True
-"""
-        result = await self.execute_python(code)
+        result = await self._execute_template(
+            _DELETE_OBJECT_CODE, {"_doc_name": doc_name, "_obj_name": obj_name}
+        )
 
         if not result.success:
             error_msg = result.error_traceback or "Failed to delete object"
@@ -727,59 +1044,15 @@ _result_ = True
             )
 
         # If GUI is available, attempt screenshot
-        view_angle_str = view_angle.value if view_angle else "Isometric"
-        code = f"""
-import base64
-import tempfile
-import os
-
-doc = FreeCAD.ActiveDocument if {doc_name!r} is None else FreeCAD.getDocument({doc_name!r})
-if doc is None:
-    raise ValueError("No document found")
-
-view = FreeCADGui.ActiveDocument.ActiveView
-if view is None:
-    raise ValueError("No active view")
-
-# Set view angle
-view_type = {view_angle_str!r}
-if view_type == "FitAll":
-    view.fitAll()
-elif view_type == "Isometric":
-    view.viewIsometric()
-elif view_type == "Front":
-    view.viewFront()
-elif view_type == "Back":
-    view.viewRear()
-elif view_type == "Top":
-    view.viewTop()
-elif view_type == "Bottom":
-    view.viewBottom()
-elif view_type == "Left":
-    view.viewLeft()
-elif view_type == "Right":
-    view.viewRight()
-
-# Save to temp file and read
-with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-    temp_path = f.name
-
-view.saveImage(temp_path, {width}, {height}, "Current")
-
-with open(temp_path, "rb") as f:
-    image_data = base64.b64encode(f.read()).decode("utf-8")
-
-os.unlink(temp_path)
-
-_result_ = {{
-    "success": True,
-    "data": image_data,
-    "format": "png",
-    "width": {width},
-    "height": {height},
-}}
-"""
-        result = await self.execute_python(code)
+        result = await self._execute_template(
+            _GET_SCREENSHOT_CODE,
+            {
+                "_doc_name": doc_name,
+                "_view_method": VIEW_METHODS[view_angle or ViewAngle.ISOMETRIC],
+                "_width": width,
+                "_height": height,
+            },
+        )
 
         if result.success and result.result:
             return ScreenshotResult(
@@ -815,44 +1088,18 @@ _result_ = {{
         if not gui_available:
             return  # Silently ignore in headless mode
 
-        view_angle_str = view_angle.value
-        code = f"""
-doc = FreeCAD.ActiveDocument if {doc_name!r} is None else FreeCAD.getDocument({doc_name!r})
-if doc is None:
-    raise ValueError("No document found")
-
-view = FreeCADGui.ActiveDocument.ActiveView
-if view is None:
-    raise ValueError("No active view")
-
-view_type = {view_angle_str!r}
-if view_type == "FitAll":
-    view.fitAll()
-elif view_type == "Isometric":
-    view.viewIsometric()
-elif view_type == "Front":
-    view.viewFront()
-elif view_type == "Back":
-    view.viewRear()
-elif view_type == "Top":
-    view.viewTop()
-elif view_type == "Bottom":
-    view.viewBottom()
-elif view_type == "Left":
-    view.viewLeft()
-elif view_type == "Right":
-    view.viewRight()
-
-_result_ = True
-"""
-        await self.execute_python(code)
+        await self._execute_template(
+            _SET_VIEW_CODE,
+            {"_doc_name": doc_name, "_view_method": VIEW_METHODS[view_angle]},
+        )
 
     # =========================================================================
     # Macros
     # =========================================================================
 
-    def _get_macro_path(self) -> Path:
-        """Get the FreeCAD macro directory path."""
+    @functools.cached_property
+    def _macro_path(self) -> Path:
+        """FreeCAD macro directory path, worked out on first use."""
         # Default FreeCAD macro locations
         if sys.platform == "darwin":
             return Path.home() / "Library" / "Application Support" / "FreeCAD" / "Macro"
@@ -861,43 +1108,71 @@ _result_ = True
         else:
             return Path.home() / ".local" / "share" / "FreeCAD" / "Macro"
 
-    async def get_macros(self) -> list[MacroInfo]:
-        """Get list of available macros.
+    @staticmethod
+    def _scan_macros(macro_path: Path) -> list[MacroInfo]:
+        """List the macros in a directory (runs in a worker thread).
+
+        Only the head of each file is read, since the description is taken
+        from its first comment line.
+
+        Args:
+            macro_path: Directory to scan.
 
         Returns:
-            List of MacroInfo for each macro.
+            List of MacroInfo for each macro, empty if the directory is missing.
         """
-        macro_path = self._get_macro_path()
-
-        if not macro_path.exists():
+        macros = []
+        try:
+            with os.scandir(macro_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".FCMacro") or not entry.is_file():
+                        continue
+
+                    description = ""
+                    try:
+                        with open(entry.path, "rb") as f:  # noqa: PTH123
+                            head = f.read(_MACRO_HEAD_BYTES)
+                        lines = head.decode(errors="replace").splitlines()
+                        if len(head) == _MACRO_HEAD_BYTES:
+                            lines = lines[:-1]  # May be cut off mid-line
+                        # Extract description from first comment block
+                        for line in lines:
+                            if line.startswith("#"):
+                                desc_line = line.lstrip("#").strip()
+                                if desc_line and not desc_line.startswith("!"):
+                                    description = desc_line
+                                    break
+                    except OSError:
+                        pass
+
+                    macros.append(
+                        MacroInfo(
+                            name=entry.name[:-8],  # Remove .FCMacro
+                            path=entry.path,
+                            description=description,
+                            is_system=False,
+                        )
+                    )
+        except FileNotFoundError:
             return []
 
-        macros = []
-        for macro_file in macro_path.glob("*.FCMacro"):
-            description = ""
-            try:
-                content = macro_file.read_text()
-                # Extract description from first comment block
-                for line in content.split("\n"):
-                    if line.startswith("#"):
-                        desc_line = line.lstrip("#").strip()
-                        if desc_line and not desc_line.startswith("!"):
-                            description = desc_line
-                            break
-            except Exception:
-                pass
+        return macros
 
-            macros.append(
-                MacroInfo(
-                    name=macro_file.stem,
-                    path=str(macro_file),
-                    description=description,
-                    is_system=False,
-                )
-            )
+    @staticmethod
+    def _write_macro_file(macro_file: Path, text: str) -> None:
+        """Write a macro, creating the macro directory (runs in a worker thread)."""
+        macro_file.parent.mkdir(parents=True, exist_ok=True)
+        macro_file.write_text(text)
 
-        return macros
+    async def get_macros(self) -> list[MacroInfo]:
+        """Get list of available macros.
 
+        Returns:
+            List of MacroInfo for each macro.
+        """
+        return await asyncio.to_thread(self._scan_macros, self._macro_path)
+
+    @invalidates_reads
     async def run_macro(
         self,
         macro_name: str,
@@ -912,9 +1187,11 @@ _result_ = True
         Returns:
             ExecutionResult from macro execution.
         """
-        macro_path = self._get_macro_path() / f"{macro_name}.FCMacro"
+        macro_path = self._macro_path / f"{macro_name}.FCMacro"
 
-        if not macro_path.exists():
+        try:
+            macro_code = await asyncio.to_thread(macro_path.read_text)
+        except FileNotFoundError:
             return ExecutionResult(
                 success=False,
                 result=None,
@@ -923,9 +1200,6 @@ _result_ = True
                 execution_time_ms=0,
                 error_type="FileNotFoundError",
             )
-
-        try:
-            macro_code = macro_path.read_text()
         except Exception as e:
             return ExecutionResult(
                 success=False,
@@ -959,10 +1233,7 @@ _result_ = True
         Returns:
             MacroInfo for the created macro.
         """
-        macro_path = self._get_macro_path()
-        macro_path.mkdir(parents=True, exist_ok=True)
-
-        macro_file = macro_path / f"{name}.FCMacro"
+        macro_file = self._macro_path / f"{name}.FCMacro"
 
         # Add description as header comment
         header = f"# {description}\n\n" if description else ""
@@ -977,7 +1248,7 @@ import FreeCADGui
 
 {code}
 """
-        macro_file.write_text(full_code)
+        await asyncio.to_thread(self._write_macro_file, macro_file, full_code)
 
         return MacroInfo(
             name=name,
@@ -985,80 +1256,3 @@ import FreeCADGui
             description=description,
             is_system=False,
         )
-
-    # =========================================================================
-    # Workbenches
-    # =========================================================================
-
-    async def get_workbenches(self) -> list[WorkbenchInfo]:
-        """Get list of available workbenches.
-
-        Returns:
-            List of WorkbenchInfo for each workbench.
-        """
-        gui_available = await self.is_gui_available()
-
-        if not gui_available:
-            # Return common workbenches for headless mode
-            common_workbenches = [
-                "StartWorkbench",
-                "PartWorkbench",
-                "PartDesignWorkbench",
-                "DraftWorkbench",
-                "SketcherWorkbench",
-                "MeshWorkbench",
-                "SpreadsheetWorkbench",
-            ]
-            return [
-                WorkbenchInfo(name=wb, label=wb.replace("Workbench", ""))
-                for wb in common_workbenches
-            ]
-
-        code = """
-workbenches = []
-active_wb = FreeCADGui.activeWorkbench()
-active_name = active_wb.__class__.__name__ if active_wb else None
-
-for name in FreeCADGui.listWorkbenches():
-    wb = FreeCADGui.getWorkbench(name)
-    workbenches.append({
-        "name": name,
-        "label": wb.MenuText if hasattr(wb, "MenuText") else name,
-        "icon": wb.Icon if hasattr(wb, "Icon") else "",
-        "is_active": name == active_name,
-    })
-
-_result_ = workbenches
-"""
-        result = await self.execute_python(code)
-
-        if result.success and result.result:
-            return [WorkbenchInfo(**wb) for wb in result.result]
-        return []
-
-    async def activate_workbench(self, workbench_name: str) -> None:
-        """Activate a workbench.
-
-        Args:
-            workbench_name: Workbench internal name.
-
-        Raises:
-            ValueError: If workbench not found.
-        """
-        gui_available = await self.is_gui_available()
-
-        if not gui_available:
-            return  # Silently ignore in headless mode
-
-        code = f"""
-try:
-    FreeCADGui.activateWorkbench({workbench_name!r})
-    _result_ = True
-except Exception as e:
-    raise ValueError(f"Failed to activate workbench: {{e}}")
-"""
-        result = await self.execute_python(code)
-
-        if not result.success:
-            error_msg = result.error_traceback or "Failed to activate workbench"
-            raise ValueError(error_msg)
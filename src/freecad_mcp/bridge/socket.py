@@ -17,6 +17,8 @@ import uuid
 from typing import Any
 
 from freecad_mcp.bridge.base import (
+    GET_OBJECT_CODE,
+    VIEW_METHODS,
     ConnectionStatus,
     DocumentInfo,
     ExecutionResult,
@@ -25,13 +27,63 @@ from freecad_mcp.bridge.base import (
     ObjectInfo,
     ScreenshotResult,
     ViewAngle,
-    WorkbenchInfo,
+    cached_version_info,
+    gui_from_version_info,
+    resets_instance_info,
 )
 
 DEFAULT_SOCKET_HOST = "localhost"
 DEFAULT_SOCKET_PORT = 9876
 DEFAULT_TIMEOUT = 30.0
 
+# Largest message the stream reader will buffer. asyncio's 64 KiB default
+# is smaller than a typical screenshot response: readline() fails on longer
+# lines, and the reader pauses and resumes the socket every 128 KiB while a
+# large response arrives.
+STREAM_LIMIT = 64 * 1024 * 1024
+
+# Longest the plugin keeps an execute request queued before dropping it
+# (QUEUE_WAIT_TIMEOUT_S in the plugin). Execute requests are given up on
+# client-side only after this plus their timeout_ms and the bridge timeout,
+# in case the plugin itself stops answering.
+PLUGIN_QUEUE_WAIT_S = 300
+
+# orjson encodes and decodes in C and works on bytes directly. It is used
+# when installed; the standard library's json is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Compact JSON encoder shared by all requests. json.dumps() builds a new
+# encoder on every call when given non-default options, and the default
+# separators pad every item with a space.
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _encode_message(payload: Any) -> bytes:
+    """Encode a JSON-RPC message as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return _encode_json(payload).encode("utf-8")
+
+
+def _decode_message(data: bytes) -> Any:
+    """Decode a JSON-RPC message from UTF-8 JSON.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The plugin's json module also writes NaN, Infinity and
+            # integers wider than 64 bits, which orjson rejects
+            pass
+    # json.loads() decodes UTF-8 bytes itself
+    return json.loads(data)
+
 
 class JsonRpcError(Exception):
     """JSON-RPC error response."""
@@ -55,7 +107,9 @@ class SocketBridge(FreecadBridge):
 
     This bridge provides a lightweight, modern protocol for FreeCAD
     communication. It supports automatic reconnection and connection
-    health monitoring.
+    health monitoring. Concurrent requests share the connection: they are
+    sent as soon as they are made, and responses are matched to them by
+    JSON-RPC id.
 
     Attributes:
         host: Socket server hostname.
@@ -85,23 +139,42 @@ class SocketBridge(FreecadBridge):
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
         self._connected = False
+        # Set when the connection drops rather than being closed by
+        # disconnect(); the next request then reconnects if enabled
+        self._lost = False
+        # Serializes reconnecting, so concurrent callers reconnect once
         self._lock = asyncio.Lock()
-
+        # Requests waiting for their response, by JSON-RPC id (a batch by
+        # the id of its first request). _read_responses() completes them.
+        self._pending: dict[str, asyncio.Future[Any]] = {}
+        self._reader_task: asyncio.Task[None] | None = None
+        # Encoded messages waiting for _flush_messages(), and the future it
+        # completes once it has written them
+        self._outgoing: list[bytes] = []
+        self._flushed: asyncio.Future[None] | None = None
+        # Whether the plugin answers the "status" method; None until asked
+        self._has_status_method: bool | None = None
+
+    @resets_instance_info
     async def connect(self) -> None:
         """Establish connection to FreeCAD socket server.
 
         Raises:
             ConnectionError: If connection cannot be established.
         """
+        await self._close_streams(ConnectionError("Reconnected"))
+        self._has_status_method = None
         try:
             self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self._host, self._port),
+                asyncio.open_connection(self._host, self._port, limit=STREAM_LIMIT),
                 timeout=self._timeout,
             )
             self._connected = True
+            self._reader_task = asyncio.create_task(self._read_responses(self._reader))
 
             # Verify connection with a ping
             await self.ping()
+            self._lost = False
         except TimeoutError as e:
             msg = f"Connection to {self._host}:{self._port} timed out"
             raise ConnectionError(msg) from e
@@ -110,8 +183,21 @@ class SocketBridge(FreecadBridge):
             msg = f"Failed to connect to {self._host}:{self._port}: {e}"
             raise ConnectionError(msg) from e
 
+    @resets_instance_info
     async def disconnect(self) -> None:
         """Close connection to FreeCAD socket server."""
+        self._lost = False
+        await self._close_streams(ConnectionError("Disconnected"))
+
+    async def _close_streams(self, error: ConnectionError) -> None:
+        """Close the connection, if any, failing requests still waiting on it.
+
+        Args:
+            error: Exception to fail the waiting requests with.
+        """
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
         if self._writer:
             self._writer.close()
             with contextlib.suppress(Exception):
@@ -119,6 +205,8 @@ class SocketBridge(FreecadBridge):
         self._reader = None
         self._writer = None
         self._connected = False
+        self._outgoing.clear()
+        self._fail_pending(error)
 
     async def is_connected(self) -> bool:
         """Check if bridge is connected to FreeCAD."""
@@ -132,16 +220,217 @@ class SocketBridge(FreecadBridge):
             self._connected = False
             return False
 
+    def _fail_pending(self, error: ConnectionError) -> None:
+        """Fail every request still waiting for a response."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def _future_for(self, message: Any) -> "asyncio.Future[Any] | None":
+        """Take the waiting request a response message answers off _pending.
+
+        Args:
+            message: A decoded response, or a list of them for a batch.
+
+        Returns:
+            The request's future, or None for a response nobody waits on
+            any more (its request timed out).
+
+        Raises:
+            ConnectionError: If the message is an error the server could
+                not tie to any request. Requests are answered in whatever
+                order they finish, so there is no telling whose it is.
+        """
+        if isinstance(message, list):
+            ids = [r.get("id") for r in message if isinstance(r, dict)]
+        else:
+            ids = [message.get("id") if isinstance(message, dict) else None]
+        for request_id in ids:
+            if request_id in self._pending:
+                return self._pending.pop(request_id)
+        if None in ids:
+            msg = f"Server sent a response without a request id: {message!r}"
+            raise ConnectionError(msg)
+        return None
+
+    async def _write_message(self, payload: Any, writer: asyncio.StreamWriter) -> None:
+        """Write a message together with others made meanwhile.
+
+        Messages queued before the event loop next gets control go out in
+        one write, so a burst of concurrent requests costs one send rather
+        than one each, without delaying a lone request. Returns once the
+        write has been made and the connection has drained.
+
+        Args:
+            payload: A request object, or a list of them for a batch.
+            writer: The connection's stream writer.
+        """
+        if self._flushed is None:
+            loop = asyncio.get_running_loop()
+            self._flushed = loop.create_future()
+            loop.call_soon(self._flush_messages)
+        flushed = self._flushed
+        self._outgoing.extend((_encode_message(payload), b"\n"))
+        # Shielded: the future is shared by every message in the write
+        await asyncio.shield(flushed)
+        await writer.drain()
+
+    def _flush_messages(self) -> None:
+        """Write all queued messages to the connection at once."""
+        messages, self._outgoing = self._outgoing, []
+        flushed, self._flushed = self._flushed, None
+        if messages and self._writer is not None:
+            # writelines() hands the transport the pieces without joining
+            # them first (Python 3.12+ sends them with a single sendmsg())
+            self._writer.writelines(messages)
+        if flushed is not None and not flushed.done():
+            flushed.set_result(None)
+
+    async def _read_responses(self, reader: asyncio.StreamReader) -> None:
+        """Hand each response line to the request waiting for it.
+
+        Runs for as long as the connection is open, so requests can be sent
+        without waiting for the responses to earlier ones.
+
+        Args:
+            reader: The connection's stream reader.
+        """
+        try:
+            while True:
+                response_data = await reader.readline()
+                if not response_data:
+                    error = ConnectionError("Connection closed by server")
+                    break
+
+                try:
+                    message = _decode_message(response_data)
+                except json.JSONDecodeError as e:
+                    # Unreadable, so there is no telling whose answer it is
+                    error = ConnectionError(f"Invalid JSON response: {e}")
+                    break
+
+                try:
+                    future = self._future_for(message)
+                except ConnectionError as e:
+                    error = e
+                    break
+                if future is not None and not future.done():
+                    future.set_result(message)
+        except Exception as e:
+            error = ConnectionError(f"Connection lost: {e}")
+
+        if reader is self._reader:
+            self._connected = False
+            self._lost = True
+        self._fail_pending(error)
+
+    def _make_request(
+        self, method: str, params: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Build a JSON-RPC 2.0 request object with a fresh id."""
+        return {
+            "jsonrpc": "2.0",
+            "id": str(uuid.uuid4()),
+            "method": method,
+            "params": params or {},
+        }
+
+    @staticmethod
+    def _unwrap_response(response: dict[str, Any]) -> Any:
+        """Return the result of a JSON-RPC response.
+
+        Raises:
+            JsonRpcError: If the response carries an error.
+        """
+        if "error" in response:
+            error = response["error"]
+            raise JsonRpcError(
+                code=error.get("code", -1),
+                message=error.get("message", "Unknown error"),
+                data=error.get("data"),
+            )
+        return response.get("result")
+
+    async def _exchange(
+        self,
+        payload: dict[str, Any] | list[dict[str, Any]],
+        *,
+        retry: bool = True,
+        timed: bool = True,
+    ) -> Any:
+        """Send one JSON-RPC message and return the decoded reply.
+
+        Requests are pipelined: each is written as soon as it is made and
+        its response is matched up by id, so concurrent callers don't wait
+        for each other's round-trips.
+
+        Args:
+            payload: A request object, or a list of them for a batch.
+            retry: Whether to reconnect and send again if the connection
+                turns out to be lost.
+            timed: Whether to give up after the bridge's timeout. Execute
+                requests are not timed here: they may wait in FreeCAD's
+                queue behind others, and the plugin enforces their
+                timeout_ms from when it starts running them. Their callers
+                set a longer deadline (see _execute_deadline()).
+
+        Returns:
+            The decoded response message.
+
+        Raises:
+            ConnectionError: If not connected or the connection fails.
+        """
+        if not self._connected:
+            if not (self._lost and self._auto_reconnect):
+                msg = "Not connected to socket server"
+                raise ConnectionError(msg)
+            async with self._lock:
+                if not self._connected:
+                    await self.connect()
+
+        request_id = payload[0]["id"] if isinstance(payload, list) else payload["id"]
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            writer = self._writer
+            if writer is None or not self._connected:
+                msg = "Not connected to socket server"
+                raise ConnectionError(msg)
+
+            await self._write_message(payload, writer)
+
+            if not timed:
+                return await future
+            return await asyncio.wait_for(future, timeout=self._timeout)
+
+        except TimeoutError as e:
+            msg = "Request timed out"
+            raise ConnectionError(msg) from e
+        except (ConnectionResetError, BrokenPipeError) as e:
+            self._connected = False
+            self._lost = True
+            if self._auto_reconnect and retry:
+                self._pending.pop(request_id, None)
+                return await self._exchange(payload, retry=False, timed=timed)
+            msg = f"Connection lost: {e}"
+            raise ConnectionError(msg) from e
+        finally:
+            self._pending.pop(request_id, None)
+
     async def _send_request(
         self,
         method: str,
         params: dict[str, Any] | None = None,
+        *,
+        timed: bool = True,
     ) -> Any:
         """Send a JSON-RPC request and wait for response.
 
         Args:
             method: Method name to call.
             params: Method parameters.
+            timed: Whether to give up after the bridge's timeout.
 
         Returns:
             Result from the JSON-RPC response.
@@ -150,67 +439,59 @@ class SocketBridge(FreecadBridge):
             ConnectionError: If not connected.
             JsonRpcError: If server returns an error.
         """
-        if self._writer is None or self._reader is None:
-            msg = "Not connected to socket server"
-            raise ConnectionError(msg)
+        response = await self._exchange(self._make_request(method, params), timed=timed)
+        return self._unwrap_response(response)
 
-        # Build JSON-RPC request
-        request_id = str(uuid.uuid4())
-        request = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "method": method,
-            "params": params or {},
-        }
+    async def _send_batch(
+        self,
+        calls: list[tuple[str, dict[str, Any] | None]],
+        *,
+        timed: bool = True,
+    ) -> list[Any]:
+        """Send several JSON-RPC requests as one batch (JSON-RPC 2.0 section 6).
 
-        async with self._lock:
-            try:
-                # Send request
-                request_data = json.dumps(request).encode("utf-8") + b"\n"
-                self._writer.write(request_data)
-                await self._writer.drain()
-
-                # Read response
-                response_data = await asyncio.wait_for(
-                    self._reader.readline(),
-                    timeout=self._timeout,
-                )
+        Args:
+            calls: (method, params) pairs to send.
+            timed: Whether to give up after the bridge's timeout.
 
-                if not response_data:
-                    self._connected = False
-                    msg = "Connection closed by server"
-                    raise ConnectionError(msg)
-
-                response = json.loads(response_data.decode("utf-8"))
-
-                # Check for error
-                if "error" in response:
-                    error = response["error"]
-                    raise JsonRpcError(
-                        code=error.get("code", -1),
-                        message=error.get("message", "Unknown error"),
-                        data=error.get("data"),
-                    )
-
-                return response.get("result")
-
-            except TimeoutError as e:
-                msg = "Request timed out"
-                raise ConnectionError(msg) from e
-            except json.JSONDecodeError as e:
-                msg = f"Invalid JSON response: {e}"
-                raise ConnectionError(msg) from e
-            except (ConnectionResetError, BrokenPipeError) as e:
-                self._connected = False
-                if self._auto_reconnect:
-                    # Try to reconnect
-                    try:
-                        await self.connect()
-                        return await self._send_request(method, params)
-                    except Exception:
-                        pass
-                msg = f"Connection lost: {e}"
-                raise ConnectionError(msg) from e
+        Returns:
+            The result of each call, in the same order as calls.
+
+        Raises:
+            ConnectionError: If not connected.
+            JsonRpcError: If the server rejects the batch or any call in it.
+        """
+        requests = [self._make_request(method, params) for method, params in calls]
+        responses = await self._exchange(requests, timed=timed)
+        if not isinstance(responses, list):
+            # A single error object means the batch as a whole was rejected
+            self._unwrap_response(responses)
+            msg = "Expected a batch response"
+            raise JsonRpcError(code=-32603, message=msg)
+
+        # The server may answer in any order; match responses up by id
+        by_id = {response.get("id"): response for response in responses}
+        missing = {"error": {"code": -32603, "message": "No response for request"}}
+        return [
+            self._unwrap_response(by_id.get(request["id"], missing))
+            for request in requests
+        ]
+
+    def _execute_deadline(self, timeout_ms: int, count: int = 1) -> float:
+        """Return how long to wait for the plugin to answer execute requests.
+
+        The plugin answers each one within its queue wait limit plus
+        timeout_ms; the deadline only catches a plugin that stopped
+        answering altogether (frozen, or a half-open connection).
+
+        Args:
+            timeout_ms: Execution timeout of each request in milliseconds.
+            count: Number of requests, run one after the other.
+
+        Returns:
+            Deadline in seconds.
+        """
+        return count * (timeout_ms / 1000 + PLUGIN_QUEUE_WAIT_S) + self._timeout
 
     async def ping(self) -> float:
         """Ping FreeCAD to check connection and measure latency.
@@ -225,6 +506,34 @@ class SocketBridge(FreecadBridge):
         await self._send_request("ping")
         return (time.perf_counter() - start) * 1000
 
+    async def _probe_status(self) -> tuple[float, dict[str, Any]]:
+        """Ping FreeCAD and get its version information in one round-trip.
+
+        Asks the plugin's "status" method, which answers both without
+        going through FreeCAD's GUI queue. Plugins older than that method
+        are probed the generic way instead.
+
+        Returns:
+            Round-trip time in milliseconds and the version information.
+
+        Raises:
+            ConnectionError: If FreeCAD did not answer.
+        """
+        if self._has_status_method is not False:
+            start = time.perf_counter()
+            try:
+                info = await self._send_request("status")
+            except JsonRpcError as e:
+                if e.code != -32601:
+                    raise
+                self._has_status_method = False
+            else:
+                elapsed = (time.perf_counter() - start) * 1000
+                self._has_status_method = True
+                self._remember_instance_info(info)
+                return elapsed, info
+        return await super()._probe_status()
+
     async def get_status(self) -> ConnectionStatus:
         """Get detailed connection status.
 
@@ -239,15 +548,13 @@ class SocketBridge(FreecadBridge):
             )
 
         try:
-            ping_ms = await self.ping()
-            version_info = await self.get_freecad_version()
-            gui_available = await self.is_gui_available()
+            ping_ms, version_info = await self._probe_status()
 
             return ConnectionStatus(
                 connected=True,
                 mode="socket",
                 freecad_version=version_info.get("version", "unknown"),
-                gui_available=gui_available,
+                gui_available=bool(version_info.get("gui_available")),
                 last_ping_ms=ping_ms,
             )
         except Exception as e:
@@ -275,41 +582,32 @@ class SocketBridge(FreecadBridge):
         Returns:
             ExecutionResult with execution outcome.
         """
+        batched = self._queue_for_batch(code, timeout_ms)
+        if batched is not None:
+            return await batched
+
         start = time.perf_counter()
+        deadline = self._execute_deadline(timeout_ms)
 
         try:
+            # The plugin enforces timeout_ms once it starts running the code
             result = await asyncio.wait_for(
-                self._send_request("execute", {"code": code}),
-                timeout=timeout_ms / 1000,
+                self._send_request(
+                    "execute", {"code": code, "timeout_ms": timeout_ms}, timed=False
+                ),
+                timeout=deadline,
             )
             elapsed = (time.perf_counter() - start) * 1000
 
-            if isinstance(result, dict):
-                return ExecutionResult(
-                    success=result.get("success", False),
-                    result=result.get("result"),
-                    stdout=result.get("stdout", ""),
-                    stderr=result.get("stderr", ""),
-                    execution_time_ms=elapsed,
-                    error_type=result.get("error_type"),
-                    error_traceback=result.get("error_traceback"),
-                )
-            else:
-                return ExecutionResult(
-                    success=True,
-                    result=result,
-                    stdout="",
-                    stderr="",
-                    execution_time_ms=elapsed,
-                )
+            return ExecutionResult.from_response(result, elapsed)
 
         except TimeoutError:
             return ExecutionResult(
                 success=False,
                 result=None,
                 stdout="",
-                stderr=f"Execution timed out after {timeout_ms}ms",
-                execution_time_ms=float(timeout_ms),
+                stderr=f"No answer from FreeCAD within {deadline:g}s",
+                execution_time_ms=(time.perf_counter() - start) * 1000,
                 error_type="TimeoutError",
             )
         except JsonRpcError as e:
@@ -332,6 +630,75 @@ class SocketBridge(FreecadBridge):
                 error_type="ConnectionError",
             )
 
+    async def execute_python_many(
+        self,
+        codes: list[str],
+        timeout_ms: int = 30000,
+    ) -> list[ExecutionResult]:
+        """Execute several Python snippets with one JSON-RPC batch request.
+
+        Args:
+            codes: Python code snippets to execute.
+            timeout_ms: Maximum execution time per snippet in milliseconds.
+
+        Returns:
+            One ExecutionResult per snippet, in the same order as codes.
+        """
+        if not codes:
+            return []
+
+        start = time.perf_counter()
+        deadline = self._execute_deadline(timeout_ms, len(codes))
+
+        params = [{"code": code, "timeout_ms": timeout_ms} for code in codes]
+        try:
+            # The plugin enforces timeout_ms on each snippet as it runs it
+            results = await asyncio.wait_for(
+                self._send_batch([("execute", p) for p in params], timed=False),
+                timeout=deadline,
+            )
+        except TimeoutError:
+            elapsed = (time.perf_counter() - start) * 1000
+            return [
+                ExecutionResult(
+                    success=False,
+                    result=None,
+                    stdout="",
+                    stderr=f"No answer from FreeCAD within {deadline:g}s",
+                    execution_time_ms=elapsed,
+                    error_type="TimeoutError",
+                )
+                for _ in codes
+            ]
+        except JsonRpcError as e:
+            elapsed = (time.perf_counter() - start) * 1000
+            return [
+                ExecutionResult(
+                    success=False,
+                    result=None,
+                    stdout="",
+                    stderr=e.message,
+                    execution_time_ms=elapsed,
+                    error_type="JsonRpcError",
+                )
+                for _ in codes
+            ]
+        except ConnectionError as e:
+            return [
+                ExecutionResult(
+                    success=False,
+                    result=None,
+                    stdout="",
+                    stderr=str(e),
+                    execution_time_ms=0,
+                    error_type="ConnectionError",
+                )
+                for _ in codes
+            ]
+
+        elapsed = (time.perf_counter() - start) * 1000
+        return [ExecutionResult.from_response(result, elapsed) for result in results]
+
     # =========================================================================
     # Document Management
     # =========================================================================
@@ -490,24 +857,37 @@ doc = FreeCAD.ActiveDocument if {doc_name!r} is None else FreeCAD.getDocument({d
 if doc is None:
     raise ValueError("No document found")
 
+# One (name, label, type_id, children, parents, visibility) row per object,
+# see ObjectInfo.from_row()
+# Which optional attributes objects have, looked up once per TypeId
+attrs_by_type = {{}}
 objects = []
 for obj in doc.Objects:
-    obj_info = {{
-        "name": obj.Name,
-        "label": obj.Label,
-        "type_id": obj.TypeId,
-        "visibility": obj.ViewObject.Visibility if hasattr(obj, "ViewObject") and obj.ViewObject else True,
-        "children": [c.Name for c in obj.OutList] if hasattr(obj, "OutList") else [],
-        "parents": [p.Name for p in obj.InList] if hasattr(obj, "InList") else [],
-    }}
-    objects.append(obj_info)
+    type_id = obj.TypeId
+    attrs = attrs_by_type.get(type_id)
+    if attrs is None:
+        attrs = attrs_by_type[type_id] = (
+            hasattr(obj, "OutList"),
+            hasattr(obj, "InList"),
+            hasattr(obj, "ViewObject"),
+        )
+    has_out_list, has_in_list, has_view = attrs
+    view = obj.ViewObject if has_view else None
+    objects.append((
+        obj.Name,
+        obj.Label,
+        type_id,
+        [c.Name for c in obj.OutList] if has_out_list else [],
+        [p.Name for p in obj.InList] if has_in_list else [],
+        view.Visibility if view else True,
+    ))
 
 _result_ = objects
 """
         result = await self.execute_python(code)
 
         if result.success and result.result:
-            return [ObjectInfo(**obj) for obj in result.result]
+            return [ObjectInfo.from_row(row) for row in result.result]
         return []
 
     async def get_object(
@@ -516,51 +896,9 @@ _result_ = objects
         doc_name: str | None = None,
     ) -> ObjectInfo:
         """Get detailed object information."""
-        code = f"""
-doc = FreeCAD.ActiveDocument if {doc_name!r} is None else FreeCAD.getDocument({doc_name!r})
-if doc is None:
-    raise ValueError("No document found")
-
-obj = doc.getObject({obj_name!r})
-if obj is None:
-    raise ValueError(f"Object not found: {obj_name!r}")
-
-props = {{}}
-for prop in obj.PropertiesList:
-    try:
-        val = getattr(obj, prop)
-        if hasattr(val, '__class__') and val.__class__.__module__ != 'builtins':
-            val = str(val)
-        props[prop] = val
-    except Exception:
-        props[prop] = "<unreadable>"
-
-shape_info = None
-if hasattr(obj, "Shape"):
-    shape = obj.Shape
-    shape_info = {{
-        "shape_type": shape.ShapeType,
-        "volume": shape.Volume if hasattr(shape, "Volume") else None,
-        "area": shape.Area if hasattr(shape, "Area") else None,
-        "is_valid": shape.isValid(),
-        "is_closed": shape.isClosed() if hasattr(shape, "isClosed") else False,
-        "vertex_count": len(shape.Vertexes) if hasattr(shape, "Vertexes") else 0,
-        "edge_count": len(shape.Edges) if hasattr(shape, "Edges") else 0,
-        "face_count": len(shape.Faces) if hasattr(shape, "Faces") else 0,
-    }}
-
-_result_ = {{
-    "name": obj.Name,
-    "label": obj.Label,
-    "type_id": obj.TypeId,
-    "properties": props,
-    "shape_info": shape_info,
-    "children": [c.Name for c in obj.OutList] if hasattr(obj, "OutList") else [],
-    "parents": [p.Name for p in obj.InList] if hasattr(obj, "InList") else [],
-    "visibility": obj.ViewObject.Visibility if hasattr(obj, "ViewObject") and obj.ViewObject else True,
-}}
-"""
-        result = await self.execute_python(code)
+        result = await self._execute_template(
+            GET_OBJECT_CODE, {"_doc_name": doc_name, "_obj_name": obj_name}
+        )
 
         if result.success and result.result:
             return ObjectInfo(**result.result)
@@ -684,7 +1022,7 @@ _result_ = True
         doc_name: str | None = None,
     ) -> ScreenshotResult:
         """Capture a screenshot of the 3D view via socket."""
-        view_angle_str = view_angle.value if view_angle else "Isometric"
+        view_method = VIEW_METHODS[view_angle or ViewAngle.ISOMETRIC]
         code = f"""
 import base64
 import tempfile
@@ -708,23 +1046,7 @@ if view_type not in ["View3DInventor", "View3DInventorPy"]:
     raise ValueError(f"Cannot capture screenshot from {{view_type}} view")
 
 # Set view angle
-view_type_str = {view_angle_str!r}
-if view_type_str == "FitAll":
-    view.fitAll()
-elif view_type_str == "Isometric":
-    view.viewIsometric()
-elif view_type_str == "Front":
-    view.viewFront()
-elif view_type_str == "Back":
-    view.viewRear()
-elif view_type_str == "Top":
-    view.viewTop()
-elif view_type_str == "Bottom":
-    view.viewBottom()
-elif view_type_str == "Left":
-    view.viewLeft()
-elif view_type_str == "Right":
-    view.viewRight()
+view.{view_method}()
 
 # Save to temp file and read
 with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
@@ -773,7 +1095,7 @@ _result_ = {{
         doc_name: str | None = None,
     ) -> None:
         """Set the 3D view angle."""
-        view_angle_str = view_angle.value
+        view_method = VIEW_METHODS[view_angle]
         code = f"""
 doc = FreeCAD.ActiveDocument if {doc_name!r} is None else FreeCAD.getDocument({doc_name!r})
 if doc is None:
@@ -786,23 +1108,7 @@ else:
     if view is None:
         raise ValueError("No active view")
 
-    view_type = {view_angle_str!r}
-    if view_type == "FitAll":
-        view.fitAll()
-    elif view_type == "Isometric":
-        view.viewIsometric()
-    elif view_type == "Front":
-        view.viewFront()
-    elif view_type == "Back":
-        view.viewRear()
-    elif view_type == "Top":
-        view.viewTop()
-    elif view_type == "Bottom":
-        view.viewBottom()
-    elif view_type == "Left":
-        view.viewLeft()
-    elif view_type == "Right":
-        view.viewRight()
+    view.{view_method}()
 
     _result_ = True
 """
@@ -944,75 +1250,20 @@ _result_ = {{
         error_msg = result.error_traceback or "Failed to create macro"
         raise ValueError(error_msg)
 
-    # =========================================================================
-    # Workbenches
-    # =========================================================================
-
-    async def get_workbenches(self) -> list[WorkbenchInfo]:
-        """Get list of available workbenches."""
-        code = """
-workbenches = []
-active_wb = FreeCADGui.activeWorkbench() if FreeCAD.GuiUp else None
-active_name = active_wb.__class__.__name__ if active_wb else None
-
-if FreeCAD.GuiUp:
-    for name in FreeCADGui.listWorkbenches():
-        wb = FreeCADGui.getWorkbench(name)
-        workbenches.append({
-            "name": name,
-            "label": wb.MenuText if hasattr(wb, "MenuText") else name,
-            "icon": wb.Icon if hasattr(wb, "Icon") else "",
-            "is_active": name == active_name,
-        })
-else:
-    common = ["StartWorkbench", "PartWorkbench", "PartDesignWorkbench",
-              "DraftWorkbench", "SketcherWorkbench", "MeshWorkbench"]
-    for name in common:
-        workbenches.append({
-            "name": name,
-            "label": name.replace("Workbench", ""),
-            "icon": "",
-            "is_active": False,
-        })
-
-_result_ = workbenches
-"""
-        result = await self.execute_python(code)
-
-        if result.success and result.result:
-            return [WorkbenchInfo(**wb) for wb in result.result]
-        return []
-
-    async def activate_workbench(self, workbench_name: str) -> None:
-        """Activate a workbench."""
-        code = f"""
-if FreeCAD.GuiUp:
-    try:
-        FreeCADGui.activateWorkbench({workbench_name!r})
-        _result_ = True
-    except Exception as e:
-        raise ValueError(f"Failed to activate workbench: {{e}}")
-else:
-    _result_ = True
-"""
-        result = await self.execute_python(code)
-
-        if not result.success:
-            error_msg = result.error_traceback or "Failed to activate workbench"
-            raise ValueError(error_msg)
-
     # =========================================================================
     # Version and Environment
     # =========================================================================
 
+    @cached_version_info
     async def get_freecad_version(self) -> dict[str, Any]:
         """Get FreeCAD version information."""
         code = """
 import sys
+version = FreeCAD.Version()
 _result_ = {
-    "version": ".".join(str(x) for x in FreeCAD.Version()[:3]),
-    "version_tuple": FreeCAD.Version()[:3],
-    "build_date": FreeCAD.Version()[3] if len(FreeCAD.Version()) > 3 else "unknown",
+    "version": ".".join(str(x) for x in version[:3]),
+    "version_tuple": version[:3],
+    "build_date": version[3] if len(version) > 3 else "unknown",
     "python_version": sys.version,
     "gui_available": FreeCAD.GuiUp,
 }
@@ -1030,6 +1281,7 @@ _result_ = {
             "gui_available": False,
         }
 
+    @gui_from_version_info
     async def is_gui_available(self) -> bool:
         """Check if FreeCAD GUI is available."""
         result = await self.execute_python("_result_ = FreeCAD.GuiUp")
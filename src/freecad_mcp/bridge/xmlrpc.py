@@ -21,9 +21,12 @@ Attribution:
 import asyncio
 import time
 import xmlrpc.client
+from collections.abc import Callable
 from typing import Any
 
 from freecad_mcp.bridge.base import (
+    GET_OBJECT_CODE,
+    VIEW_METHODS,
     ConnectionStatus,
     DocumentInfo,
     ExecutionResult,
@@ -32,13 +35,18 @@ from freecad_mcp.bridge.base import (
     ObjectInfo,
     ScreenshotResult,
     ViewAngle,
-    WorkbenchInfo,
+    cached_version_info,
+    gui_from_version_info,
+    resets_instance_info,
 )
 
 DEFAULT_XMLRPC_HOST = "localhost"
 DEFAULT_XMLRPC_PORT = 9875
 DEFAULT_TIMEOUT = 30.0
 
+# Most XML-RPC requests kept in flight at once, each on its own ServerProxy
+XMLRPC_POOL_SIZE = 4
+
 
 class XmlRpcBridge(FreecadBridge):
     """Bridge that communicates with FreeCAD via XML-RPC.
@@ -47,6 +55,11 @@ class XmlRpcBridge(FreecadBridge):
     XML-RPC server addon. It provides full access to FreeCAD functionality
     including GUI operations like screenshots.
 
+    ServerProxy keeps a single HTTP connection and is not safe to use from
+    several threads, so concurrent calls each take a proxy from a small
+    pool (at most XMLRPC_POOL_SIZE requests are in flight at once) instead
+    of sharing one.
+
     Attributes:
         host: XML-RPC server hostname.
         port: XML-RPC server port.
@@ -70,28 +83,58 @@ class XmlRpcBridge(FreecadBridge):
         self._port = port
         self._timeout = timeout
         self._proxy: xmlrpc.client.ServerProxy | None = None
+        self._idle_proxies: list[xmlrpc.client.ServerProxy] = []
+        self._pool_slots = asyncio.Semaphore(XMLRPC_POOL_SIZE)
         self._connected = False
+        self._multicall_supported = True
 
     @property
     def _server_url(self) -> str:
         """Get the XML-RPC server URL."""
         return f"http://{self._host}:{self._port}"
 
+    def _new_proxy(self) -> xmlrpc.client.ServerProxy:
+        """Create a proxy for the server. This does no I/O."""
+        return xmlrpc.client.ServerProxy(self._server_url, allow_none=True)
+
+    async def _call(
+        self,
+        func: Callable[[xmlrpc.client.ServerProxy], Any],
+        timeout_s: float,
+    ) -> Any:
+        """Run func with an idle proxy in a worker thread.
+
+        A proxy whose call raised or timed out may still be in use by its
+        thread, so it is dropped rather than returned to the pool.
+
+        Args:
+            func: Function making the XML-RPC call on the given proxy.
+            timeout_s: Seconds to wait for the call.
+
+        Returns:
+            What func returned.
+        """
+        async with self._pool_slots:
+            # Proxies are returned to the pool they came from, so calls
+            # still running across a reconnect don't join the new pool
+            pool = self._idle_proxies
+            proxy = pool.pop() if pool else self._new_proxy()
+            result = await asyncio.wait_for(asyncio.to_thread(func, proxy), timeout_s)
+            pool.append(proxy)
+            return result
+
+    @resets_instance_info
     async def connect(self) -> None:
         """Establish connection to FreeCAD XML-RPC server.
 
         Raises:
             ConnectionError: If connection cannot be established.
         """
-        loop = asyncio.get_event_loop()
         try:
-            self._proxy = await loop.run_in_executor(
-                None,
-                lambda: xmlrpc.client.ServerProxy(
-                    self._server_url,
-                    allow_none=True,
-                ),
-            )
+            # Creating the proxy does no I/O (the HTTP connection is opened on
+            # the first call), so there is no need for an executor hop here.
+            self._proxy = self._new_proxy()
+            self._idle_proxies = [self._proxy]
             # Test connection with a ping
             await self.ping()
             self._connected = True
@@ -137,9 +180,11 @@ The FreeCAD Robust MCP Bridge server is not running. To fix this:
 ================================================================================
 """
 
+    @resets_instance_info
     async def disconnect(self) -> None:
         """Close connection to FreeCAD XML-RPC server."""
         self._proxy = None
+        self._idle_proxies = []
         self._connected = False
 
     async def is_connected(self) -> bool:
@@ -167,21 +212,11 @@ The FreeCAD Robust MCP Bridge server is not running. To fix this:
             msg = "Not connected to XML-RPC server"
             raise ConnectionError(msg)
 
-        loop = asyncio.get_event_loop()
         start = time.perf_counter()
 
         try:
-            # Try standard system.listMethods or a simple execute
-            if self._proxy is None:
-                msg = "Not connected"
-                raise ConnectionError(msg)
-            proxy = self._proxy  # Local reference for lambda
-            await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    lambda: proxy.execute("_result_ = True"),
-                ),
-                timeout=self._timeout,
+            await self._call(
+                lambda proxy: proxy.execute("_result_ = True"), self._timeout
             )
         except TimeoutError as e:
             msg = "Ping timed out"
@@ -206,15 +241,13 @@ The FreeCAD Robust MCP Bridge server is not running. To fix this:
             )
 
         try:
-            ping_ms = await self.ping()
-            version_info = await self.get_freecad_version()
-            gui_available = await self.is_gui_available()
+            ping_ms, version_info = await self._probe_status()
 
             return ConnectionStatus(
                 connected=True,
                 mode="xmlrpc",
                 freecad_version=version_info.get("version", "unknown"),
-                gui_available=gui_available,
+                gui_available=bool(version_info.get("gui_available")),
                 last_ping_ms=ping_ms,
             )
         except Exception as e:
@@ -252,40 +285,20 @@ The FreeCAD Robust MCP Bridge server is not running. To fix this:
                 error_type="ConnectionError",
             )
 
-        loop = asyncio.get_event_loop()
+        batched = self._queue_for_batch(code, timeout_ms)
+        if batched is not None:
+            return await batched
+
         start = time.perf_counter()
-        proxy = self._proxy  # Local reference for lambda
 
         try:
-            result = await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    lambda: proxy.execute(code),
-                ),
-                timeout=timeout_ms / 1000,
+            result = await self._call(
+                lambda proxy: proxy.execute(code), timeout_ms / 1000
             )
             elapsed = (time.perf_counter() - start) * 1000
 
             # Parse result from XML-RPC server
-            if isinstance(result, dict):
-                return ExecutionResult(
-                    success=result.get("success", False),
-                    result=result.get("result"),
-                    stdout=result.get("stdout", ""),
-                    stderr=result.get("stderr", ""),
-                    execution_time_ms=elapsed,
-                    error_type=result.get("error_type"),
-                    error_traceback=result.get("error_traceback"),
-                )
-            else:
-                # Simple result format
-                return ExecutionResult(
-                    success=True,
-                    result=result,
-                    stdout="",
-                    stderr="",
-                    execution_time_ms=elapsed,
-                )
+            return ExecutionResult.from_response(result, elapsed)
 
         except TimeoutError:
             return ExecutionResult(
@@ -307,6 +320,84 @@ The FreeCAD Robust MCP Bridge server is not running. To fix this:
                 error_type=type(e).__name__,
             )
 
+    async def execute_python_many(
+        self,
+        codes: list[str],
+        timeout_ms: int = 30000,
+    ) -> list[ExecutionResult]:
+        """Execute several Python snippets with one ``system.multicall`` request.
+
+        Falls back to one request per snippet when the server does not
+        support ``system.multicall``.
+
+        Args:
+            codes: Python code snippets to execute.
+            timeout_ms: Maximum execution time per snippet in milliseconds.
+
+        Returns:
+            One ExecutionResult per snippet, in the same order as codes.
+        """
+        if not codes or self._proxy is None or not self._multicall_supported:
+            return await super().execute_python_many(codes, timeout_ms)
+
+        def send(proxy: xmlrpc.client.ServerProxy) -> Any:
+            multicall = xmlrpc.client.MultiCall(proxy)
+            for code in codes:
+                multicall.execute(code)
+            return multicall()
+
+        start = time.perf_counter()
+
+        try:
+            responses = await self._call(send, timeout_ms * len(codes) / 1000)
+        except xmlrpc.client.Fault:
+            # Servers that predate batching don't register system.multicall
+            self._multicall_supported = False
+            return await super().execute_python_many(codes, timeout_ms)
+        except TimeoutError:
+            return [
+                ExecutionResult(
+                    success=False,
+                    result=None,
+                    stdout="",
+                    stderr=f"Execution timed out after {timeout_ms * len(codes)}ms",
+                    execution_time_ms=float(timeout_ms * len(codes)),
+                    error_type="TimeoutError",
+                )
+                for _ in codes
+            ]
+        except Exception as e:
+            elapsed = (time.perf_counter() - start) * 1000
+            return [
+                ExecutionResult(
+                    success=False,
+                    result=None,
+                    stdout="",
+                    stderr=str(e),
+                    execution_time_ms=elapsed,
+                    error_type=type(e).__name__,
+                )
+                for _ in codes
+            ]
+
+        elapsed = (time.perf_counter() - start) * 1000
+        results = []
+        for index in range(len(codes)):
+            try:
+                results.append(ExecutionResult.from_response(responses[index], elapsed))
+            except xmlrpc.client.Fault as e:
+                results.append(
+                    ExecutionResult(
+                        success=False,
+                        result=None,
+                        stdout="",
+                        stderr=e.faultString,
+                        execution_time_ms=elapsed,
+                        error_type="Fault",
+                    )
+                )
+        return results
+
     # =========================================================================
     # Document Management
     # =========================================================================
@@ -465,24 +556,37 @@ doc = FreeCAD.ActiveDocument if {doc_name!r} is None else FreeCAD.getDocument({d
 if doc is None:
     raise ValueError("No document found")
 
+# One (name, label, type_id, children, parents, visibility) row per object,
+# see ObjectInfo.from_row()
+# Which optional attributes objects have, looked up once per TypeId
+attrs_by_type = {{}}
 objects = []
 for obj in doc.Objects:
-    obj_info = {{
-        "name": obj.Name,
-        "label": obj.Label,
-        "type_id": obj.TypeId,
-        "visibility": obj.ViewObject.Visibility if hasattr(obj, "ViewObject") and obj.ViewObject else True,
-        "children": [c.Name for c in obj.OutList] if hasattr(obj, "OutList") else [],
-        "parents": [p.Name for p in obj.InList] if hasattr(obj, "InList") else [],
-    }}
-    objects.append(obj_info)
+    type_id = obj.TypeId
+    attrs = attrs_by_type.get(type_id)
+    if attrs is None:
+        attrs = attrs_by_type[type_id] = (
+            hasattr(obj, "OutList"),
+            hasattr(obj, "InList"),
+            hasattr(obj, "ViewObject"),
+        )
+    has_out_list, has_in_list, has_view = attrs
+    view = obj.ViewObject if has_view else None
+    objects.append((
+        obj.Name,
+        obj.Label,
+        type_id,
+        [c.Name for c in obj.OutList] if has_out_list else [],
+        [p.Name for p in obj.InList] if has_in_list else [],
+        view.Visibility if view else True,
+    ))
 
 _result_ = objects
 """
         result = await self.execute_python(code)
 
         if result.success and result.result:
-            return [ObjectInfo(**obj) for obj in result.result]
+            return [ObjectInfo.from_row(row) for row in result.result]
         return []
 
     async def get_object(
@@ -491,51 +595,9 @@ _result_ = objects
         doc_name: str | None = None,
     ) -> ObjectInfo:
         """Get detailed object information."""
-        code = f"""
-doc = FreeCAD.ActiveDocument if {doc_name!r} is None else FreeCAD.getDocument({doc_name!r})
-if doc is None:
-    raise ValueError("No document found")
-
-obj = doc.getObject({obj_name!r})
-if obj is None:
-    raise ValueError(f"Object not found: {obj_name!r}")
-
-props = {{}}
-for prop in obj.PropertiesList:
-    try:
-        val = getattr(obj, prop)
-        if hasattr(val, '__class__') and val.__class__.__module__ != 'builtins':
-            val = str(val)
-        props[prop] = val
-    except Exception:
-        props[prop] = "<unreadable>"
-
-shape_info = None
-if hasattr(obj, "Shape"):
-    shape = obj.Shape
-    shape_info = {{
-        "shape_type": shape.ShapeType,
-        "volume": shape.Volume if hasattr(shape, "Volume") else None,
-        "area": shape.Area if hasattr(shape, "Area") else None,
-        "is_valid": shape.isValid(),
-        "is_closed": shape.isClosed() if hasattr(shape, "isClosed") else False,
-        "vertex_count": len(shape.Vertexes) if hasattr(shape, "Vertexes") else 0,
-        "edge_count": len(shape.Edges) if hasattr(shape, "Edges") else 0,
-        "face_count": len(shape.Faces) if hasattr(shape, "Faces") else 0,
-    }}
-
-_result_ = {{
-    "name": obj.Name,
-    "label": obj.Label,
-    "type_id": obj.TypeId,
-    "properties": props,
-    "shape_info": shape_info,
-    "children": [c.Name for c in obj.OutList] if hasattr(obj, "OutList") else [],
-    "parents": [p.Name for p in obj.InList] if hasattr(obj, "InList") else [],
-    "visibility": obj.ViewObject.Visibility if hasattr(obj, "ViewObject") and obj.ViewObject else True,
-}}
-"""
-        result = await self.execute_python(code)
+        result = await self._execute_template(
+            GET_OBJECT_CODE, {"_doc_name": doc_name, "_obj_name": obj_name}
+        )
 
         if result.success and result.result:
             return ObjectInfo(**result.result)
@@ -681,7 +743,7 @@ _result_ = True
         doc_name: str | None = None,
     ) -> ScreenshotResult:
         """Capture a screenshot of the 3D view via XML-RPC."""
-        view_angle_str = view_angle.value if view_angle else "Isometric"
+        view_method = VIEW_METHODS[view_angle or ViewAngle.ISOMETRIC]
         code = f"""
 import base64
 import tempfile
@@ -707,23 +769,7 @@ if view_type not in ["View3DInventor", "View3DInventorPy"]:
     raise ValueError(f"Cannot capture screenshot from {{view_type}} view")
 
 # Set view angle
-view_type_str = {view_angle_str!r}
-if view_type_str == "FitAll":
-    view.fitAll()
-elif view_type_str == "Isometric":
-    view.viewIsometric()
-elif view_type_str == "Front":
-    view.viewFront()
-elif view_type_str == "Back":
-    view.viewRear()
-elif view_type_str == "Top":
-    view.viewTop()
-elif view_type_str == "Bottom":
-    view.viewBottom()
-elif view_type_str == "Left":
-    view.viewLeft()
-elif view_type_str == "Right":
-    view.viewRight()
+view.{view_method}()
 
 # Save to temp file and read
 with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
@@ -772,7 +818,7 @@ _result_ = {{
         doc_name: str | None = None,
     ) -> None:
         """Set the 3D view angle."""
-        view_angle_str = view_angle.value
+        view_method = VIEW_METHODS[view_angle]
         code = f"""
 doc = FreeCAD.ActiveDocument if {doc_name!r} is None else FreeCAD.getDocument({doc_name!r})
 if doc is None:
@@ -785,23 +831,7 @@ else:
     if view is None:
         raise ValueError("No active view")
 
-    view_type = {view_angle_str!r}
-    if view_type == "FitAll":
-        view.fitAll()
-    elif view_type == "Isometric":
-        view.viewIsometric()
-    elif view_type == "Front":
-        view.viewFront()
-    elif view_type == "Back":
-        view.viewRear()
-    elif view_type == "Top":
-        view.viewTop()
-    elif view_type == "Bottom":
-        view.viewBottom()
-    elif view_type == "Left":
-        view.viewLeft()
-    elif view_type == "Right":
-        view.viewRight()
+    view.{view_method}()
 
     _result_ = True
 """
@@ -951,76 +981,20 @@ _result_ = {{
         error_msg = result.error_traceback or "Failed to create macro"
         raise ValueError(error_msg)
 
-    # =========================================================================
-    # Workbenches
-    # =========================================================================
-
-    async def get_workbenches(self) -> list[WorkbenchInfo]:
-        """Get list of available workbenches."""
-        code = """
-workbenches = []
-active_wb = FreeCADGui.activeWorkbench() if FreeCAD.GuiUp else None
-active_name = active_wb.__class__.__name__ if active_wb else None
-
-if FreeCAD.GuiUp:
-    for name in FreeCADGui.listWorkbenches():
-        wb = FreeCADGui.getWorkbench(name)
-        workbenches.append({
-            "name": name,
-            "label": wb.MenuText if hasattr(wb, "MenuText") else name,
-            "icon": wb.Icon if hasattr(wb, "Icon") else "",
-            "is_active": name == active_name,
-        })
-else:
-    # Return common workbenches for headless mode
-    common = ["StartWorkbench", "PartWorkbench", "PartDesignWorkbench",
-              "DraftWorkbench", "SketcherWorkbench", "MeshWorkbench"]
-    for name in common:
-        workbenches.append({
-            "name": name,
-            "label": name.replace("Workbench", ""),
-            "icon": "",
-            "is_active": False,
-        })
-
-_result_ = workbenches
-"""
-        result = await self.execute_python(code)
-
-        if result.success and result.result:
-            return [WorkbenchInfo(**wb) for wb in result.result]
-        return []
-
-    async def activate_workbench(self, workbench_name: str) -> None:
-        """Activate a workbench."""
-        code = f"""
-if FreeCAD.GuiUp:
-    try:
-        FreeCADGui.activateWorkbench({workbench_name!r})
-        _result_ = True
-    except Exception as e:
-        raise ValueError(f"Failed to activate workbench: {{e}}")
-else:
-    _result_ = True  # Silently succeed in headless mode
-"""
-        result = await self.execute_python(code)
-
-        if not result.success:
-            error_msg = result.error_traceback or "Failed to activate workbench"
-            raise ValueError(error_msg)
-
     # =========================================================================
     # Version and Environment
     # =========================================================================
 
+    @cached_version_info
     async def get_freecad_version(self) -> dict[str, Any]:
         """Get FreeCAD version information."""
         code = """
 import sys
+version = FreeCAD.Version()
 _result_ = {
-    "version": ".".join(str(x) for x in FreeCAD.Version()[:3]),
-    "version_tuple": FreeCAD.Version()[:3],
-    "build_date": FreeCAD.Version()[3] if len(FreeCAD.Version()) > 3 else "unknown",
+    "version": ".".join(str(x) for x in version[:3]),
+    "version_tuple": version[:3],
+    "build_date": version[3] if len(version) > 3 else "unknown",
     "python_version": sys.version,
     "gui_available": FreeCAD.GuiUp,
 }
@@ -1038,6 +1012,7 @@ _result_ = {
             "gui_available": False,
         }
 
+    @gui_from_version_info
     async def is_gui_available(self) -> bool:
         """Check if FreeCAD GUI is available."""
         result = await self.execute_python("_result_ = FreeCAD.GuiUp")
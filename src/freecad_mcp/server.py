@@ -180,6 +180,16 @@ def register_all_components() -> None:
     register_prompts(mcp, get_bridge)
 
 
+# When run as ``python -m freecad_mcp.server`` this file executes as __main__,
+# and freecad_mcp/__init__.py no longer imports it as freecad_mcp.server first.
+# tools/execution.py does ``from freecad_mcp.server import get_instance_id``
+# while register_all_components() below runs. Without this alias that import
+# would execute this file a second time as a separate module, with its own
+# FastMCP instance, bridge and instance ID, and the tools would read the
+# state of that copy instead of the server that is actually running.
+if __name__ == "__main__":
+    sys.modules.setdefault("freecad_mcp.server", sys.modules[__name__])
+
 # Register all components
 register_all_components()
 
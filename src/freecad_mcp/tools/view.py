@@ -51,29 +51,17 @@ def register_view_tools(mcp: Any, get_bridge: Callable[[], Awaitable[Any]]) -> N
                 - height: Actual image height
                 - error: Error message (if not success)
         """
-        from freecad_mcp.bridge.base import ViewAngle
-
-        # Map string to ViewAngle enum
-        angle_map = {
-            "Isometric": ViewAngle.ISOMETRIC,
-            "Front": ViewAngle.FRONT,
-            "Back": ViewAngle.BACK,
-            "Top": ViewAngle.TOP,
-            "Bottom": ViewAngle.BOTTOM,
-            "Left": ViewAngle.LEFT,
-            "Right": ViewAngle.RIGHT,
-            "FitAll": ViewAngle.FIT_ALL,
-        }
+        from freecad_mcp.bridge.base import VIEW_ANGLES_BY_VALUE
 
-        if view_angle not in angle_map:
+        if view_angle not in VIEW_ANGLES_BY_VALUE:
             return {
                 "success": False,
-                "error": f"Invalid view_angle: {view_angle}. Options: {list(angle_map.keys())}",
+                "error": f"Invalid view_angle: {view_angle}. Options: {list(VIEW_ANGLES_BY_VALUE.keys())}",
             }
 
         bridge = await get_bridge()
         result = await bridge.get_screenshot(
-            view_angle=angle_map[view_angle],
+            view_angle=VIEW_ANGLES_BY_VALUE[view_angle],
             width=width,
             height=height,
             doc_name=doc_name,
@@ -111,27 +99,16 @@ def register_view_tools(mcp: Any, get_bridge: Callable[[], Awaitable[Any]]) -> N
             Dictionary with result:
                 - success: Whether operation was successful
         """
-        from freecad_mcp.bridge.base import ViewAngle
-
-        angle_map = {
-            "Isometric": ViewAngle.ISOMETRIC,
-            "Front": ViewAngle.FRONT,
-            "Back": ViewAngle.BACK,
-            "Top": ViewAngle.TOP,
-            "Bottom": ViewAngle.BOTTOM,
-            "Left": ViewAngle.LEFT,
-            "Right": ViewAngle.RIGHT,
-            "FitAll": ViewAngle.FIT_ALL,
-        }
+        from freecad_mcp.bridge.base import VIEW_ANGLES_BY_VALUE
 
-        if view_angle not in angle_map:
+        if view_angle not in VIEW_ANGLES_BY_VALUE:
             return {
                 "success": False,
-                "error": f"Invalid view_angle: {view_angle}. Options: {list(angle_map.keys())}",
+                "error": f"Invalid view_angle: {view_angle}. Options: {list(VIEW_ANGLES_BY_VALUE.keys())}",
             }
 
         bridge = await get_bridge()
-        await bridge.set_view(angle_map[view_angle], doc_name)
+        await bridge.set_view(VIEW_ANGLES_BY_VALUE[view_angle], doc_name)
         return {"success": True}
 
     @mcp.tool()
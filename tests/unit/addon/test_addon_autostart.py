@@ -119,8 +119,8 @@ class TestAutoStartInitLogic:
         assert "True headless mode" in init_code or "headless" in init_code.lower()
         # Should check QCoreApplication to detect true headless
         assert "QCoreApplication" in init_code
-        # Should use isinstance to distinguish QCoreApplication from QApplication
-        assert "isinstance" in init_code
+        # Detection is shared with startup_bridge.py via bridge_utils
+        assert "detect_qt_mode()" in init_code
 
     def test_imports_gui_waiter(self, init_code: str) -> None:
         """__init__.py should import GuiWaiter for waiting on GUI."""
@@ -161,49 +161,71 @@ class TestAutoStartInitLogic:
 
 
 class TestAutoStartBridgeFunction:
-    """Tests for the _auto_start_bridge function."""
+    """Tests for the _auto_start_bridge function.
+
+    The start logic itself is shared with init_gui.py through
+    bridge_utils.ensure_bridge_started().
+    """
 
     @pytest.fixture
     def init_code(self) -> str:
         """Load __init__.py content."""
         return (ADDON_DIR / "__init__.py").read_text()
 
+    @pytest.fixture
+    def ensure_started_code(self) -> str:
+        """Load the source of bridge_utils.ensure_bridge_started()."""
+        code = (ADDON_DIR / "freecad_mcp_bridge" / "bridge_utils.py").read_text()
+        for node in ast.walk(ast.parse(code)):
+            if (
+                isinstance(node, ast.FunctionDef)
+                and node.name == "ensure_bridge_started"
+            ):
+                return ast.unparse(node)
+        pytest.fail("ensure_bridge_started function not found in bridge_utils.py")
+
     def test_auto_start_bridge_function_exists(self, init_code: str) -> None:
         """_auto_start_bridge function should exist."""
         assert "def _auto_start_bridge" in init_code
 
-    def test_auto_start_bridge_checks_preference_again(self, init_code: str) -> None:
-        """_auto_start_bridge should re-check preference before starting.
-
-        This handles the case where preference changed between __init__.py load
-        and the deferred timer firing.
-        """
-        # Parse the function body
+    def test_auto_start_bridge_uses_shared_helper(self, init_code: str) -> None:
+        """_auto_start_bridge should delegate to ensure_bridge_started()."""
         tree = ast.parse(init_code)
         for node in ast.walk(tree):
             if isinstance(node, ast.FunctionDef) and node.name == "_auto_start_bridge":
-                # Convert function body back to source for analysis
-                func_code = ast.unparse(node)
-                assert "get_auto_start" in func_code
+                assert "ensure_bridge_started()" in ast.unparse(node)
                 return
         pytest.fail("_auto_start_bridge function not found")
 
-    def test_auto_start_bridge_checks_if_already_running(self, init_code: str) -> None:
-        """_auto_start_bridge should check if bridge is already running."""
-        # Should check _mcp_plugin.is_running or similar
-        assert "is_running" in init_code
+    def test_auto_start_bridge_checks_preference_again(
+        self, ensure_started_code: str
+    ) -> None:
+        """The start path should re-check preference before starting.
+
+        This handles the case where preference changed between __init__.py load
+        and the deferred timer firing.
+        """
+        assert "get_auto_start" in ensure_started_code
+
+    def test_auto_start_bridge_checks_if_already_running(
+        self, ensure_started_code: str
+    ) -> None:
+        """The start path should check if bridge is already running."""
+        assert "is_bridge_running" in ensure_started_code
 
-    def test_auto_start_bridge_logs_start_message(self, init_code: str) -> None:
-        """_auto_start_bridge should log when auto-starting."""
-        assert "Auto-starting MCP Bridge" in init_code
+    def test_auto_start_bridge_logs_start_message(
+        self, ensure_started_code: str
+    ) -> None:
+        """The start path should log when auto-starting."""
+        assert "Auto-starting MCP Bridge" in ensure_started_code
 
-    def test_auto_start_bridge_creates_plugin(self, init_code: str) -> None:
-        """_auto_start_bridge should create a FreecadMCPPlugin instance."""
-        assert "FreecadMCPPlugin" in init_code
+    def test_auto_start_bridge_creates_plugin(self, ensure_started_code: str) -> None:
+        """The start path should create a FreecadMCPPlugin instance."""
+        assert "FreecadMCPPlugin" in ensure_started_code
 
-    def test_auto_start_bridge_registers_plugin(self, init_code: str) -> None:
-        """_auto_start_bridge should register plugin with commands module."""
-        assert "register_mcp_plugin" in init_code
+    def test_auto_start_bridge_registers_plugin(self, ensure_started_code: str) -> None:
+        """The start path should register plugin with commands module."""
+        assert "register_mcp_plugin" in ensure_started_code
 
     def test_auto_start_bridge_handles_exceptions(self, init_code: str) -> None:
         """_auto_start_bridge should catch and log exceptions."""
@@ -281,7 +303,8 @@ class TestInitGuiAutoStart:
 
     init_gui.py is the primary entry point for auto-start at FreeCAD GUI startup.
     __init__.py does NOT run at startup for workbench addons, so init_gui.py must
-    handle auto-start using QTimer.singleShot() to defer the bridge start.
+    handle auto-start using a GuiWaiter to defer the bridge start until the GUI
+    is ready.
     """
 
     @pytest.fixture
@@ -290,11 +313,20 @@ class TestInitGuiAutoStart:
         return (ADDON_DIR / "init_gui.py").read_text()
 
     def test_uses_single_shot_timer_for_auto_start(self, initgui_code: str) -> None:
-        """init_gui.py should use QTimer.singleShot for deferred auto-start."""
-        # Should use singleShot with a delay
+        """init_gui.py should reschedule auto-start with QTimer.singleShot.
+
+        _auto_start_bridge re-checks FreeCAD.GuiUp and retries via singleShot
+        if it is called before the GUI is ready.
+        """
         assert "QTimer.singleShot" in initgui_code
         assert "_auto_start_bridge" in initgui_code
 
+    def test_waits_for_gui_instead_of_fixed_delay(self, initgui_code: str) -> None:
+        """Startup work should wait for GuiUp rather than sleep 2-3 seconds."""
+        assert "from freecad_mcp_bridge.bridge_utils import GuiWaiter" in initgui_code
+        assert "singleShot(2000" not in initgui_code
+        assert "singleShot(3000" not in initgui_code
+
     def test_checks_auto_start_preference(self, initgui_code: str) -> None:
         """init_gui.py should check auto-start preference before scheduling.
 
@@ -333,13 +365,15 @@ class TestInitGuiAutoStart:
         assert "def _auto_start_bridge" in initgui_code
 
     def test_auto_start_bridge_checks_if_running(self, initgui_code: str) -> None:
-        """_auto_start_bridge should check if bridge is already running."""
-        # Parse the function and check for is_bridge_running check
+        """_auto_start_bridge should use the idempotent shared start helper.
+
+        ensure_bridge_started() skips the start if a bridge is already running.
+        """
         tree = ast.parse(initgui_code)
         for node in ast.walk(tree):
             if isinstance(node, ast.FunctionDef) and node.name == "_auto_start_bridge":
                 func_code = ast.unparse(node)
-                assert "is_bridge_running" in func_code
+                assert "ensure_bridge_started()" in func_code
                 return
         pytest.fail("_auto_start_bridge function not found")
 
@@ -354,6 +388,70 @@ class TestInitGuiAutoStart:
                 return
         pytest.fail("_auto_start_bridge function not found")
 
+    def test_deferred_init_starts_before_syncing(self, initgui_code: str) -> None:
+        """_deferred_init should auto-start first, then sync the status bar."""
+        tree = ast.parse(initgui_code)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.FunctionDef) and node.name == "_deferred_init":
+                func_code = ast.unparse(node)
+                start_pos = func_code.find("_auto_start_bridge()")
+                sync_pos = func_code.find("_deferred_status_bar_sync()")
+                assert 0 <= start_pos < sync_pos
+                return
+        pytest.fail("_deferred_init function not found")
+
+    def test_server_imported_only_inside_callbacks(self, initgui_code: str) -> None:
+        """The bridge server should only be imported inside function bodies.
+
+        Module-level code runs at every FreeCAD GUI startup, so importing the
+        server there would cost users who never start the bridge.
+        """
+        tree = ast.parse(initgui_code)
+        function_nodes = {
+            id(child)
+            for node in ast.walk(tree)
+            if isinstance(node, ast.FunctionDef)
+            for child in ast.walk(node)
+        }
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.ImportFrom)
+                and node.module == "freecad_mcp_bridge.server"
+            ):
+                assert id(node) in function_nodes, (
+                    "freecad_mcp_bridge.server should not be imported at module level"
+                )
+
+    def test_status_bar_sync_checks_preference_first(self, initgui_code: str) -> None:
+        """The status widget should only be imported if the status bar is enabled."""
+        tree = ast.parse(initgui_code)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.FunctionDef) and node.name == "_sync_status_bar":
+                func_code = ast.unparse(node)
+                check_pos = func_code.find("get_status_bar_enabled()")
+                import_pos = func_code.find("from Qt.status_widget import")
+                assert 0 <= check_pos < import_pos
+                return
+        pytest.fail("_sync_status_bar function not found")
+
+    def test_deferred_sync_checks_bridge_before_widget_import(
+        self, initgui_code: str
+    ) -> None:
+        """The status widget should only be imported once a bridge is running."""
+        tree = ast.parse(initgui_code)
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.FunctionDef)
+                and node.name == "_deferred_status_bar_sync"
+            ):
+                func_code = ast.unparse(node)
+                running_pos = func_code.find("is_bridge_running()")
+                enabled_pos = func_code.find("get_status_bar_enabled()")
+                import_pos = func_code.find("from Qt.status_widget import")
+                assert 0 <= running_pos < enabled_pos < import_pos
+                return
+        pytest.fail("_deferred_status_bar_sync function not found")
+
     def test_logs_auto_start_scheduled(self, initgui_code: str) -> None:
         """init_gui.py should log when auto-start is scheduled."""
         assert "Auto-start scheduled" in initgui_code
@@ -371,6 +469,11 @@ class TestAutoStartCodePaths:
         """Load __init__.py content."""
         return (ADDON_DIR / "__init__.py").read_text()
 
+    @pytest.fixture
+    def bridge_utils_code(self) -> str:
+        """Load bridge_utils.py content (shared Qt mode detection)."""
+        return (ADDON_DIR / "freecad_mcp_bridge" / "bridge_utils.py").read_text()
+
     def test_four_startup_scenarios_documented(self, init_code: str) -> None:
         """__init__.py should document the four startup scenarios.
 
@@ -397,17 +500,19 @@ class TestAutoStartCodePaths:
         found = sum(1 for pattern in log_patterns if pattern in init_code)
         assert found >= 4, f"Expected 4 code paths with logging, found {found}"
 
-    def test_pyside_fallback_from_2_to_6(self, init_code: str) -> None:
+    def test_pyside_fallback_from_2_to_6(self, bridge_utils_code: str) -> None:
         """Should try PySide2 first, then fall back to PySide6."""
         # Check for both imports
-        assert "PySide2" in init_code
-        assert "PySide6" in init_code
+        assert "PySide2" in bridge_utils_code
+        assert "PySide6" in bridge_utils_code
         # PySide2 should be tried first (common pattern)
-        pyside2_pos = init_code.find("PySide2")
-        pyside6_pos = init_code.find("PySide6")
+        pyside2_pos = bridge_utils_code.find("PySide2")
+        pyside6_pos = bridge_utils_code.find("PySide6")
         assert pyside2_pos < pyside6_pos, "Should try PySide2 before PySide6"
 
-    def test_true_headless_detection_via_isinstance(self, init_code: str) -> None:
+    def test_true_headless_detection_via_isinstance(
+        self, init_code: str, bridge_utils_code: str
+    ) -> None:
         """Should use isinstance to detect true headless mode.
 
         True headless mode is when QCoreApplication exists but is NOT a
@@ -418,8 +523,8 @@ class TestAutoStartCodePaths:
         FreeCAD.GuiUp in those cases.
         """
         # Should check QCoreApplication.instance()
-        assert "QCoreApplication.instance()" in init_code
+        assert "QCoreApplication.instance()" in bridge_utils_code
         # Should use isinstance to check if it's a QApplication
-        assert "isinstance" in init_code
+        assert "isinstance" in bridge_utils_code
         # Should have a variable tracking true headless state
         assert "_is_true_headless" in init_code
@@ -146,6 +146,33 @@ class TestAddonMetadata:
         code = init_gui_file.read_text()
         assert "Gui.addWorkbench" in code
 
+    def test_init_gui_py_registers_preferences_page_lazily(self) -> None:
+        """init_gui.py should only import the preferences page module on demand."""
+        tree = ast.parse((ADDON_DIR / "init_gui.py").read_text())
+        function_nodes = {
+            id(child)
+            for node in ast.walk(tree)
+            if isinstance(node, ast.FunctionDef)
+            for child in ast.walk(node)
+        }
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.ImportFrom)
+                and node.module == "Qt.preferences_page"
+            ):
+                assert id(node) in function_nodes, (
+                    "Qt.preferences_page should not be imported at module level"
+                )
+        registrations = [
+            node
+            for node in ast.walk(tree)
+            if isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "addPreferencePage"
+        ]
+        assert len(registrations) == 1
+        assert ast.unparse(registrations[0].args[0]) == "_LazyPreferencesPage"
+
     def test_bridge_server_has_plugin_class(self) -> None:
         """Bridge server.py should have FreecadMCPPlugin class."""
         server_file = ADDON_DIR / "freecad_mcp_bridge" / "server.py"
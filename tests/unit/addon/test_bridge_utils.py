@@ -0,0 +1,314 @@
+"""Tests for the Robust MCP Bridge shared bridge utilities.
+
+bridge_utils.py is imported as freecad_mcp_bridge.bridge_utils from inside
+FreeCAD, so these tests load it directly from the addon directory with
+PySide mocked.
+"""
+
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import os
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Get the addon directory path (new-style namespace package format)
+ADDON_DIR = Path(__file__).parent.parent.parent.parent / "freecad" / "RobustMCPBridge"
+
+
+class _QApplication:
+    """Stand-in for QtWidgets.QApplication with a controllable instance()."""
+
+    current: object | None = None
+
+    @classmethod
+    def instance(cls) -> object | None:
+        return cls.current
+
+
+@pytest.fixture
+def qt_modules():
+    """Provide mocked PySide2 QtCore/QtWidgets modules."""
+    _QApplication.current = None
+    qtcore = MagicMock()
+    qtcore.QCoreApplication.instance.return_value = None
+    qtwidgets = MagicMock()
+    qtwidgets.QApplication = _QApplication
+    pyside2 = MagicMock(QtCore=qtcore, QtWidgets=qtwidgets)
+    pyside2.__spec__ = importlib.machinery.ModuleSpec("PySide2", None)
+    with patch.dict(
+        sys.modules,
+        {
+            "PySide2": pyside2,
+            "PySide2.QtCore": qtcore,
+            "PySide2.QtWidgets": qtwidgets,
+        },
+    ):
+        yield qtcore, qtwidgets
+
+
+@pytest.fixture
+def bridge_utils():
+    """Load a fresh copy of bridge_utils.py."""
+    spec = importlib.util.spec_from_file_location(
+        "bridge_utils", ADDON_DIR / "freecad_mcp_bridge" / "bridge_utils.py"
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {"bridge_utils": module}):
+        spec.loader.exec_module(module)
+        yield module
+
+
+class TestDetectQtMode:
+    """Tests for detect_qt_mode()."""
+
+    def test_qapplication_running(self, bridge_utils, qt_modules) -> None:
+        """A QApplication instance means GUI mode."""
+        qtcore, qtwidgets = qt_modules
+        _QApplication.current = object()
+
+        mode = bridge_utils.detect_qt_mode()
+
+        assert mode.qtcore is qtcore
+        assert mode.qtwidgets is qtwidgets
+        assert mode.has_qapp is True
+        assert mode.is_true_headless is False
+
+    def test_core_application_only_is_true_headless(
+        self, bridge_utils, qt_modules
+    ) -> None:
+        """A QCoreApplication that is not a QApplication means freecadcmd."""
+        qtcore, _ = qt_modules
+        qtcore.QCoreApplication.instance.return_value = object()
+
+        mode = bridge_utils.detect_qt_mode()
+
+        assert mode.has_qapp is False
+        assert mode.is_true_headless is True
+
+    def test_no_application_yet(self, bridge_utils, qt_modules) -> None:
+        """Without any application, GUI startup is assumed to be in progress."""
+        mode = bridge_utils.detect_qt_mode()
+
+        assert mode.qtcore is not None
+        assert mode.has_qapp is False
+        assert mode.is_true_headless is False
+
+    def test_import_cached_but_instance_rechecked(
+        self, bridge_utils, qt_modules
+    ) -> None:
+        """PySide is imported once; the application state is re-read."""
+        first = bridge_utils.detect_qt_mode()
+        _QApplication.current = object()
+
+        second = bridge_utils.detect_qt_mode()
+
+        assert first.has_qapp is False
+        assert second.has_qapp is True
+        assert bridge_utils.import_qt.cache_info().misses == 1
+
+    def test_prefers_pyside2_without_trying_pyside6(
+        self, bridge_utils, qt_modules
+    ) -> None:
+        """PySide6 should not be probed when PySide2 is installed."""
+        with patch.object(
+            bridge_utils.importlib.util, "find_spec", wraps=importlib.util.find_spec
+        ) as find_spec:
+            bridge_utils.detect_qt_mode()
+
+        find_spec.assert_called_once_with("PySide2")
+
+    def test_no_pyside(self, bridge_utils) -> None:
+        """Without PySide2 or PySide6, no Qt modules are reported."""
+        with patch.dict(sys.modules, {"PySide2": None, "PySide6": None}):
+            mode = bridge_utils.detect_qt_mode()
+
+        assert mode == bridge_utils.QtMode(None, None, False, False)
+
+
+@pytest.fixture
+def addon_modules():
+    """Provide mocked FreeCAD, commands, preferences, and server modules."""
+    commands = MagicMock()
+    commands.is_bridge_running.return_value = False
+    preferences = MagicMock()
+    preferences.get_auto_start.return_value = True
+    preferences.get_xmlrpc_port.return_value = 9875
+    preferences.get_socket_port.return_value = 9876
+    server = MagicMock()
+    with patch.dict(
+        sys.modules,
+        {
+            "FreeCAD": MagicMock(),
+            "commands": commands,
+            "preferences": preferences,
+            "freecad_mcp_bridge": MagicMock(
+                server=server, FreecadMCPPlugin=server.FreecadMCPPlugin
+            ),
+            "freecad_mcp_bridge.server": server,
+        },
+    ):
+        yield commands, preferences, server
+
+
+class TestEnsureBridgeStarted:
+    """Tests for ensure_bridge_started()."""
+
+    def test_skips_when_already_running(self, bridge_utils, addon_modules) -> None:
+        """A running bridge should short-circuit before reading preferences."""
+        commands, preferences, server = addon_modules
+        commands.is_bridge_running.return_value = True
+
+        assert bridge_utils.ensure_bridge_started() is False
+        preferences.get_auto_start.assert_not_called()
+        server.FreecadMCPPlugin.assert_not_called()
+
+    def test_skips_when_auto_start_disabled(self, bridge_utils, addon_modules) -> None:
+        """Nothing should be started when auto-start is disabled."""
+        _, preferences, server = addon_modules
+        preferences.get_auto_start.return_value = False
+
+        assert bridge_utils.ensure_bridge_started() is False
+        server.FreecadMCPPlugin.assert_not_called()
+
+    @pytest.mark.parametrize("value", ["0", "false", "No"])
+    def test_skips_when_disabled_by_env(
+        self, bridge_utils, addon_modules, value: str
+    ) -> None:
+        """FREECAD_MCP_AUTOSTART=0 should skip auto-start before reading preferences."""
+        _, preferences, server = addon_modules
+
+        with patch.dict(os.environ, {"FREECAD_MCP_AUTOSTART": value}):
+            assert bridge_utils.ensure_bridge_started() is False
+
+        preferences.get_auto_start.assert_not_called()
+        server.FreecadMCPPlugin.assert_not_called()
+
+    def test_starts_and_registers(self, bridge_utils, addon_modules) -> None:
+        """The bridge should be started on the configured ports and registered."""
+        commands, _, server = addon_modules
+
+        assert bridge_utils.ensure_bridge_started() is True
+
+        server.FreecadMCPPlugin.assert_called_once_with(
+            host="localhost", port=9876, xmlrpc_port=9875, enable_xmlrpc=True
+        )
+        plugin = server.FreecadMCPPlugin.return_value
+        plugin.start.assert_called_once()
+        assert commands._mcp_plugin is plugin
+
+    def test_started_banner_single_write(self, bridge_utils, addon_modules) -> None:
+        """The started banner should be written to the console in one call."""
+        bridge_utils.ensure_bridge_started()
+
+        console = sys.modules["FreeCAD"].Console
+        banner = console.PrintMessage.call_args.args[0]
+        assert "MCP Bridge started!" in banner
+        assert "localhost:9875" in banner
+        assert "localhost:9876" in banner
+        assert banner.count("=" * 50) == 2
+
+
+class TestGuiWaiter:
+    """Tests for GuiWaiter's GUI readiness checks."""
+
+    @pytest.fixture
+    def freecad(self):
+        """Provide a mocked FreeCAD module with the GUI not yet up."""
+        freecad = MagicMock(GuiUp=False)
+        with patch.dict(sys.modules, {"FreeCAD": freecad}):
+            yield freecad
+
+    def test_first_check_runs_on_event_loop_start(
+        self, bridge_utils, qt_modules, freecad
+    ) -> None:
+        """A GUI that is already up should end the wait on the first pass."""
+        qtcore, _ = qt_modules
+        callback = MagicMock()
+        waiter = bridge_utils.GuiWaiter(callback=callback, defer_ms=10)
+        waiter.start()
+        delay, check = qtcore.QTimer.singleShot.call_args.args
+        assert delay == 0
+
+        freecad.GuiUp = True
+        check()
+
+        qtcore.QTimer.return_value.stop.assert_called_once()
+        qtcore.QTimer.return_value.timeout.connect.assert_called_with(callback)
+        qtcore.QTimer.return_value.start.assert_called_with(10)
+
+    def test_first_check_keeps_waiting_until_gui_up(
+        self, bridge_utils, qt_modules, freecad
+    ) -> None:
+        """The first check before GuiUp is True should leave the timer running."""
+        qtcore, _ = qt_modules
+        waiter = bridge_utils.GuiWaiter(callback=MagicMock())
+        waiter.start()
+        _, check = qtcore.QTimer.singleShot.call_args.args
+
+        check()
+
+        qtcore.QTimer.return_value.stop.assert_not_called()
+        assert waiter._check_timer is not None
+        assert waiter._retry_count == 0
+
+    def test_late_first_check_is_ignored(
+        self, bridge_utils, qt_modules, freecad
+    ) -> None:
+        """The first check must not restart the callback after the poll did."""
+        qtcore, _ = qt_modules
+        waiter = bridge_utils.GuiWaiter(callback=MagicMock())
+        waiter.start()
+        _, check = qtcore.QTimer.singleShot.call_args.args
+        freecad.GuiUp = True
+        waiter._check_gui()
+
+        check()
+
+        qtcore.QTimer.return_value.stop.assert_called_once()
+
+
+class TestPackageLazyPlugin:
+    """Tests for the lazy FreecadMCPPlugin export of freecad_mcp_bridge."""
+
+    @pytest.fixture
+    def package(self):
+        """Load a fresh copy of the freecad_mcp_bridge package."""
+        package_dir = ADDON_DIR / "freecad_mcp_bridge"
+        spec = importlib.util.spec_from_file_location(
+            "freecad_mcp_bridge",
+            package_dir / "__init__.py",
+            submodule_search_locations=[str(package_dir)],
+        )
+        assert spec is not None
+        assert spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        with patch.dict(sys.modules, {"freecad_mcp_bridge": module}):
+            sys.modules.pop("freecad_mcp_bridge.server", None)
+            spec.loader.exec_module(module)
+            yield module
+
+    def test_import_does_not_load_server(self, package) -> None:
+        """Importing the package should not import the server module."""
+        assert "freecad_mcp_bridge.server" not in sys.modules
+        assert "FreecadMCPPlugin" not in vars(package)
+
+    def test_attribute_access_loads_server(self, package) -> None:
+        """Accessing FreecadMCPPlugin should import and cache it."""
+        with patch.dict(sys.modules, {"FreeCAD": MagicMock()}):
+            plugin_cls = package.FreecadMCPPlugin
+            server = sys.modules["freecad_mcp_bridge.server"]
+
+        assert plugin_cls is server.FreecadMCPPlugin
+        assert vars(package)["FreecadMCPPlugin"] is plugin_cls
+
+    def test_unknown_attribute_raises(self, package) -> None:
+        """Other missing attributes should still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            package.NotAThing  # noqa: B018
@@ -0,0 +1,208 @@
+"""Tests for the Robust MCP Bridge workbench commands.
+
+FreeCAD imports commands.py with the addon directory on sys.path, so these
+tests do the same with mocked FreeCAD and preferences modules.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Get the addon directory path (new-style namespace package format)
+ADDON_DIR = Path(__file__).parent.parent.parent.parent / "freecad" / "RobustMCPBridge"
+
+
+@pytest.fixture
+def mock_preferences():
+    """Provide a mocked preferences module with default port values."""
+    preferences = MagicMock()
+    preferences.get_xmlrpc_port.return_value = 9875
+    preferences.get_socket_port.return_value = 9876
+    preferences.get_status_bar_enabled.return_value = False
+    return preferences
+
+
+@pytest.fixture
+def mock_freecad():
+    """Provide a mocked FreeCAD module."""
+    return MagicMock()
+
+
+@pytest.fixture
+def commands(mock_freecad, mock_preferences):
+    """Import a fresh copy of commands.py with FreeCAD mocked."""
+    with (
+        patch.object(sys, "path", [str(ADDON_DIR), *sys.path]),
+        patch.dict(
+            sys.modules,
+            {"FreeCAD": mock_freecad, "preferences": mock_preferences},
+        ),
+    ):
+        sys.modules.pop("commands", None)
+        sys.modules.pop("path_utils", None)
+        import commands
+
+        yield commands
+        sys.modules.pop("commands", None)
+        sys.modules.pop("path_utils", None)
+
+
+class TestGetResources:
+    """Tests for command GetResources() caching."""
+
+    @pytest.mark.parametrize(
+        "class_name",
+        [
+            "StopMCPBridgeCommand",
+            "MCPBridgeStatusCommand",
+            "MCPBridgePreferencesCommand",
+        ],
+    )
+    def test_static_resources_built_once(self, commands, class_name: str) -> None:
+        """Static command resources should be shared across calls and instances."""
+        command_class = getattr(commands, class_name)
+
+        first = command_class().GetResources()
+
+        assert command_class().GetResources() is first
+        assert first["Pixmap"].endswith(".svg")
+
+    @pytest.mark.parametrize(
+        ("class_name", "constant"),
+        [
+            ("StopMCPBridgeCommand", "_TT_STOP"),
+            ("MCPBridgeStatusCommand", "_TT_STATUS"),
+            ("MCPBridgePreferencesCommand", "_TT_PREFS"),
+        ],
+    )
+    def test_static_tooltips_use_shared_constants(
+        self, commands, class_name: str, constant: str
+    ) -> None:
+        """Static tooltips should be the module-level interned strings."""
+        resources = getattr(commands, class_name)().GetResources()
+
+        assert resources["ToolTip"] is getattr(commands, constant)
+
+    def test_start_resources_cached_while_ports_unchanged(self, commands) -> None:
+        """The start command should reuse its resources for the same ports."""
+        command = commands.StartMCPBridgeCommand()
+
+        first = command.GetResources()
+
+        assert command.GetResources() is first
+        assert "port 9875" in first["ToolTip"]
+        assert "port 9876" in first["ToolTip"]
+        assert first["ToolTip"].startswith(commands._TT_START)
+
+    def test_start_resources_rebuilt_when_ports_change(
+        self, commands, mock_preferences
+    ) -> None:
+        """The start command tooltip should follow port preference changes."""
+        command = commands.StartMCPBridgeCommand()
+        first = command.GetResources()
+
+        mock_preferences.get_xmlrpc_port.return_value = 19875
+        second = command.GetResources()
+
+        assert second is not first
+        assert "port 19875" in second["ToolTip"]
+
+
+class TestStatusCommand:
+    """Tests for the status command output."""
+
+    def test_not_initialized_status_single_write(self, commands, mock_freecad) -> None:
+        """The status banner should be written to the console in one call."""
+        commands.MCPBridgeStatusCommand().Activated()
+
+        mock_freecad.Console.PrintMessage.assert_called_once()
+        (message,) = mock_freecad.Console.PrintMessage.call_args.args
+        assert "MCP Bridge Status" in message
+        assert "Status: Not initialized" in message
+        assert message.count("=" * 50) == 3
+
+    def test_running_status_includes_plugin_details(
+        self, commands, mock_freecad
+    ) -> None:
+        """A running bridge should report its ports and request count."""
+        plugin = MagicMock(
+            is_running=True,
+            instance_id="abc123",
+            xmlrpc_port=9875,
+            socket_port=9876,
+            request_count=7,
+        )
+        commands._mcp_plugin = plugin
+
+        commands.MCPBridgeStatusCommand().Activated()
+
+        (message,) = mock_freecad.Console.PrintMessage.call_args.args
+        assert "Status: Running" in message
+        assert "Instance ID: abc123" in message
+        assert "Requests processed: 7" in message
+
+
+class TestStopCommand:
+    """Tests for the stop command."""
+
+    def test_stop_clears_plugin_and_reports(self, commands, mock_freecad) -> None:
+        """Stopping should stop the plugin, clear state, and print one banner."""
+        plugin = MagicMock(is_running=True)
+        commands._mcp_plugin = plugin
+        commands._running_config = {"xmlrpc_port": 9875, "socket_port": 9876}
+
+        commands.StopMCPBridgeCommand().Activated()
+
+        plugin.stop.assert_called_once()
+        assert commands._mcp_plugin is None
+        assert commands._running_config is None
+        mock_freecad.Console.PrintMessage.assert_called_once()
+        (message,) = mock_freecad.Console.PrintMessage.call_args.args
+        assert "MCP Bridge stopped." in message
+
+
+class TestIsActive:
+    """Tests for the start/stop command IsActive() checks."""
+
+    def test_initial_state(self, commands) -> None:
+        """Only the start command should be active before the bridge runs."""
+        assert commands.StartMCPBridgeCommand().IsActive() is True
+        assert commands.StopMCPBridgeCommand().IsActive() is False
+
+    def test_follows_plugin_state(self, commands) -> None:
+        """IsActive() should follow whether the plugin is running."""
+        commands._mcp_plugin = MagicMock(is_running=True)
+
+        assert commands.StartMCPBridgeCommand().IsActive() is False
+        assert commands.StopMCPBridgeCommand().IsActive() is True
+
+    def test_plugin_that_stopped_itself(self, commands) -> None:
+        """Start should be available again after the plugin stopped on its own."""
+        commands._mcp_plugin = MagicMock(is_running=False)
+
+        assert commands.StartMCPBridgeCommand().IsActive() is True
+        assert commands.StopMCPBridgeCommand().IsActive() is False
+
+    def test_start_enables_stop(self, commands, mock_freecad) -> None:
+        """A successful start should enable the stop command."""
+        server = MagicMock()
+        server.FreecadMCPPlugin.return_value.is_running = True
+        with patch.dict(
+            sys.modules,
+            {
+                "freecad_mcp_bridge": MagicMock(
+                    server=server, FreecadMCPPlugin=server.FreecadMCPPlugin
+                ),
+                "freecad_mcp_bridge.server": server,
+                "Qt": MagicMock(),
+                "Qt.status_widget": MagicMock(),
+            },
+        ):
+            commands.StartMCPBridgeCommand().Activated()
+
+        server.FreecadMCPPlugin.return_value.start.assert_called_once()
+        assert commands.StopMCPBridgeCommand().IsActive() is True
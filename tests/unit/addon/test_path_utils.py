@@ -0,0 +1,194 @@
+"""Tests for the Robust MCP Bridge addon path utilities.
+
+path_utils.py is normally imported by FreeCAD with the addon directory on
+sys.path. These tests load it directly from the addon directory with a
+mocked FreeCAD module so the fallback lookups can be exercised against a
+temporary user data directory.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Get the addon directory path (new-style namespace package format)
+ADDON_DIR = Path(__file__).parent.parent.parent.parent / "freecad" / "RobustMCPBridge"
+
+
+@pytest.fixture
+def mock_freecad(tmp_path: Path):
+    """Provide a mocked FreeCAD module whose user data dir is tmp_path."""
+    freecad = MagicMock()
+    freecad.getUserAppDataDir.return_value = str(tmp_path)
+    with patch.dict(sys.modules, {"FreeCAD": freecad}):
+        yield freecad
+
+
+@pytest.fixture
+def path_utils(mock_freecad):
+    """Load a fresh copy of path_utils.py with FreeCAD mocked."""
+    spec = importlib.util.spec_from_file_location(
+        "path_utils", ADDON_DIR / "path_utils.py"
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.FreeCAD is mock_freecad
+    return module
+
+
+def _make_addon_dir(base: Path, *parts: str) -> Path:
+    """Create an addon directory below base and return its path."""
+    addon = base.joinpath(*parts, "Mod", "freecad", "RobustMCPBridge")
+    addon.mkdir(parents=True)
+    return addon
+
+
+class TestGetAddonPath:
+    """Tests for get_addon_path()."""
+
+    def test_uses_module_file_when_available(self, path_utils, mock_freecad) -> None:
+        """The directory containing path_utils.py should be returned directly."""
+        assert path_utils.get_addon_path() == str(ADDON_DIR.resolve())
+        mock_freecad.getUserAppDataDir.assert_not_called()
+
+    def test_finds_versioned_mod_dir(self, path_utils, tmp_path: Path) -> None:
+        """Without __file__, a v1-*/Mod/freecad/RobustMCPBridge dir is used."""
+        (tmp_path / "v1-notes.txt").write_text("not a directory")
+        (tmp_path / "v0-9").mkdir()
+        addon = _make_addon_dir(tmp_path, "v1-1")
+        path_utils._MODULE_DIR = None
+
+        assert path_utils.get_addon_path() == str(addon)
+
+    def test_returns_empty_string_when_not_found(
+        self, path_utils, tmp_path: Path
+    ) -> None:
+        """An empty string is returned when no candidate directory exists."""
+        (tmp_path / "v1-1").mkdir()
+        path_utils._MODULE_DIR = None
+
+        assert path_utils.get_addon_path() == ""
+
+    def test_missing_user_data_dir_warns(
+        self, path_utils, mock_freecad, tmp_path: Path
+    ) -> None:
+        """An unreadable user data dir should warn and resolve to no path."""
+        mock_freecad.getUserAppDataDir.return_value = str(tmp_path / "missing")
+        path_utils._MODULE_DIR = None
+
+        assert path_utils.get_addon_path() == ""
+        mock_freecad.Console.PrintWarning.assert_called_once()
+
+    def test_prefers_unversioned_mod_dir(self, path_utils, tmp_path: Path) -> None:
+        """Mod/freecad/RobustMCPBridge should win over a versioned directory."""
+        _make_addon_dir(tmp_path, "v1-1")
+        addon = _make_addon_dir(tmp_path)
+        path_utils._MODULE_DIR = None
+
+        assert path_utils.get_addon_path() == str(addon)
+
+    def test_does_not_cache_miss(self, path_utils, tmp_path: Path) -> None:
+        """An addon directory created after a failed lookup should be found."""
+        path_utils._MODULE_DIR = None
+
+        assert path_utils.get_addon_path() == ""
+        addon = _make_addon_dir(tmp_path, "v1-1")
+
+        assert path_utils.get_addon_path() == str(addon)
+
+    def test_caches_result(self, path_utils, mock_freecad, tmp_path: Path) -> None:
+        """A resolved path should be cached for subsequent calls."""
+        _make_addon_dir(tmp_path, "v1-1")
+        path_utils._MODULE_DIR = None
+
+        first = path_utils.get_addon_path()
+        mock_freecad.getUserAppDataDir.reset_mock()
+
+        assert path_utils.get_addon_path() == first
+        mock_freecad.getUserAppDataDir.assert_not_called()
+
+
+class TestGetIconPath:
+    """Tests for get_icon_path()."""
+
+    def test_joins_icon_name_to_addon_path(self, path_utils) -> None:
+        """The icon name should be resolved relative to the addon directory."""
+        icon = path_utils.get_icon_path("Resources/Icons/mcp_start.svg")
+        assert Path(icon) == ADDON_DIR.resolve() / "Resources/Icons/mcp_start.svg"
+
+    def test_memoizes_per_icon_name(self, path_utils) -> None:
+        """Repeated lookups of the same icon should be served from the cache."""
+        with patch.object(
+            path_utils, "get_addon_path", wraps=path_utils.get_addon_path
+        ) as get_addon_path:
+            path_utils.get_icon_path("Resources/Icons/mcp_stop.svg")
+            path_utils.get_icon_path("Resources/Icons/mcp_stop.svg")
+            path_utils.get_icon_path("Resources/Icons/mcp_status.svg")
+
+        assert get_addon_path.call_count == 2
+
+    def test_miss_is_not_cached(self, path_utils, tmp_path: Path) -> None:
+        """An icon asked for before the addon path is found should resolve later."""
+        path_utils._MODULE_DIR = None
+
+        assert path_utils.get_icon_path("Resources/Icons/mcp_stop.svg") == ""
+        addon = _make_addon_dir(tmp_path, "v1-1")
+
+        icon = path_utils.get_icon_path("Resources/Icons/mcp_stop.svg")
+        assert Path(icon) == addon / "Resources/Icons/mcp_stop.svg"
+
+
+class TestIconDirectories:
+    """Tests for get_icons_dir() and get_workbench_icon()."""
+
+    def test_icons_dir(self, path_utils) -> None:
+        """The icons directory should be Resources/Icons in the addon."""
+        assert Path(path_utils.get_icons_dir()) == ADDON_DIR / "Resources" / "Icons"
+
+    def test_workbench_icon_in_icons_dir(self, path_utils) -> None:
+        """The workbench icon should be resolved inside the icons directory."""
+        icon = Path(path_utils.get_workbench_icon())
+
+        assert icon.name == "FreecadRobustMCPBridge.svg"
+        assert icon.parent == Path(path_utils.get_icons_dir())
+
+    def test_icons_dir_checked_once(self, path_utils) -> None:
+        """Icon registration and the workbench icon should share one lookup."""
+        with patch.object(
+            path_utils, "get_addon_path", wraps=path_utils.get_addon_path
+        ) as get_addon_path:
+            path_utils.get_icons_dir()
+            path_utils.get_workbench_icon()
+            path_utils.get_workbench_icon()
+
+        get_addon_path.assert_called_once()
+
+    def test_miss_is_not_cached(self, path_utils, tmp_path: Path) -> None:
+        """Icons that appear after a failed lookup should be found."""
+        path_utils._MODULE_DIR = None
+        (tmp_path / "v1-1").mkdir()
+
+        assert path_utils.get_icons_dir() == ""
+        assert path_utils.get_workbench_icon() == ""
+        icons = _make_addon_dir(tmp_path, "v1-1") / "Resources" / "Icons"
+        icons.mkdir(parents=True)
+        (icons / "FreecadRobustMCPBridge.svg").touch()
+
+        assert path_utils.get_icons_dir() == str(icons)
+        assert path_utils.get_workbench_icon() == str(
+            icons / "FreecadRobustMCPBridge.svg"
+        )
+
+    def test_missing_addon_dir(self, path_utils, tmp_path: Path) -> None:
+        """Without an addon directory, both lookups should return ''."""
+        path_utils._MODULE_DIR = None
+        (tmp_path / "v1-1").mkdir()
+
+        assert path_utils.get_icons_dir() == ""
+        assert path_utils.get_workbench_icon() == ""
@@ -0,0 +1,225 @@
+"""Tests for the Robust MCP Bridge plugin's request handling.
+
+server.py runs inside FreeCAD, so these tests load it directly from the
+addon directory without FreeCAD installed (FREECAD_AVAILABLE is False) and
+drive its queue, JSON-RPC and XML-RPC handling by hand.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import sys
+import threading
+import time
+import xmlrpc.client
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Get the addon directory path (new-style namespace package format)
+ADDON_DIR = Path(__file__).parent.parent.parent.parent / "freecad" / "RobustMCPBridge"
+
+
+@pytest.fixture
+def server():
+    """Load a fresh copy of the plugin's server.py without FreeCAD."""
+    spec = importlib.util.spec_from_file_location(
+        "mcp_plugin_server", ADDON_DIR / "freecad_mcp_bridge" / "server.py"
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {"FreeCAD": None, "FreeCADGui": None}):
+        spec.loader.exec_module(module)
+    assert module.FREECAD_AVAILABLE is False
+    return module
+
+
+@pytest.fixture
+def plugin(server):
+    """Create a plugin that is marked running but has no servers started."""
+    plugin = server.FreecadMCPPlugin(port=0, xmlrpc_port=0)
+    plugin._running = True
+    yield plugin
+    plugin._running = False
+
+
+class TestExecutionRequest:
+    """Tests for the start/cancel handshake of queued requests."""
+
+    def test_cancelled_request_never_runs(self, server, plugin) -> None:
+        """A request given up on while queued must not run later."""
+        with (
+            patch.object(server, "QUEUE_WAIT_TIMEOUT_S", 0.01),
+            patch.object(plugin, "_execute_code_sync") as execute,
+        ):
+            result = plugin._execute_via_queue("x = 1", 1000)
+            plugin._process_queue()
+
+        assert result["error_type"] == "TimeoutError"
+        execute.assert_not_called()
+
+    def test_started_request_cannot_be_cancelled(self, server) -> None:
+        """Once the main thread has started a request, cancel() must fail."""
+        request = server.ExecutionRequest("x = 1")
+
+        assert request.start() is True
+        assert request.cancel() is False
+
+    def test_cancelled_request_cannot_be_started(self, server) -> None:
+        """Once cancelled, start() must refuse the request."""
+        request = server.ExecutionRequest("x = 1")
+
+        assert request.cancel() is True
+        assert request.start() is False
+        assert not request.started.is_set()
+
+    def test_timeout_counts_from_start(self, server, plugin) -> None:
+        """Time spent queued should not use up the execution timeout."""
+
+        def run_later() -> None:
+            time.sleep(0.1)
+            plugin._process_queue()
+
+        worker = threading.Thread(target=run_later)
+        worker.start()
+        result = plugin._execute_via_queue("_result_ = 2", 50)
+        worker.join()
+
+        assert result["success"] is True
+        assert result["result"] == 2
+
+
+class TestJsonRpc:
+    """Tests for JSON-RPC request processing."""
+
+    @pytest.mark.asyncio
+    async def test_batch_with_non_dict_element(self, plugin) -> None:
+        """Non-object batch members get an Invalid Request error each."""
+        responses = await plugin._process_jsonrpc_batch(
+            [{"jsonrpc": "2.0", "id": "a", "method": "ping"}, 5]
+        )
+
+        assert responses[0]["id"] == "a"
+        assert responses[0]["result"]["pong"] is True
+        assert responses[1] == {
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {"code": -32600, "message": "Invalid Request"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_is_invalid(self, plugin) -> None:
+        """An empty batch is answered with a single error object."""
+        response = await plugin._process_jsonrpc_batch([])
+
+        assert response["error"]["code"] == -32600
+
+    @pytest.mark.asyncio
+    async def test_status_without_freecad(self, plugin) -> None:
+        """status should report an error rather than raise without FreeCAD."""
+        response = await plugin._process_jsonrpc_request(
+            {"jsonrpc": "2.0", "id": "s", "method": "status"}
+        )
+
+        assert response["id"] == "s"
+        assert response["error"]["data"] == "FreeCAD is not available"
+
+    @pytest.mark.asyncio
+    async def test_unknown_method(self, plugin) -> None:
+        """Unknown methods get Method not found."""
+        response = await plugin._process_jsonrpc_request(
+            {"jsonrpc": "2.0", "id": "u", "method": "nope"}
+        )
+
+        assert response["error"]["code"] == -32601
+
+    @pytest.mark.asyncio
+    async def test_requests_are_answered_as_they_finish(self, plugin) -> None:
+        """A ping sent after a slow execute is answered first, by its id."""
+        release = threading.Event()
+
+        def slow_execute(code: str, _timeout_ms: int) -> dict:
+            release.wait(5)
+            return {"success": True, "result": code}
+
+        plugin._execute_via_queue = slow_execute  # type: ignore[method-assign]
+        reader = asyncio.StreamReader()
+        writer = MagicMock(spec=asyncio.StreamWriter)
+        writer.drain = MagicMock(side_effect=lambda: asyncio.sleep(0))
+        writer.wait_closed = MagicMock(side_effect=lambda: asyncio.sleep(0))
+        responses: list[dict] = []
+        answered = asyncio.Event()
+
+        def receive(parts: tuple[bytes, bytes]) -> None:
+            responses.append(json.loads(b"".join(parts)))
+            answered.set()
+
+        writer.writelines.side_effect = receive
+
+        handler = asyncio.create_task(plugin._handle_socket_client(reader, writer))
+        for request in (
+            {"jsonrpc": "2.0", "id": "slow", "method": "execute", "params": {}},
+            {"jsonrpc": "2.0", "id": "fast", "method": "ping"},
+        ):
+            reader.feed_data(json.dumps(request).encode() + b"\n")
+
+        await asyncio.wait_for(answered.wait(), 5)
+        assert [r["id"] for r in responses] == ["fast"]
+
+        answered.clear()
+        release.set()
+        await asyncio.wait_for(answered.wait(), 5)
+        reader.feed_eof()
+        await handler
+
+        assert [r["id"] for r in responses] == ["fast", "slow"]
+
+
+class TestCompileCode:
+    """Tests for the plugin's compiled code cache."""
+
+    def test_repeated_source_is_compiled_once(self, server) -> None:
+        """The same snippet should give back the same code object."""
+        assert server._compile_code("x = 1") is server._compile_code("x = 1")
+
+    def test_long_source_is_not_cached(self, server) -> None:
+        """Source over CODE_CACHE_MAX_SOURCE should be compiled every time."""
+        code = "x = 1\n" * (server.CODE_CACHE_MAX_SOURCE // 6 + 1)
+
+        assert server._compile_code(code) is not server._compile_code(code)
+
+    def test_compile_errors_are_raised(self, server) -> None:
+        """Syntax errors should propagate rather than be cached."""
+        with pytest.raises(SyntaxError):
+            server._compile_code("def broken(:")
+
+
+class TestXmlRpcServer:
+    """Tests for the threaded XML-RPC server."""
+
+    def test_ping_and_multicall(self, plugin) -> None:
+        """The server answers plain calls and system.multicall."""
+        thread = threading.Thread(target=plugin._run_xmlrpc_server, daemon=True)
+        thread.start()
+        deadline = time.monotonic() + 5
+        while plugin._xmlrpc_server is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert plugin._xmlrpc_server is not None
+        port = plugin._xmlrpc_server.server_address[1]
+
+        try:
+            proxy = xmlrpc.client.ServerProxy(f"http://localhost:{port}")
+            assert proxy.ping()["pong"] is True
+            multicall = xmlrpc.client.MultiCall(proxy)
+            multicall.ping()
+            multicall.get_instance_id()
+            _, instance = tuple(multicall())
+            assert instance == {"instance_id": plugin._instance_id}
+        finally:
+            plugin._running = False
+            thread.join(timeout=5)
+            plugin._xmlrpc_server.server_close()
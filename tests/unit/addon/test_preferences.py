@@ -0,0 +1,148 @@
+"""Tests for the Robust MCP Bridge preference helpers.
+
+preferences.py is loaded from the addon directory with a mocked FreeCAD
+module whose parameter group is a MagicMock.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Get the addon directory path (new-style namespace package format)
+ADDON_DIR = Path(__file__).parent.parent.parent.parent / "freecad" / "RobustMCPBridge"
+
+
+@pytest.fixture
+def mock_freecad():
+    """Provide a mocked FreeCAD module with a mocked parameter group."""
+    freecad = MagicMock()
+    param = freecad.ParamGet.return_value
+    param.GetBool.side_effect = lambda _name, default: default
+    param.GetInt.side_effect = lambda _name, default: default
+    with patch.dict(sys.modules, {"FreeCAD": freecad}):
+        yield freecad
+
+
+@pytest.fixture
+def preferences(mock_freecad):
+    """Load a fresh copy of preferences.py with FreeCAD mocked."""
+    spec = importlib.util.spec_from_file_location(
+        "preferences", ADDON_DIR / "preferences.py"
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.FreeCAD is mock_freecad
+    return module
+
+
+class TestGetParam:
+    """Tests for the parameter group handle."""
+
+    def test_param_group_looked_up_once(self, preferences, mock_freecad) -> None:
+        """Repeated preference access should reuse a single ParamGet handle."""
+        preferences.get_all_preferences()
+        preferences.reset_to_defaults()
+
+        mock_freecad.ParamGet.assert_called_once_with(preferences.PARAM_PATH)
+
+
+class TestGetAllPreferences:
+    """Tests for get_all_preferences()."""
+
+    def test_returns_defaults(self, preferences) -> None:
+        """Unset preferences should fall back to the documented defaults."""
+        assert preferences.get_all_preferences() == {
+            "auto_start": False,
+            "status_bar_enabled": True,
+            "xmlrpc_port": 9875,
+            "socket_port": 9876,
+        }
+
+    def test_reads_stored_values(self, preferences, mock_freecad) -> None:
+        """Stored values should be returned under the matching keys."""
+        stored = {
+            "AutoStart": True,
+            "StatusBarEnabled": False,
+            "XMLRPCPort": 19875,
+            "SocketPort": 19876,
+        }
+        param = mock_freecad.ParamGet.return_value
+        param.GetBool.side_effect = lambda name, _default: stored[name]
+        param.GetInt.side_effect = lambda name, _default: stored[name]
+
+        assert preferences.get_all_preferences() == {
+            "auto_start": True,
+            "status_bar_enabled": False,
+            "xmlrpc_port": 19875,
+            "socket_port": 19876,
+        }
+
+
+class TestPortSetters:
+    """Tests for port setter validation."""
+
+    @pytest.mark.parametrize("setter", ["set_xmlrpc_port", "set_socket_port"])
+    @pytest.mark.parametrize("port", [80, 65536])
+    def test_rejects_out_of_range_port(
+        self, preferences, mock_freecad, setter: str, port: int
+    ) -> None:
+        """Ports outside 1024-65535 should raise ValueError without writing."""
+        with pytest.raises(ValueError, match="Port must be between"):
+            getattr(preferences, setter)(port)
+
+        mock_freecad.ParamGet.return_value.SetInt.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("setter", "key"),
+        [("set_xmlrpc_port", "XMLRPCPort"), ("set_socket_port", "SocketPort")],
+    )
+    def test_valid_port_is_stored(
+        self, preferences, mock_freecad, setter: str, key: str
+    ) -> None:
+        """Ports inside the valid range should be written to the parameter."""
+        getattr(preferences, setter)(12345)
+
+        mock_freecad.ParamGet.return_value.SetInt.assert_called_once_with(key, 12345)
+
+
+class TestPreferenceCache:
+    """Tests for the preference read cache."""
+
+    def test_repeated_reads_hit_parameter_once(self, preferences, mock_freecad) -> None:
+        """A preference should only be read from FreeCAD once."""
+        param = mock_freecad.ParamGet.return_value
+
+        preferences.get_xmlrpc_port()
+        preferences.get_xmlrpc_port()
+        preferences.get_all_preferences()
+
+        param.GetInt.assert_any_call("XMLRPCPort", preferences.DEFAULT_XMLRPC_PORT)
+        assert param.GetInt.call_count == 2  # XMLRPCPort and SocketPort
+        assert param.GetBool.call_count == 2  # AutoStart and StatusBarEnabled
+
+    def test_setter_writes_through(self, preferences, mock_freecad) -> None:
+        """A set value should be returned without re-reading FreeCAD."""
+        param = mock_freecad.ParamGet.return_value
+
+        preferences.set_auto_start(True)
+
+        assert preferences.get_auto_start() is True
+        param.GetBool.assert_not_called()
+
+    def test_invalidate_cache_rereads(self, preferences, mock_freecad) -> None:
+        """After invalidation, values changed elsewhere should be picked up."""
+        param = mock_freecad.ParamGet.return_value
+        assert preferences.get_socket_port() == preferences.DEFAULT_SOCKET_PORT
+
+        param.GetInt.side_effect = lambda _name, _default: 12345
+        assert preferences.get_socket_port() == preferences.DEFAULT_SOCKET_PORT
+
+        preferences.invalidate_cache()
+        assert preferences.get_socket_port() == 12345
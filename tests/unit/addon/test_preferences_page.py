@@ -0,0 +1,143 @@
+"""Tests for the Robust MCP Bridge preferences page module.
+
+The page class subclasses QWidget, so these tests load the module with a
+stub PySide package.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Get the addon directory path (new-style namespace package format)
+ADDON_DIR = Path(__file__).parent.parent.parent.parent / "freecad" / "RobustMCPBridge"
+
+
+class _StubQWidget:
+    """Minimal stand-in for QtWidgets.QWidget."""
+
+    def __init__(self, parent=None) -> None:
+        self.parent = parent
+
+    def setWindowTitle(self, title: str) -> None:
+        self.window_title = title
+
+
+@pytest.fixture
+def mock_pyside():
+    """Provide a stub PySide package whose QWidget is a real class."""
+    pyside = MagicMock()
+    pyside.QtWidgets.QWidget = _StubQWidget
+    # Give every created widget its own mock so page attributes are distinct
+    pyside.QtWidgets.QCheckBox.side_effect = lambda *_args: MagicMock()
+    pyside.QtWidgets.QSpinBox.side_effect = lambda *_args: MagicMock()
+    return pyside
+
+
+@pytest.fixture
+def preferences_page(mock_pyside):
+    """Load a fresh copy of Qt/preferences_page.py with the stub PySide."""
+    spec = importlib.util.spec_from_file_location(
+        "preferences_page", ADDON_DIR / "Qt" / "preferences_page.py"
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {"PySide": mock_pyside}):
+        spec.loader.exec_module(module)
+    return module
+
+
+class TestPageClass:
+    """Tests for the MCPBridgePreferencesPage class."""
+
+    def test_page_class_subclasses_qwidget(self, preferences_page) -> None:
+        """The page should be a QWidget subclass."""
+        page_class = preferences_page.MCPBridgePreferencesPage
+
+        assert issubclass(page_class, _StubQWidget)
+        assert page_class.__name__ == "MCPBridgePreferencesPage"
+
+
+class TestEnvVarsHtml:
+    """Tests for the environment variable table shown on the page."""
+
+    def test_lists_every_env_var(self, preferences_page) -> None:
+        """Each configured variable and its description should be rendered."""
+        html = preferences_page._env_vars_html()
+
+        for var_name, description in preferences_page._ENV_VARS:
+            assert f"<code>{var_name}</code>" in html
+            assert description in html
+        assert html.count("<tr>") == len(preferences_page._ENV_VARS)
+
+    def test_rendered_once(self, preferences_page) -> None:
+        """The table should be built once and reused."""
+        assert preferences_page._env_vars_html() is preferences_page._env_vars_html()
+
+
+class TestSaveSettings:
+    """Tests for MCPBridgePreferencesPage.saveSettings()."""
+
+    @pytest.fixture
+    def mock_preferences(self):
+        """Provide a mocked preferences module with the stored ports."""
+        preferences = MagicMock()
+        preferences.get_xmlrpc_port.return_value = 9875
+        preferences.get_socket_port.return_value = 9876
+        return preferences
+
+    @pytest.fixture
+    def page(self, preferences_page, mock_pyside, mock_preferences):
+        """Construct a page with stub widgets and mocked FreeCAD modules."""
+        mock_freecad = MagicMock()
+        with patch.dict(
+            sys.modules,
+            {
+                "PySide": mock_pyside,
+                "preferences": mock_preferences,
+                "FreeCAD": mock_freecad,
+            },
+        ):
+            page = preferences_page.MCPBridgePreferencesPage()
+            page.auto_start_cb.isChecked.return_value = True
+            page.status_bar_cb.isChecked.return_value = False
+            page.xmlrpc_spin.value.return_value = 9875
+            page.socket_spin.value.return_value = 9876
+            page.mock_freecad = mock_freecad
+            yield page
+
+    def test_saves_widget_values(self, page, mock_preferences) -> None:
+        """Each widget value should be written through the setters."""
+        page.saveSettings()
+
+        mock_preferences.set_auto_start.assert_called_once_with(True)
+        mock_preferences.set_status_bar_enabled.assert_called_once_with(False)
+        mock_preferences.set_xmlrpc_port.assert_called_once_with(9875)
+        mock_preferences.set_socket_port.assert_called_once_with(9876)
+        mock_preferences.invalidate_cache.assert_called_once()
+
+    def test_reads_each_spin_box_once(self, page) -> None:
+        """Spin box values should be read once per save."""
+        page.saveSettings()
+
+        page.xmlrpc_spin.value.assert_called_once()
+        page.socket_spin.value.assert_called_once()
+
+    def test_unchanged_ports_do_not_notify(self, page) -> None:
+        """No restart notice should be printed when ports are unchanged."""
+        page.saveSettings()
+
+        page.mock_freecad.Console.PrintMessage.assert_not_called()
+
+    def test_changed_port_notifies(self, page) -> None:
+        """A restart notice should be printed when a port changes."""
+        page.socket_spin.value.return_value = 19876
+
+        page.saveSettings()
+
+        page.mock_freecad.Console.PrintMessage.assert_called_once()
@@ -0,0 +1,65 @@
+"""Tests for the Robust MCP Bridge Qt subpackage's lazy exports."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Get the addon directory path (new-style namespace package format)
+ADDON_DIR = Path(__file__).parent.parent.parent.parent / "freecad" / "RobustMCPBridge"
+
+
+@pytest.fixture
+def qt_package():
+    """Load the Qt package under a private name with its submodules mocked."""
+    preferences_page = MagicMock()
+    status_widget = MagicMock()
+    with patch.dict(
+        sys.modules,
+        {
+            "_mcp_qt.preferences_page": preferences_page,
+            "_mcp_qt.status_widget": status_widget,
+        },
+    ):
+        spec = importlib.util.spec_from_file_location(
+            "_mcp_qt",
+            ADDON_DIR / "Qt" / "__init__.py",
+            submodule_search_locations=[str(ADDON_DIR / "Qt")],
+        )
+        assert spec is not None
+        assert spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["_mcp_qt"] = module
+        spec.loader.exec_module(module)
+        yield module, preferences_page, status_widget
+
+
+class TestLazyExports:
+    """Tests for the PEP 562 module __getattr__."""
+
+    def test_import_does_not_bind_components(self, qt_package) -> None:
+        """Importing the package should not resolve the widget classes."""
+        module, _, _ = qt_package
+
+        assert "MCPStatusWidget" not in vars(module)
+        assert "MCPBridgePreferencesPage" not in vars(module)
+
+    def test_attribute_resolves_and_caches(self, qt_package) -> None:
+        """First access should import the submodule and cache the value."""
+        module, _, status_widget = qt_package
+
+        widget_class = module.MCPStatusWidget
+
+        assert widget_class is status_widget.MCPStatusWidget
+        assert vars(module)["MCPStatusWidget"] is widget_class
+
+    def test_unknown_attribute(self, qt_package) -> None:
+        """Names outside the lazy table should raise AttributeError."""
+        module, _, _ = qt_package
+
+        with pytest.raises(AttributeError):
+            _ = module.NotAWidget
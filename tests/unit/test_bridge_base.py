@@ -1,13 +1,54 @@
 """Tests for bridge base classes."""
 
+import asyncio
+import dataclasses
+import sys
+import time
+from unittest import mock
+
 import pytest
 
 from freecad_mcp.bridge.base import (
+    VIEW_ANGLES_BY_VALUE,
+    VIEW_METHODS,
     DocumentInfo,
     ExecutionResult,
     FreecadBridge,
     ObjectInfo,
+    ShapeInfo,
+    ViewAngle,
+    compile_code,
 )
+from freecad_mcp.bridge.embedded import EmbeddedBridge
+
+
+class TestViewAngle:
+    """Tests for the ViewAngle enum."""
+
+    def test_members_are_plain_strings(self):
+        """ViewAngle members should format as their value."""
+        assert str(ViewAngle.FRONT) == "Front"
+        assert f"{ViewAngle.FIT_ALL}" == "FitAll"
+
+    def test_lookup_by_value(self):
+        """VIEW_ANGLES_BY_VALUE should map every value to its member."""
+        assert {angle.value: angle for angle in ViewAngle} == VIEW_ANGLES_BY_VALUE
+        assert VIEW_ANGLES_BY_VALUE["Isometric"] is ViewAngle.ISOMETRIC
+
+    @pytest.mark.asyncio
+    async def test_set_view_calls_view_method_directly(self):
+        """set_view should send the angle's view method, one per angle."""
+        assert set(VIEW_METHODS) == set(ViewAngle)
+        bridge = EmbeddedBridge()
+        bridge._connected = True
+        bridge.is_gui_available = mock.AsyncMock(return_value=True)
+        bridge._execute_template = mock.AsyncMock()
+
+        await bridge.set_view(ViewAngle.BACK)
+
+        code, params = bridge._execute_template.call_args.args
+        assert params == {"_doc_name": None, "_view_method": "viewRear"}
+        assert "elif" not in code
 
 
 class TestExecutionResult:
@@ -108,6 +149,96 @@ class TestObjectInfo:
         assert obj.shape_info is None
         assert obj.children == []
 
+    def test_names_are_interned(self):
+        """Child and parent names should be stored as interned strings."""
+        name = "".join(["Sketch", "001"])
+        obj = ObjectInfo("Pad", "Pad", "PartDesign::Pad", children=[name])
+
+        assert obj.children == ["Sketch001"]
+        assert obj.children[0] is sys.intern("Sketch001")
+        assert obj.parents == []
+
+    def test_from_row(self):
+        """from_row should map a compact listing row onto the fields."""
+        obj = ObjectInfo.from_row(
+            ["Box", "My Box", "Part::Box", ["Child"], ["Parent"], False]
+        )
+
+        assert obj == ObjectInfo(
+            name="Box",
+            label="My Box",
+            type_id="Part::Box",
+            children=["Child"],
+            parents=["Parent"],
+            visibility=False,
+        )
+
+    def test_from_columns(self):
+        """from_columns should zip the parallel field lists into objects."""
+        objects = ObjectInfo.from_columns(
+            {
+                "names": ["Box", "Sketch"],
+                "labels": ["My Box", "Sketch"],
+                "type_ids": ["Part::Box", "Sketcher::SketchObject"],
+                "children": [[], []],
+                "parents": [["Cut"], []],
+                "visibility": [True, False],
+                "shapes": [{"type": "Solid", "volume": 1000.0}, None],
+            }
+        )
+
+        assert [obj.name for obj in objects] == ["Box", "Sketch"]
+        assert objects[0].parents == ["Cut"]
+        assert objects[0].shape_info == {"type": "Solid", "volume": 1000.0}
+        assert objects[1].shape_info is None
+        assert objects[1].visibility is False
+
+
+class TestDataclassLayout:
+    """Tests for the memory layout of the bridge dataclasses."""
+
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            DocumentInfo(name="Doc"),
+            ObjectInfo(name="Obj", label="Obj", type_id="Part::Feature"),
+            ShapeInfo(shape_type="Solid"),
+        ],
+    )
+    def test_instances_have_no_dict(self, instance):
+        """Dataclasses should use __slots__ instead of a per-instance dict."""
+        assert not hasattr(instance, "__dict__")
+
+    def test_shape_info_is_frozen(self):
+        """ShapeInfo should be immutable."""
+        shape = ShapeInfo(shape_type="Solid")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            shape.volume = 1.0  # type: ignore[misc]
+
+
+class TestCompileCode:
+    """Tests for the compiled code cache."""
+
+    def test_repeated_source_reuses_code_object(self):
+        """The same source should compile to the same cached code object."""
+        code = compile_code("_result_ = 1 + 1")
+
+        assert compile_code("_result_ = 1 + 1") is code
+        assert code.co_filename == "<mcp>"
+
+    def test_long_source_is_not_cached(self):
+        """Source over the size limit should be compiled afresh each time."""
+        code = "_result_ = 1\n" * 1000
+
+        assert compile_code(code) is not compile_code(code)
+
+    def test_syntax_error_is_raised(self):
+        """Invalid source should raise SyntaxError on every call."""
+        for _ in range(2):
+            with pytest.raises(SyntaxError):
+                compile_code("def broken(:")
+
 
 class TestFreecadBridgeInterface:
     """Tests for FreecadBridge abstract interface."""
@@ -125,3 +256,320 @@ class TestFreecadBridgeInterface:
 
         with pytest.raises(TypeError):
             IncompleteBridge()  # type: ignore[abstract]
+
+    def test_subclass_methods_are_not_rewrapped(self):
+        """Only methods decorated in the subclass itself get cache behavior."""
+
+        class PlainBridge(EmbeddedBridge):
+            async def get_objects(self, doc_name=None):
+                return []
+
+        assert PlainBridge.get_objects is vars(PlainBridge)["get_objects"]
+        assert hasattr(EmbeddedBridge.get_objects, "__wrapped__")
+
+
+class TestBridgeBatch:
+    """Tests for FreecadBridge.batch()."""
+
+    @pytest.fixture
+    def bridge(self):
+        """Create a connected embedded bridge with a mocked FreeCAD module."""
+        mock_fc = mock.MagicMock()
+        mock_fc.listDocuments.return_value = {}
+        mock_fc.ActiveDocument = None
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_fc
+        bridge._connected = True
+        return bridge
+
+    @pytest.mark.asyncio
+    async def test_calls_share_one_execution(self, bridge):
+        """Queued calls should reach FreeCAD through one execute_python_many."""
+        with mock.patch.object(
+            bridge, "execute_python_many", wraps=bridge.execute_python_many
+        ) as many:
+            async with bridge.batch() as batch:
+                first = batch.execute_python("_result_ = 1")
+                second = batch.execute_python("_result_ = 2")
+                documents = batch.get_documents()
+                assert not first.done()
+
+        many.assert_awaited_once()
+        assert len(many.await_args.args[0]) == 3
+        assert first.result().result == 1
+        assert second.result().result == 2
+        assert documents.result() == []
+
+    @pytest.mark.asyncio
+    async def test_get_screenshots_share_one_execution(self, bridge):
+        """get_screenshots should send every angle's capture in one request."""
+        bridge._instance_info = (
+            time.monotonic() + 60,
+            {"version": "1.0.0", "gui_available": True},
+        )
+        with mock.patch.object(
+            bridge, "execute_python_many", wraps=bridge.execute_python_many
+        ) as many:
+            screenshots = await bridge.get_screenshots([ViewAngle.FRONT, ViewAngle.TOP])
+
+        many.assert_awaited_once()
+        codes = many.await_args.args[0]
+        assert "_view_method = 'viewFront'" in codes[0]
+        assert "_view_method = 'viewTop'" in codes[1]
+        assert [s.view_angle for s in screenshots] == [ViewAngle.FRONT, ViewAngle.TOP]
+
+    @pytest.mark.asyncio
+    async def test_exception_is_set_on_future(self, bridge):
+        """A failing call should fail its own future only."""
+        async with bridge.batch() as batch:
+            ok = batch.execute_python("_result_ = 1")
+            missing = batch.get_object("Missing")
+
+        assert ok.result().result == 1
+        with pytest.raises(ValueError):
+            missing.result()
+
+    @pytest.mark.asyncio
+    async def test_calls_cancelled_when_block_raises(self, bridge):
+        """Queued calls should not run if the batch block raises."""
+        with pytest.raises(RuntimeError):
+            async with bridge.batch() as batch:
+                pending = batch.execute_python("_result_ = 1")
+                raise RuntimeError
+
+        with pytest.raises(asyncio.CancelledError):
+            pending.result()
+
+    def test_rejects_non_coroutine_attributes(self, bridge):
+        """Only async bridge methods can be queued."""
+        batch = bridge.batch()
+
+        with pytest.raises(AttributeError):
+            _ = batch.batch
+
+    def test_method_table_holds_public_coroutines(self):
+        """Each bridge class should list its public async methods once."""
+        dispatch = EmbeddedBridge._dispatch
+
+        assert dispatch["get_object"] is EmbeddedBridge.get_object
+        assert "batch" not in dispatch
+        assert "_execute_code" not in dispatch
+
+    @pytest.mark.asyncio
+    async def test_calls_outside_batch_are_direct(self, bridge):
+        """execute_python outside a batch should not go through the batcher."""
+        with mock.patch.object(bridge, "execute_python_many") as many:
+            result = await bridge.execute_python("_result_ = 3")
+
+        many.assert_not_called()
+        assert result.result == 3
+
+
+class TestReadCache:
+    """Tests for the get_object()/get_objects() read cache."""
+
+    @pytest.fixture
+    def bridge(self):
+        """Create a connected embedded bridge with one object in its document."""
+        box = mock.MagicMock(Name="Box", Label="Box", TypeId="Part::Box")
+        box.OutList = []
+        box.InList = []
+        box.ViewObject.Visibility = True
+        mock_fc = mock.MagicMock()
+        mock_fc.ActiveDocument.Objects = [box]
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_fc
+        bridge._connected = True
+        return bridge
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_hit_freecad_once(self, bridge):
+        """Identical reads while nothing changes should reuse the first result."""
+        with mock.patch.object(
+            bridge, "_execute_code", wraps=bridge._execute_code
+        ) as execute:
+            first = await bridge.get_objects()
+            second = await bridge.get_objects(None)
+
+        assert execute.call_count == 1
+        assert first == second
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_mutating_call_invalidates(self, bridge):
+        """execute_python should drop cached reads."""
+        with mock.patch.object(
+            bridge, "_execute_code", wraps=bridge._execute_code
+        ) as execute:
+            await bridge.get_objects()
+            await bridge.execute_python("_result_ = 1")
+            await bridge.get_objects()
+
+        assert execute.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_invalidate_read_cache(self, bridge):
+        """invalidate_read_cache should force the next read to FreeCAD."""
+        with mock.patch.object(
+            bridge, "_execute_code", wraps=bridge._execute_code
+        ) as execute:
+            await bridge.get_objects()
+            bridge.invalidate_read_cache()
+            await bridge.get_objects()
+
+        assert execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache(self, bridge):
+        """read_cache_enabled = False should turn caching off."""
+        bridge.read_cache_enabled = False
+        with mock.patch.object(
+            bridge, "_execute_code", wraps=bridge._execute_code
+        ) as execute:
+            await bridge.get_objects()
+            await bridge.get_objects()
+
+        assert execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_freecad_change_invalidates(self, bridge):
+        """A change counted by FreeCAD, e.g. made in its GUI, should be seen."""
+        with mock.patch.object(
+            bridge, "_execute_code", wraps=bridge._execute_code
+        ) as execute:
+            await bridge.get_objects()
+            bridge._changes.slotChangedObject(mock.MagicMock(), "Length")
+            await bridge.get_objects()
+            await bridge.get_objects()
+
+        assert execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_every_observer_slot_counts(self, bridge):
+        """Each document observer slot FreeCAD calls should bump the count."""
+        await bridge.get_objects()
+        counter = bridge._changes
+        bridge._fc_module.addDocumentObserver.assert_called_once_with(counter)
+        slots = [name for name in dir(counter) if name.startswith("slot")]
+
+        for name in slots:
+            getattr(counter, name)(mock.MagicMock(), "Prop")
+
+        assert len(slots) == 12
+        assert await bridge._change_count() == len(slots)
+
+    @pytest.mark.asyncio
+    async def test_no_change_counter_disables_cache(self, bridge):
+        """Without a change counter every read should reach FreeCAD."""
+        with (
+            mock.patch.object(
+                bridge, "_change_count", mock.AsyncMock(return_value=None)
+            ),
+            mock.patch.object(
+                bridge, "_execute_code", wraps=bridge._execute_code
+            ) as execute,
+        ):
+            await bridge.get_objects()
+            await bridge.get_objects()
+
+        assert execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_callers_get_copies(self, bridge):
+        """Changing a returned object should not change the cached one."""
+        first = await bridge.get_objects()
+        first[0].properties["Length"] = 10
+        first[0].label = "Changed"
+
+        second = await bridge.get_objects()
+
+        assert second[0].properties == {}
+        assert second[0].label == "Box"
+
+
+class TestInstanceInfoCache:
+    """Tests for caching get_freecad_version() per connection."""
+
+    @pytest.fixture
+    def bridge(self):
+        """Create a connected embedded bridge for a GUI FreeCAD 1.0.0."""
+        mock_fc = mock.MagicMock()
+        mock_fc.Version.return_value = ["1", "0", "0", "2024/11/18"]
+        mock_fc.GuiUp = True
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_fc
+        bridge._connected = True
+        return bridge
+
+    @pytest.mark.asyncio
+    async def test_version_and_gui_share_one_query(self, bridge):
+        """is_gui_available should answer from the cached version info."""
+        with mock.patch.object(
+            bridge, "_execute_code", wraps=bridge._execute_code
+        ) as execute:
+            first = await bridge.get_freecad_version()
+            second = await bridge.get_freecad_version()
+            gui = await bridge.is_gui_available()
+
+        assert execute.call_count == 1
+        assert first == second
+        assert first["version"] == "1.0.0"
+        assert gui is True
+        bridge._fc_module.Version.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_status_takes_one_query(self, bridge):
+        """get_status should need a single execution, cold or cached."""
+        with mock.patch.object(
+            bridge, "_execute_code", wraps=bridge._execute_code
+        ) as execute:
+            cold = await bridge.get_status()
+            assert execute.call_count == 1
+            warm = await bridge.get_status()
+            assert execute.call_count == 2
+
+        for status in (cold, warm):
+            assert status.connected is True
+            assert status.freecad_version == "1.0.0"
+            assert status.gui_available is True
+            assert status.last_ping_ms is not None
+
+    @pytest.mark.asyncio
+    async def test_status_reports_failed_query(self, bridge):
+        """A version query that fails should report the bridge unreachable."""
+        bridge._fc_module.Version.side_effect = RuntimeError("not ready")
+
+        status = await bridge.get_status()
+
+        assert status.connected is False
+        assert status.error == "Ping failed"
+
+    @pytest.mark.asyncio
+    async def test_embedded_info_does_not_expire(self, bridge):
+        """The embedded bridge should keep its version info until disconnect."""
+        await bridge.get_freecad_version()
+
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 1e9):
+            assert bridge._cached_instance_info() is not None
+            assert await bridge.is_gui_available() is True
+
+        bridge._fc_module.Version.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_failed_query_is_not_cached(self, bridge):
+        """The fallback answer for a failed query should not be reused."""
+        bridge._fc_module.Version.side_effect = RuntimeError("not ready")
+        assert (await bridge.get_freecad_version())["version"] == "unknown"
+
+        bridge._fc_module.Version.side_effect = None
+        assert (await bridge.get_freecad_version())["version"] == "1.0.0"
+
+    @pytest.mark.asyncio
+    async def test_disconnect_drops_cached_info(self, bridge):
+        """disconnect() should forget the cached version info."""
+        await bridge.get_freecad_version()
+        assert bridge._cached_instance_info() is not None
+
+        await bridge.disconnect()
+
+        assert bridge._cached_instance_info() is None
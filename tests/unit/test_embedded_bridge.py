@@ -1,9 +1,13 @@
 """Tests for embedded bridge implementation."""
 
+import asyncio
+import sys
+from pathlib import Path
 from unittest import mock
 
 import pytest
 
+from freecad_mcp.bridge import embedded
 from freecad_mcp.bridge.embedded import EmbeddedBridge
 
 
@@ -89,6 +93,84 @@ class TestEmbeddedBridgeCodeExecution:
         assert result.success is True
         assert "hello" in result.stdout
 
+    @pytest.mark.asyncio
+    async def test_internal_snippets_skip_capture(self, mock_freecad):
+        """Bridge snippets should print to stderr; user code is captured."""
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_freecad
+        bridge._connected = True
+
+        with mock.patch(
+            "freecad_mcp.bridge.embedded.redirect_stdout",
+            wraps=embedded.redirect_stdout,
+        ) as redirect:
+            await bridge.ping()
+            assert redirect.call_args.args == (sys.stderr,)
+
+            result = await bridge.execute_python("print('a', 'b')")
+            assert redirect.call_args.args != (sys.stderr,)
+
+        assert result.stdout == "a b\n"
+
+    @pytest.mark.asyncio
+    async def test_object_reads_capture_output(self, mock_freecad, capsys):
+        """Prints from property getters must not reach the stdio transport."""
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_freecad
+        bridge._connected = True
+        doc = mock.MagicMock(Name="Doc")
+
+        def objects():
+            print("getter output")
+            return []
+
+        type(doc).Objects = mock.PropertyMock(side_effect=objects)
+        mock_freecad.ActiveDocument = doc
+
+        await bridge.get_objects()
+
+        assert "getter output" not in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_document_changes_capture_output(
+        self, mock_freecad, tmp_path, capsys
+    ):
+        """Output of hooks run by opening a document must not reach stdout."""
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_freecad
+        bridge._connected = True
+        path = tmp_path / "part.FCStd"
+        path.touch()
+
+        def open_document(_path):
+            print("onDocumentRestored")
+            doc = mock.MagicMock(Name="part", Label="part", FileName=str(path))
+            doc.Objects = []
+            doc.Modified = False
+            return doc
+
+        mock_freecad.openDocument.side_effect = open_document
+
+        doc = await bridge.open_document(str(path))
+
+        assert doc.name == "part"
+        assert "onDocumentRestored" not in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_gui_import_is_tried_once(self, mock_freecad):
+        """FreeCADGui should be looked up once, with globals fresh per call."""
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_freecad
+        bridge._connected = True
+        gui = mock.MagicMock()
+
+        with mock.patch.dict("sys.modules", {"FreeCADGui": gui}):
+            first = await bridge.execute_python("leaked = True\n_result_ = Gui")
+        second = await bridge.execute_python("_result_ = (Gui, 'leaked' in dir())")
+
+        assert first.result is gui
+        assert second.result == (gui, False)
+
     @pytest.mark.asyncio
     async def test_execute_code_with_error(self, mock_freecad):
         """execute_python should capture exceptions."""
@@ -103,6 +185,17 @@ class TestEmbeddedBridgeCodeExecution:
         assert result.error_traceback is not None
         assert "test error" in result.error_traceback
 
+    def test_traceback_formatting_can_be_skipped(self, mock_freecad):
+        """Callers that only check success should get no traceback built."""
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_freecad
+
+        result = bridge._execute_code("raise ValueError('bad')", format_tb=False)
+
+        assert result.success is False
+        assert result.error_type == "ValueError"
+        assert result.error_traceback is None
+
     @pytest.mark.asyncio
     async def test_execute_code_with_syntax_error(self, mock_freecad):
         """execute_python should handle syntax errors."""
@@ -115,6 +208,22 @@ class TestEmbeddedBridgeCodeExecution:
         assert result.success is False
         assert result.error_type == "SyntaxError"
 
+    @pytest.mark.asyncio
+    async def test_execute_python_many(self, mock_freecad):
+        """execute_python_many should return one result per snippet, in order."""
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_freecad
+        bridge._connected = True
+
+        results = await bridge.execute_python_many(
+            ["_result_ = 1", "raise ValueError('bad')", "_result_ = 3"]
+        )
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[0].result == 1
+        assert results[1].error_type == "ValueError"
+        assert results[2].result == 3
+
 
 class TestEmbeddedBridgeDocuments:
     """Tests for document handling in embedded bridge."""
@@ -151,3 +260,458 @@ class TestEmbeddedBridgeDocuments:
 
         # Since we're not mocking exec properly, we expect empty
         assert isinstance(result, list)
+
+    @pytest.mark.asyncio
+    async def test_documents_and_active_document(self, mock_freecad_with_doc):
+        """Both document queries should serialize documents the same way."""
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_freecad_with_doc
+        bridge._connected = True
+
+        documents = await bridge.get_documents()
+        active = await bridge.get_active_document()
+
+        assert [doc.name for doc in documents] == ["TestDoc"]
+        assert active == documents[0]
+        assert active.path == "/tmp/test.FCStd"
+
+        mock_freecad_with_doc.ActiveDocument = None
+        assert await bridge.get_active_document() is None
+
+    @pytest.mark.asyncio
+    async def test_get_objects(self, mock_freecad_with_doc):
+        """get_objects should build ObjectInfo from the listing rows."""
+        box = mock.MagicMock(Name="Box", Label="Box", TypeId="Part::Box")
+        box.OutList = []
+        box.InList = []
+        box.ViewObject.Visibility = False
+        mock_freecad_with_doc.ActiveDocument.Objects = [box]
+
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_freecad_with_doc
+        bridge._connected = True
+
+        objects = await bridge.get_objects()
+
+        assert len(objects) == 1
+        assert objects[0].name == "Box"
+        assert objects[0].type_id == "Part::Box"
+        assert objects[0].visibility is False
+        assert objects[0].properties == {}
+
+    @pytest.mark.asyncio
+    async def test_get_object_property_values(self, mock_freecad_with_doc):
+        """Builtin property values should pass through, others become str."""
+
+        class Vector:
+            def __str__(self):
+                return "Vector (1.0, 2.0, 3.0)"
+
+        box = mock.MagicMock(
+            spec=["Name", "Label", "TypeId", "PropertiesList", "OutList"],
+            Name="Box",
+            Label="Box",
+            TypeId="Part::Box",
+            PropertiesList=["Length", "Label2", "Tags", "Position", "Offset"],
+            OutList=[],
+        )
+        box.Length = 10.0
+        box.Label2 = ""
+        box.Tags = ["a"]
+        box.Position = Vector()
+        box.Offset = Vector()
+        mock_freecad_with_doc.getDocument.return_value.getObject.return_value = box
+
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_freecad_with_doc
+        bridge._connected = True
+
+        obj = await bridge.get_object("Box", "TestDoc")
+
+        assert obj.properties == {
+            "Length": 10.0,
+            "Label2": "",
+            "Tags": ["a"],
+            "Position": "Vector (1.0, 2.0, 3.0)",
+            "Offset": "Vector (1.0, 2.0, 3.0)",
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_object_links_and_shape(self, mock_freecad_with_doc):
+        """get_object should report parents, visibility and the shape summary."""
+        shape = mock.MagicMock(
+            ShapeType="Solid", Volume=1000.0, Area=600.0, Vertexes=[1] * 8
+        )
+        shape.isValid.return_value = True
+        shape.isClosed.return_value = True
+        shape.Edges = [1] * 12
+        shape.Faces = [1] * 6
+        box = mock.MagicMock(Name="Box", Label="Box", TypeId="Part::Box", Shape=shape)
+        box.PropertiesList = []
+        box.OutList = []
+        box.InList = [mock.MagicMock(Name="Body")]
+        box.ViewObject.Visibility = False
+        mock_freecad_with_doc.getDocument.return_value.getObject.return_value = box
+
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_freecad_with_doc
+        bridge._connected = True
+
+        obj = await bridge.get_object("Box", "TestDoc")
+
+        assert obj.parents == ["Body"]
+        assert obj.visibility is False
+        assert obj.shape_info == {
+            "shape_type": "Solid",
+            "volume": 1000.0,
+            "area": 600.0,
+            "is_valid": True,
+            "is_closed": True,
+            "vertex_count": 8,
+            "edge_count": 12,
+            "face_count": 6,
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_objects_same_type_without_view(self, mock_freecad_with_doc):
+        """Objects sharing a TypeId should still be read one by one."""
+        first = mock.MagicMock(Name="Box", Label="Box", TypeId="Part::Box")
+        first.OutList = []
+        first.InList = []
+        first.ViewObject = None
+        second = mock.MagicMock(Name="Box001", Label="Box001", TypeId="Part::Box")
+        second.OutList = [first]
+        second.InList = []
+        second.ViewObject.Visibility = False
+        mock_freecad_with_doc.ActiveDocument.Objects = [first, second]
+
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_freecad_with_doc
+        bridge._connected = True
+
+        objects = await bridge.get_objects()
+
+        assert [obj.visibility for obj in objects] == [True, False]
+        assert objects[1].children == ["Box"]
+
+    @pytest.mark.asyncio
+    async def test_get_objects_bulk_with_shapes(self, mock_freecad_with_doc):
+        """get_objects_bulk should return every object's shape in one execution."""
+        box = mock.MagicMock(Name="Box", Label="Box", TypeId="Part::Box")
+        box.OutList = []
+        box.InList = []
+        box.Shape.ShapeType = "Solid"
+        box.Shape.Volume = 1000.0
+        box.Shape.Area = 600.0
+        box.Shape.isValid.return_value = True
+        group = mock.MagicMock(
+            spec=["Name", "Label", "TypeId", "OutList", "InList", "ViewObject"],
+            Name="Group",
+            Label="Group",
+            TypeId="App::DocumentObjectGroup",
+            OutList=[box],
+            InList=[],
+        )
+        mock_freecad_with_doc.ActiveDocument.Objects = [box, group]
+
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_freecad_with_doc
+        bridge._connected = True
+
+        with mock.patch.object(
+            bridge, "_execute_code", wraps=bridge._execute_code
+        ) as execute:
+            objects = await bridge.get_objects_bulk(include_shape=True)
+
+        assert execute.call_count == 1
+        assert [obj.name for obj in objects] == ["Box", "Group"]
+        assert objects[0].shape_info == {
+            "type": "Solid",
+            "volume": 1000.0,
+            "area": 600.0,
+            "is_valid": True,
+        }
+        assert objects[1].shape_info is None
+        assert objects[1].children == ["Box"]
+
+    @pytest.mark.asyncio
+    async def test_get_objects_bulk_by_name(self, mock_freecad_with_doc):
+        """get_objects_bulk should get only the named objects that exist."""
+        objects = {
+            name: mock.MagicMock(Name=name, Label=name, TypeId="Part::Box")
+            for name in ("Box", "Box001")
+        }
+        for obj in objects.values():
+            obj.OutList = []
+            obj.InList = []
+            obj.ViewObject.Visibility = True
+        mock_freecad_with_doc.ActiveDocument.getObject.side_effect = objects.get
+
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_freecad_with_doc
+        bridge._connected = True
+
+        found = await bridge.get_objects_bulk(names=["Box001", "Missing", "Box"])
+        again = await bridge.get_objects_bulk(names=["Box001", "Missing", "Box"])
+
+        assert [obj.name for obj in found] == ["Box001", "Box"]
+        assert again == found
+
+    @pytest.mark.asyncio
+    async def test_delete_object_passes_names_as_globals(self, mock_freecad_with_doc):
+        """Arguments should reach the template as globals, not as source."""
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock_freecad_with_doc
+        bridge._connected = True
+        name = "Box'; raise SystemExit #"
+
+        with mock.patch.object(
+            bridge, "_execute_code", wraps=bridge._execute_code
+        ) as execute:
+            await bridge.delete_object(name, "TestDoc")
+            await bridge.delete_object("Other", "TestDoc")
+
+        first, second = execute.call_args_list
+        assert first.args[0] is second.args[0]
+        assert name not in first.args[0]
+        assert first.args[1] == {"_doc_name": "TestDoc", "_obj_name": name}
+        mock_freecad_with_doc.getDocument.return_value.removeObject.assert_any_call(
+            name
+        )
+
+
+class TestEmbeddedBridgeMacros:
+    """Tests for macro listing in embedded bridge."""
+
+    @pytest.mark.asyncio
+    async def test_get_macros_reads_descriptions(self, tmp_path):
+        """get_macros should list .FCMacro files with their first comment."""
+        (tmp_path / "Box.FCMacro").write_text(
+            "#!/usr/bin/env python\n# Make a box\nimport FreeCAD\n"
+        )
+        (tmp_path / "Long.FCMacro").write_text("import FreeCAD\n" * 1000 + "# Late\n")
+        (tmp_path / "notes.txt").write_text("# Not a macro\n")
+        (tmp_path / "Dir.FCMacro").mkdir()
+
+        bridge = EmbeddedBridge()
+        bridge._macro_path = tmp_path
+        macros = await bridge.get_macros()
+
+        by_name = {m.name: m for m in macros}
+        assert set(by_name) == {"Box", "Long"}
+        assert by_name["Box"].description == "Make a box"
+        assert by_name["Box"].path == str(tmp_path / "Box.FCMacro")
+        assert by_name["Long"].description == ""
+
+    @pytest.mark.asyncio
+    async def test_get_macros_missing_directory(self, tmp_path):
+        """get_macros should return an empty list without a macro directory."""
+        bridge = EmbeddedBridge()
+        bridge._macro_path = tmp_path / "missing"
+
+        assert await bridge.get_macros() == []
+
+    @pytest.mark.asyncio
+    async def test_create_then_run_macro(self, tmp_path):
+        """A created macro should be written to disk and runnable by name."""
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock.MagicMock()
+        bridge._connected = True
+        bridge._macro_path = tmp_path / "Macro"
+
+        info = await bridge.create_macro("Answer", "_result_ = 42", "The answer")
+        with mock.patch.dict(
+            "sys.modules",
+            {"FreeCAD": bridge._fc_module, "FreeCADGui": mock.MagicMock()},
+        ):
+            result = await bridge.run_macro("Answer")
+
+        assert info.path == str(tmp_path / "Macro" / "Answer.FCMacro")
+        assert result.success is True
+        assert result.result == 42
+
+    @pytest.mark.asyncio
+    async def test_run_missing_macro(self, tmp_path):
+        """Running a macro that does not exist should report it as not found."""
+        bridge = EmbeddedBridge()
+        bridge._macro_path = tmp_path
+
+        result = await bridge.run_macro("Missing")
+
+        assert result.success is False
+        assert result.error_type == "FileNotFoundError"
+
+    def test_macro_path_is_computed_once(self):
+        """The macro directory should be worked out once per bridge."""
+        bridge = EmbeddedBridge()
+
+        with mock.patch("pathlib.Path.home", return_value=Path("/home/u")) as home:
+            first = bridge._macro_path
+            second = bridge._macro_path
+
+        assert first is second
+        assert home.call_count <= 1
+
+
+class TestEmbeddedBridgeWorkbenches:
+    """Tests for workbench handling in embedded bridge."""
+
+    @pytest.fixture
+    def bridge(self):
+        """Create a connected bridge whose GUI has Part and Sketcher loaded."""
+
+        class PartWorkbench:
+            MenuText = "Part"
+            Icon = "part.svg"
+
+        class SketcherWorkbench:
+            MenuText = "Sketcher"
+
+        workbenches = {
+            "PartWorkbench": PartWorkbench(),
+            "SketcherWorkbench": SketcherWorkbench(),
+        }
+        state = {"active": workbenches["PartWorkbench"]}
+
+        def activate(name):
+            if name not in workbenches:
+                raise KeyError(name)
+            state["active"] = workbenches[name]
+
+        gui = mock.MagicMock()
+        gui.listWorkbenches.return_value = workbenches
+        gui.getWorkbench.side_effect = workbenches.__getitem__
+        gui.activeWorkbench.side_effect = lambda: state["active"]
+        gui.activateWorkbench.side_effect = activate
+
+        bridge = EmbeddedBridge()
+        bridge._fc_module = mock.MagicMock(GuiUp=True)
+        bridge._connected = True
+        with mock.patch.dict("sys.modules", {"FreeCADGui": gui}):
+            yield bridge
+
+    @pytest.mark.asyncio
+    async def test_get_workbenches(self, bridge):
+        """get_workbenches should report each workbench and the active one."""
+        workbenches = await bridge.get_workbenches()
+
+        assert [(wb.name, wb.label, wb.icon, wb.is_active) for wb in workbenches] == [
+            ("PartWorkbench", "Part", "part.svg", True),
+            ("SketcherWorkbench", "Sketcher", "", False),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_workbenches_bulk(self, bridge):
+        """Only the named, installed workbenches should come back, in order."""
+        names = ["SketcherWorkbench", "NoSuchWorkbench", "PartWorkbench"]
+
+        fresh = await bridge.get_workbenches_bulk(names)
+        await bridge.get_workbenches()
+        cached = await bridge.get_workbenches_bulk(names)
+
+        assert [wb.name for wb in fresh] == ["SketcherWorkbench", "PartWorkbench"]
+        assert fresh == cached
+        assert fresh[1].is_active is True
+
+    @pytest.mark.asyncio
+    async def test_activate_and_list_in_one_execution(self, bridge):
+        """Activating should list the workbenches in the same execution."""
+        with mock.patch.object(
+            bridge, "_execute_code", wraps=bridge._execute_code
+        ) as execute:
+            answer = await bridge._list_and_maybe_activate("SketcherWorkbench")
+
+        assert execute.call_count == 1
+        assert answer["activated"] is True
+        assert [row[3] for row in answer["workbenches"]] == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_workbench_list_is_cached(self, bridge):
+        """Later calls should only ask FreeCAD for the active workbench."""
+        gui = bridge._new_exec_globals()["FreeCADGui"]
+        await bridge.get_workbenches()
+        await bridge.activate_workbench("SketcherWorkbench")
+        gui.activateWorkbench("PartWorkbench")
+
+        workbenches = await bridge.get_workbenches()
+
+        assert gui.listWorkbenches.call_count == 2
+        assert [wb.is_active for wb in workbenches] == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_query(self, bridge):
+        """Concurrent get_workbenches calls should wait on a single query."""
+        with mock.patch.object(
+            bridge, "_execute_code", wraps=bridge._execute_code
+        ) as execute:
+            results = await asyncio.gather(
+                *(bridge.get_workbenches() for _ in range(4))
+            )
+            assert execute.call_count == 1
+            await bridge.get_workbenches()
+            assert execute.call_count == 2
+
+        assert all(result == results[0] for result in results)
+        assert results[0][0] is not results[1][0]
+
+    @pytest.mark.asyncio
+    async def test_activating_active_workbench_is_skipped(self, bridge):
+        """Re-activating the workbench last seen active should send nothing."""
+        gui = bridge._new_exec_globals()["FreeCADGui"]
+        await bridge.get_workbenches()
+
+        await bridge.activate_workbench("PartWorkbench")
+        assert gui.activateWorkbench.call_count == 0
+
+        await bridge.execute_python("_result_ = None")
+        await bridge.activate_workbench("PartWorkbench")
+        assert gui.activateWorkbench.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_activate_unknown_workbench(self, bridge):
+        """Activating a workbench that does not exist should raise ValueError."""
+        with pytest.raises(ValueError, match="Failed to activate workbench"):
+            await bridge.activate_workbench("NoSuchWorkbench")
+
+    @pytest.mark.asyncio
+    async def test_failed_activation_is_remembered(self, bridge):
+        """A failed activation should fail again without reaching FreeCAD."""
+        with pytest.raises(ValueError):
+            await bridge.activate_workbench("NoSuchWorkbench")
+
+        with (
+            mock.patch.object(bridge, "_execute_code") as execute,
+            pytest.raises(ValueError, match="Failed to activate workbench"),
+        ):
+            await bridge.activate_workbench("NoSuchWorkbench")
+        execute.assert_not_called()
+
+        await bridge.disconnect()
+        assert bridge._activation_failures is None
+
+    @pytest.mark.asyncio
+    async def test_headless_workbenches(self, bridge):
+        """Without a GUI a fixed list should be returned and nothing activated."""
+        bridge._fc_module.GuiUp = False
+
+        workbenches = await bridge.get_workbenches()
+        await bridge.activate_workbench("PartWorkbench")
+
+        names = [wb.name for wb in workbenches]
+        assert "PartDesignWorkbench" in names
+        assert names[-1] == "SpreadsheetWorkbench"
+        assert not any(wb.is_active for wb in workbenches)
+
+    @pytest.mark.asyncio
+    async def test_known_headless_skips_queries(self, bridge):
+        """Once FreeCAD is known to be headless, nothing should be executed."""
+        bridge._fc_module.GuiUp = False
+        bridge._fc_module.Version.return_value = ["1", "0", "0"]
+        assert await bridge.is_gui_available() is False
+
+        with mock.patch.object(bridge, "_execute_code") as execute:
+            workbenches = await bridge.get_workbenches()
+            await bridge.activate_workbench("PartWorkbench")
+
+        execute.assert_not_called()
+        assert workbenches[0].name == "StartWorkbench"
@@ -537,3 +537,39 @@ class TestStdioProtocolCleanliness:
                 proc.wait(timeout=2)
             except subprocess.TimeoutExpired:
                 proc.kill()
+
+
+class TestPackageLazyMcp:
+    """Tests for the lazily imported ``freecad_mcp.mcp`` attribute."""
+
+    def test_version_import_does_not_load_server(self):
+        """Importing the package for __version__ should not import the server."""
+        import subprocess
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, freecad_mcp; freecad_mcp.__version__; "
+                "print('freecad_mcp.server' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=30,
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_mcp_attribute_is_server_instance(self):
+        """freecad_mcp.mcp should resolve to the server's FastMCP instance."""
+        import freecad_mcp
+        from freecad_mcp.server import mcp
+
+        assert freecad_mcp.mcp is mcp
+
+    def test_unknown_attribute_raises(self):
+        """Other missing attributes should still raise AttributeError."""
+        import freecad_mcp
+
+        with pytest.raises(AttributeError):
+            _ = freecad_mcp.not_an_attribute
@@ -2,11 +2,13 @@
 
 import asyncio
 import json
+import math
 from unittest import mock
 
 import pytest
 
-from freecad_mcp.bridge.socket import SocketBridge
+from freecad_mcp.bridge.base import GET_OBJECT_CODE
+from freecad_mcp.bridge.socket import STREAM_LIMIT, SocketBridge
 
 
 class TestSocketBridge:
@@ -43,6 +45,23 @@ class TestSocketBridge:
         with pytest.raises(ConnectionError):
             await bridge.connect()
 
+    @pytest.mark.asyncio
+    async def test_connect_raises_stream_limit(self):
+        """connect should size the reader for large responses like screenshots."""
+        bridge = SocketBridge()
+        streams = (mock.AsyncMock(), mock.MagicMock())
+
+        with (
+            mock.patch(
+                "asyncio.open_connection", mock.AsyncMock(return_value=streams)
+            ) as open_connection,
+            mock.patch.object(bridge, "ping", mock.AsyncMock()),
+        ):
+            await bridge.connect()
+
+        assert open_connection.call_args.kwargs["limit"] == STREAM_LIMIT
+        assert STREAM_LIMIT > 2**16
+
     @pytest.mark.asyncio
     async def test_disconnect_when_not_connected(self):
         """disconnect should handle not being connected."""
@@ -62,38 +81,354 @@ class TestSocketBridge:
         assert result.error_type == "ConnectionError"
 
 
+def reply_to(request, result):
+    """Build the JSON-RPC response line answering request with result."""
+    response = {"jsonrpc": "2.0", "id": request["id"], "result": result}
+    return json.dumps(response).encode() + b"\n"
+
+
+class FakeServer:
+    """Socket streams for a bridge, answering each request via respond().
+
+    respond() gets every decoded request and returns the response line to
+    send back, or None to leave it unanswered for now. writes holds what
+    each write to the connection carried.
+    """
+
+    def __init__(self):
+        self.reader = asyncio.StreamReader()
+        self.writer = mock.MagicMock(spec=asyncio.StreamWriter)
+        self.writer.drain = mock.AsyncMock()
+        self.writer.wait_closed = mock.AsyncMock()
+        self.writer.writelines.side_effect = self._receive
+        self.writes: list[bytes] = []
+        self.respond = self.answer_pings
+
+    @staticmethod
+    def answer_pings(request):
+        """Answer pings and leave everything else unanswered."""
+        if isinstance(request, dict) and request["method"] == "ping":
+            return reply_to(request, {"pong": True})
+        return None
+
+    def _receive(self, data):
+        self.writes.append(b"".join(data))
+        for message in self.writes[-1].splitlines():
+            line = self.respond(json.loads(message))
+            if line is not None:
+                self.reader.feed_data(line)
+
+
 class TestSocketBridgeCommunication:
     """Tests for socket communication."""
 
     @pytest.fixture
-    def mock_streams(self):
-        """Create mock reader and writer streams."""
-        reader = mock.AsyncMock(spec=asyncio.StreamReader)
-        writer = mock.MagicMock(spec=asyncio.StreamWriter)
-        writer.is_closing.return_value = False
-        writer.drain = mock.AsyncMock()
-        writer.close = mock.MagicMock()
-        writer.wait_closed = mock.AsyncMock()
-        return reader, writer
-
-    @pytest.mark.asyncio
-    async def test_send_request_format(self, mock_streams):
-        """Requests should be formatted correctly when connected."""
-        reader, writer = mock_streams
-        bridge = SocketBridge()
-        bridge._reader = reader
-        bridge._writer = writer
-        bridge._connected = True
+    async def connected(self):
+        """Connect a bridge to a FakeServer."""
+        server = FakeServer()
+        bridge = SocketBridge(timeout=1.0)
+        with mock.patch(
+            "asyncio.open_connection",
+            mock.AsyncMock(return_value=(server.reader, server.writer)),
+        ):
+            await bridge.connect()
+        yield bridge, server
+        await bridge.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_execute_python_many_sends_one_batch(self, connected):
+        """execute_python_many should send a JSON-RPC array in one message."""
+        bridge, server = connected
+
+        def respond(requests):
+            # Answer in reverse order to check responses are matched by id
+            responses = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": request["id"],
+                    "result": {"success": True, "result": request["params"]["code"]},
+                }
+                for request in reversed(requests)
+            ]
+            return json.dumps(responses).encode() + b"\n"
+
+        server.respond = respond
+        server.writes.clear()
+
+        results = await bridge.execute_python_many(["a", "b"])
+
+        assert len(server.writes) == 1
+        assert [r.result for r in results] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_requests_are_compact_json_lines(self, connected):
+        """Requests should be newline-terminated JSON without separator padding."""
+        bridge, server = connected
+        server.respond = lambda request: reply_to(request, 7)
+
+        assert await bridge._send_request("execute", {"code": "x=1"}) == 7
+
+        body, newline = server.writer.writelines.call_args.args[0]
+        sent = body + newline
+        assert newline == b"\n"
+        assert b"\n" not in body
+        assert b", " not in sent
+        assert b": " not in sent
+        assert json.loads(sent)["params"] == {"code": "x=1"}
+
+    @pytest.mark.asyncio
+    async def test_responses_with_non_finite_numbers(self, connected):
+        """NaN and Infinity written by the plugin's json module should decode."""
+        bridge, server = connected
+        server.respond = lambda request: (
+            b'{"jsonrpc":"2.0","id":"%s","result":[NaN,Infinity,18446744073709551616]}\n'
+            % request["id"].encode()
+        )
+
+        nan, inf, big = await bridge._send_request("execute", {"code": "x=1"})
+
+        assert math.isnan(nan)
+        assert inf == float("inf")
+        assert big == 2**64
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_pipelined(self, connected):
+        """Requests should all be sent before any response arrives."""
+        bridge, server = connected
+        requests = []
+        server.respond = requests.append
+        server.writes.clear()
+
+        calls = asyncio.gather(
+            *(bridge._send_request("execute", {"code": str(i)}) for i in range(3))
+        )
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert len(requests) == 3
+        # Made in the same loop iteration, so written together
+        assert len(server.writes) == 1
+        # Answer out of order; each caller must still get its own result
+        for request in reversed(requests):
+            server.reader.feed_data(reply_to(request, request["params"]["code"]))
+
+        assert await calls == ["0", "1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_late_response_is_dropped(self, connected):
+        """A response to a timed-out request should not answer the next one."""
+        bridge, server = connected
+        bridge._timeout = 0.05
+        requests = []
+        server.respond = requests.append
+
+        with pytest.raises(ConnectionError, match="timed out"):
+            await bridge._send_request("execute", {"code": "slow"})
+
+        server.respond = lambda request: reply_to(request, "fast")
+        server.reader.feed_data(reply_to(requests[0], "slow"))
+
+        assert await bridge._send_request("execute", {"code": "fast"}) == "fast"
+
+    @pytest.mark.asyncio
+    async def test_error_without_id_fails_connection(self, connected):
+        """An error the server could not tie to a request should fail them all."""
+        bridge, server = connected
+        server.respond = [].append
+        calls = asyncio.gather(
+            *(bridge._send_request("execute", {"code": str(i)}) for i in range(2)),
+            return_exceptions=True,
+        )
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        error = {"code": -32700, "message": "Parse error"}
+        response = {"jsonrpc": "2.0", "id": None, "error": error}
+        server.reader.feed_data(json.dumps(response).encode() + b"\n")
+
+        results = await calls
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert bridge._connected is False
+
+    @pytest.mark.asyncio
+    async def test_drains_after_writing(self, connected):
+        """drain() should run after the queued write, not before it."""
+        bridge, server = connected
+        server.respond = lambda request: reply_to(request, 1)
+        server.writer.attach_mock(server.writer.drain, "drain")
+        server.writer.mock_calls.clear()
+
+        await bridge._send_request("execute", {"code": "x"})
+
+        names = [name for name, *_ in server.writer.mock_calls]
+        assert names[:2] == ["writelines", "drain"]
+
+    @pytest.mark.asyncio
+    async def test_execute_is_not_cut_off_by_bridge_timeout(self, connected):
+        """A queued execute should wait past the bridge timeout for its answer."""
+        bridge, server = connected
+        bridge._timeout = 0.01
+        requests = []
+        server.respond = requests.append
+
+        call = asyncio.ensure_future(bridge.execute_python("x = 1", timeout_ms=500))
+        await asyncio.sleep(0.05)
+        assert not call.done()
+        assert requests[0]["params"] == {"code": "x = 1", "timeout_ms": 500}
 
-        # Setup response
-        response = {"jsonrpc": "2.0", "id": "test-1", "result": {"success": True}}
-        reader.readline.return_value = json.dumps(response).encode() + b"\n"
+        server.reader.feed_data(reply_to(requests[0], {"success": True}))
+        assert (await call).success is True
 
-        # Our bridge sends and receives in one call
-        # Just verify we can set up the bridge state correctly
-        assert bridge._reader is not None
-        assert bridge._writer is not None
-        assert bridge._connected is True
+    @pytest.mark.asyncio
+    async def test_execute_gives_up_on_silent_server(self, connected):
+        """An execute the plugin never answers should end in a TimeoutError."""
+        bridge, server = connected
+        bridge._timeout = 0.01
+        server.respond = [].append
+
+        with mock.patch("freecad_mcp.bridge.socket.PLUGIN_QUEUE_WAIT_S", 0):
+            result = await bridge.execute_python("x = 1", timeout_ms=10)
+            results = await bridge.execute_python_many(["a", "b"], timeout_ms=10)
+
+        assert result.success is False
+        assert result.error_type == "TimeoutError"
+        assert [r.error_type for r in results] == ["TimeoutError", "TimeoutError"]
+        assert bridge._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_execute_many_sends_timeout_per_snippet(self, connected):
+        """Each snippet of a batch should carry its own timeout_ms."""
+        bridge, server = connected
+        bridge._timeout = 0.01
+        batches = []
+
+        def respond(requests):
+            batches.append(requests)
+            responses = [
+                {"jsonrpc": "2.0", "id": r["id"], "result": {"success": True}}
+                for r in requests
+            ]
+            return json.dumps(responses).encode() + b"\n"
+
+        server.respond = respond
+
+        results = await bridge.execute_python_many(["a", "b"], timeout_ms=500)
+
+        assert [r["params"]["timeout_ms"] for r in batches[0]] == [500, 500]
+        assert all(r.success for r in results)
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_server_closed(self, connected):
+        """A request after the server hung up should reconnect first."""
+        bridge, server = connected
+        server.reader.feed_eof()
+        await asyncio.sleep(0)
+        assert bridge._connected is False
+
+        new_server = FakeServer()
+        new_server.respond = lambda request: reply_to(request, request["method"])
+        with mock.patch(
+            "asyncio.open_connection",
+            mock.AsyncMock(return_value=(new_server.reader, new_server.writer)),
+        ):
+            assert await bridge._send_request("execute", {"code": "x"}) == "execute"
+
+    @pytest.mark.asyncio
+    async def test_disconnect_fails_waiting_requests(self, connected):
+        """disconnect() should not leave requests waiting forever."""
+        bridge, _ = connected
+        call = asyncio.ensure_future(bridge._send_request("execute", {"code": "x"}))
+        await asyncio.sleep(0)
+
+        await bridge.disconnect()
+
+        with pytest.raises(ConnectionError, match="Disconnected"):
+            await call
+
+    @pytest.mark.asyncio
+    async def test_get_status_is_one_request(self, connected):
+        """get_status should ask the plugin's status method only."""
+        bridge, server = connected
+        methods = []
+
+        def respond(request):
+            methods.append(request["method"])
+            info = {"version": "1.0.0", "gui_available": True, "timestamp": 0}
+            return reply_to(request, info)
+
+        server.respond = respond
+
+        status = await bridge.get_status()
+
+        assert methods == ["status"]
+        assert status.connected is True
+        assert status.freecad_version == "1.0.0"
+        assert status.gui_available is True
+        assert status.last_ping_ms is not None
+        assert await bridge.is_gui_available() is True
+        assert methods == ["status"]
+
+    @pytest.mark.asyncio
+    async def test_get_status_without_status_method(self, connected):
+        """get_status should fall back when the plugin lacks the status method."""
+        bridge, server = connected
+        methods = []
+
+        def respond(request):
+            methods.append(request["method"])
+            if request["method"] == "status":
+                error = {"code": -32601, "message": "Method not found"}
+                response = {"jsonrpc": "2.0", "id": request["id"], "error": error}
+                return json.dumps(response).encode() + b"\n"
+            info = {"version": "0.21.2", "gui_available": False}
+            return reply_to(request, {"success": True, "result": info})
+
+        server.respond = respond
+
+        status = await bridge.get_status()
+        bridge._instance_info = None
+        await bridge.get_status()
+
+        assert methods == ["status", "execute", "execute"]
+        assert status.connected is True
+        assert status.freecad_version == "0.21.2"
+        assert status.gui_available is False
+
+    @pytest.mark.asyncio
+    async def test_reads_are_not_cached(self, connected):
+        """Every read should be one request, with no change count asked first."""
+        bridge, server = connected
+        methods = []
+
+        def respond(request):
+            methods.append(request["method"])
+            row = ["Box", "Box", "Part::Box", [], [], True]
+            return reply_to(request, {"success": True, "result": [row]})
+
+        server.respond = respond
+
+        first = await bridge.get_objects()
+        second = await bridge.get_objects()
+
+        assert methods == ["execute", "execute"]
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_get_object_sends_shared_template(self, connected):
+        """get_object should send repr'd arguments ahead of the base template."""
+        bridge, server = connected
+        codes = []
+
+        def respond(request):
+            codes.append(request["params"]["code"])
+            info = {"name": "Bo'x", "label": "Box", "type_id": "Part::Box"}
+            return reply_to(request, {"success": True, "result": info})
+
+        server.respond = respond
+
+        obj = await bridge.get_object("Bo'x", "Doc")
+
+        assert codes == ["_doc_name = 'Doc'\n_obj_name = \"Bo'x\"\n" + GET_OBJECT_CODE]
+        assert obj.name == "Bo'x"
 
 
 class TestSocketBridgeDocuments:
@@ -128,6 +463,26 @@ class TestSocketBridgeDocuments:
         assert result is False
 
 
+class TestSocketBridgeWorkbenches:
+    """Tests for workbench listings via socket."""
+
+    def test_headless_workbenches(self):
+        """Without a GUI the socket bridge should report its common workbenches."""
+        bridge = SocketBridge()
+
+        workbenches = bridge._workbench_infos(None)
+
+        assert [wb.name for wb in workbenches] == [
+            "StartWorkbench",
+            "PartWorkbench",
+            "PartDesignWorkbench",
+            "DraftWorkbench",
+            "SketcherWorkbench",
+            "MeshWorkbench",
+        ]
+        assert workbenches[0].label == "Start"
+
+
 class TestSocketBridgeVersionInfo:
     """Tests for version info handling."""
 
@@ -0,0 +1,68 @@
+"""Tests for XML-RPC bridge implementation."""
+
+import asyncio
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from freecad_mcp.bridge.xmlrpc import XMLRPC_POOL_SIZE, XmlRpcBridge
+
+
+class TestXmlRpcBridgePool:
+    """Tests for the XmlRpcBridge proxy pool."""
+
+    @pytest.fixture
+    def proxies(self):
+        """Patch ServerProxy so each proxy records the calls in flight on it."""
+        created = []
+        lock = threading.Lock()
+        state = {"in_flight": 0, "peak": 0}
+
+        def execute(code):
+            with lock:
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            time.sleep(0.05)
+            with lock:
+                state["in_flight"] -= 1
+            return {"success": True, "result": code}
+
+        def make_proxy(*_args, **_kwargs):
+            proxy = mock.MagicMock()
+            proxy.execute.side_effect = execute
+            created.append(proxy)
+            return proxy
+
+        with mock.patch("xmlrpc.client.ServerProxy", side_effect=make_proxy):
+            yield created, state
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_use_separate_proxies(self, proxies):
+        """Concurrent calls should overlap, each on a proxy of its own."""
+        created, state = proxies
+        bridge = XmlRpcBridge()
+        await bridge.connect()
+
+        results = await asyncio.gather(
+            *(bridge.execute_python(f"_result_ = {i}") for i in range(8))
+        )
+
+        assert [r.result for r in results] == [f"_result_ = {i}" for i in range(8)]
+        assert len(created) == XMLRPC_POOL_SIZE
+        assert state["peak"] == XMLRPC_POOL_SIZE
+
+    @pytest.mark.asyncio
+    async def test_failed_call_drops_proxy(self, proxies):
+        """A proxy whose call raised should not be reused."""
+        created, _ = proxies
+        bridge = XmlRpcBridge()
+        await bridge.connect()
+        created[0].execute.side_effect = OSError("connection reset")
+
+        result = await bridge.execute_python("_result_ = 1")
+
+        assert result.success is False
+        assert result.error_type == "OSError"
+        assert created[0] not in bridge._idle_proxies